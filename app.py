@@ -18,6 +18,9 @@ from fastapi.templating import Jinja2Templates  # noqa: E402
 
 from marvin_hue.basics import LightSetupsManager  # noqa: E402
 from marvin_hue.controllers import HueController  # noqa: E402
+from marvin_hue.async_controller import AsyncHueController  # noqa: E402
+from marvin_hue.bridge_limiter import build_rest_limiter  # noqa: E402
+from marvin_hue.light_events import LightEventStream  # noqa: E402
 from marvin_hue.audio_mirror import AudioMirror  # noqa: E402
 from marvin_hue.screen_mirror import ScreenMirror  # noqa: E402
 from marvin_hue.chat import create_hue_agent  # noqa: E402
@@ -57,8 +60,37 @@ async def lifespan(app: FastAPI):
     )
 
     # Inicializa componentes principais
-    hue = HueController(ip_address=settings.bridge_ip)
+    rest_limiter = build_rest_limiter(
+        settings.rest_rate_limit,
+        settings.rest_burst,
+        max_in_flight=settings.rest_max_in_flight,
+    )
+    hue = HueController(
+        ip_address=settings.bridge_ip,
+        rest_limiter=rest_limiter,
+        group_actions=settings.rest_group_actions,
+        group_create=settings.rest_group_create,
+        scene_recall=settings.scene_sync,
+        state_ttl=settings.light_state_ttl,
+    )
+    if settings.light_events and hue.state_cache is not None:
+        # A application key v2 é o mesmo "username" do v1
+        hue.light_events = LightEventStream(
+            settings.bridge_ip,
+            settings.hue_app_key or hue.bridge.username,
+            hue.state_cache,
+        )
+        hue.light_events.start()
+    # Rotas async falam com a bridge por um pool HTTP (sem thread por chamada)
+    hue_async = AsyncHueController(hue, timeout=settings.bridge_timeout)
     manager = LightSetupsManager(settings.setups_file)
+    if settings.scene_sync:
+        # Opt-in: presets viram cenas da bridge (só os alterados sobem)
+        try:
+            summary = await asyncio.to_thread(hue.sync_scenes, manager.configs)
+            logger.info(f"Bridge scene sync at startup: {summary}")
+        except Exception as e:
+            logger.warning(f"Bridge scene sync failed at startup: {e}")
     screen_mirror = ScreenMirror(hue, settings.positions_file)
     audio_mirror = AudioMirror(hue, settings.positions_file)
     screen_mirror.entertainment_enabled = settings.entertainment_enabled
@@ -89,6 +121,7 @@ async def lifespan(app: FastAPI):
 
     # Registra dependências
     dependencies.set_hue_controller(hue)
+    dependencies.set_async_hue_controller(hue_async)
     dependencies.set_manager(manager)
     dependencies.set_screen_mirror(screen_mirror)
     dependencies.set_audio_mirror(audio_mirror)
@@ -126,7 +159,7 @@ async def lifespan(app: FastAPI):
         history_service = SceneHistoryService(history_repo)
         schedule_service = ScheduleService(
             schedule_repo,
-            hue=hue,
+            hue=hue_async,
             manager=manager,
             group_service=group_service,
         )
@@ -251,6 +284,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Error stopping entertainment stream on shutdown: {e}")
     dependencies.set_entertainment_client(None)
+    dependencies.set_async_hue_controller(None)
+    await hue_async.aclose()
+    if hue.light_events is not None:
+        hue.light_events.stop()
+    if rest_limiter is not None:
+        rest_limiter.close()
     logger.info("Application shutdown complete")
 
 
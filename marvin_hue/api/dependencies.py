@@ -3,6 +3,7 @@ FastAPI Dependencies
 Dependency injection para compartilhar instâncias globais.
 """
 
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.controllers import HueController
 from marvin_hue.basics import LightSetupsManager
 from marvin_hue.audio_mirror import AudioMirror
@@ -17,6 +18,7 @@ from marvin_hue.services.schedule_service import ScheduleService
 
 # Instâncias globais (inicializadas no lifespan)
 _hue_controller: HueController | None = None
+_async_hue_controller: AsyncHueController | None = None
 _manager: LightSetupsManager | None = None
 _screen_mirror: ScreenMirror | None = None
 _audio_mirror: AudioMirror | None = None
@@ -92,6 +94,12 @@ def set_hue_controller(controller: HueController) -> None:
     _hue_controller = controller
 
 
+def set_async_hue_controller(controller: AsyncHueController | None) -> None:
+    """Define o controlador assíncrono (None = rotas usam o síncrono em thread)."""
+    global _async_hue_controller
+    _async_hue_controller = controller
+
+
 def set_manager(manager: LightSetupsManager) -> None:
     """Define a instância global do gerenciador de setups."""
     global _manager
@@ -147,6 +155,16 @@ def get_hue_controller() -> HueController:
     return _hue_controller
 
 
+def get_async_hue_controller() -> AsyncHueController | None:
+    """Retorna o AsyncHueController (None se não inicializado)."""
+    return _async_hue_controller
+
+
+def get_bridge_controller() -> HueController | AsyncHueController:
+    """Controlador para rotas async: o AsyncHueController quando disponível."""
+    return _async_hue_controller or get_hue_controller()
+
+
 def get_manager() -> LightSetupsManager:
     """Retorna a instância do gerenciador de setups."""
     if _manager is None:
@@ -101,6 +101,18 @@ class MirrorSettingsRequest(BaseModel):
     saturation_boost: float | None = Field(default=None, ge=0, le=3)
     smoothing_factor: float | None = Field(default=None, ge=0, le=1)
     transition_time: float | None = Field(default=None, ge=0, le=10)
+    color_engine: str | None = Field(
+        default=None,
+        pattern=r"^(pil|numpy)$",
+        description="Motor de extração de cor (modo screen): pil | numpy",
+    )
+    pipelined: bool | None = Field(
+        default=None,
+        description=(
+            "Captura/análise/envio em threads separadas (modo screen; "
+            "aplicado no próximo start)"
+        ),
+    )
     energy_gain: float | None = Field(
         default=None, ge=0.1, le=3.0, description="Ganho de energia (modo audio)"
     )
@@ -5,9 +5,11 @@ Endpoints para gerenciar configurações de iluminação.
 
 import asyncio
 from fastapi import APIRouter, HTTPException, Depends
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.controllers import HueController
 from marvin_hue.basics import LightSetupsManager
 from marvin_hue.api.dependencies import (
+    get_bridge_controller,
     get_hue_controller,
     get_manager,
     get_scene_history_service,
@@ -36,10 +38,52 @@ async def get_configurations(manager: LightSetupsManager = Depends(get_manager))
     return get_sorted_configs(manager)
 
 
+@router.post("/configurations/scenes/sync")
+async def sync_configuration_scenes(
+    hue: HueController = Depends(get_hue_controller),
+    manager: LightSetupsManager = Depends(get_manager),
+):
+    """
+    Materializa os presets como cenas nativas da bridge (opt-in ``SCENE_SYNC``).
+
+    Só presets cujo conteúdo mudou são enviados; ``/apply``, agendamentos e o
+    chat passam a recuperar a cena numa única chamada à bridge.
+
+    Raises:
+        HTTPException: 409 se o recall de cenas estiver desabilitado
+    """
+    if manager is None:
+        raise HTTPException(
+            status_code=503, detail="Gerenciador de configurações não disponível"
+        )
+    try:
+        return await asyncio.to_thread(hue.sync_scenes, manager.configs)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.exception(f"Unexpected error syncing bridge scenes: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Erro ao sincronizar cenas: {str(e)}"
+        )
+
+
+@router.post("/configurations/groups/cleanup")
+async def cleanup_bridge_groups(hue: HueController = Depends(get_hue_controller)):
+    """Apaga da bridge os grupos ``marvin-…`` criados pelas group actions."""
+    try:
+        deleted = await asyncio.to_thread(hue.delete_app_groups)
+    except Exception as e:
+        logger.exception(f"Unexpected error deleting bridge groups: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Erro ao remover grupos: {str(e)}"
+        )
+    return {"deleted": deleted}
+
+
 @router.post("/apply")
 async def apply_configuration(
     request: ApplyConfigRequest,
-    hue: HueController = Depends(get_hue_controller),
+    hue: HueController | AsyncHueController = Depends(get_bridge_controller),
     manager: LightSetupsManager = Depends(get_manager),
     history: SceneHistoryService = Depends(get_scene_history_service),
 ):
@@ -87,12 +131,15 @@ async def apply_configuration(
         except Exception as snap_exc:
             logger.warning(f"Scene snapshot before apply failed: {snap_exc}")
 
-        # Aplica em uma task separada para não bloquear
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: hue.apply_light_config(config_obj, request.transition_time_secs),
-        )
+        if isinstance(hue, AsyncHueController):
+            await hue.apply_light_config(config_obj, request.transition_time_secs)
+        else:
+            # Aplica em uma task separada para não bloquear
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None,
+                lambda: hue.apply_light_config(config_obj, request.transition_time_secs),
+            )
 
         return {
             "message": f"Applying configuration {request.config_name}",
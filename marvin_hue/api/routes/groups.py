@@ -10,8 +10,8 @@ from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
 from marvin_hue.api.dependencies import (
+    get_bridge_controller,
     get_group_service,
-    get_hue_controller,
     get_manager,
     get_scene_history_service,
 )
@@ -22,6 +22,7 @@ from marvin_hue.api.models import (
     GroupResponse,
     GroupUpdateRequest,
 )
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.basics import LightSetupsManager
 from marvin_hue.controllers import HueController
 from marvin_hue.domain.groups import (
@@ -145,7 +146,7 @@ async def group_power(
     group_id: str,
     body: GroupPowerRequest,
     svc: GroupService = Depends(get_group_service),
-    hue: HueController = Depends(get_hue_controller),
+    hue: HueController | AsyncHueController = Depends(get_bridge_controller),
     history: SceneHistoryService = Depends(get_scene_history_service),
 ):
     try:
@@ -170,7 +171,7 @@ async def group_apply(
     group_id: str,
     body: GroupApplyRequest,
     svc: GroupService = Depends(get_group_service),
-    hue: HueController = Depends(get_hue_controller),
+    hue: HueController | AsyncHueController = Depends(get_bridge_controller),
     manager: LightSetupsManager = Depends(get_manager),
     history: SceneHistoryService = Depends(get_scene_history_service),
 ):
@@ -7,12 +7,14 @@ from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
 from marvin_hue.api.dependencies import (
+    get_async_hue_controller,
     get_chat_agent,
     get_chat_unavailable_reason,
     get_hue_controller,
     get_screen_mirror,
 )
 from marvin_hue.api import dependencies as deps
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.chat import HueLightAgent
 from marvin_hue.controllers import HueController
 from marvin_hue.logging_config import get_logger
@@ -37,10 +39,12 @@ async def api_health(
     hue: HueController = Depends(get_hue_controller),
     screen_mirror: ScreenMirror = Depends(get_screen_mirror),
     chat_agent: HueLightAgent | None = Depends(get_chat_agent),
+    hue_async: AsyncHueController | None = Depends(get_async_hue_controller),
 ):
-    """Aggregated health: bridge, lights, mirror, chat, registry, schedules."""
+    """Aggregated health: bridge, lights, mirror, rest, light_state, chat, registry, schedules."""
     payload = await collect_health(
         hue=hue,
+        hue_async=hue_async,
         screen_mirror=screen_mirror,
         chat_agent=chat_agent,
         chat_reason=get_chat_unavailable_reason(),
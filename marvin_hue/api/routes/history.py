@@ -8,7 +8,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from marvin_hue.api.dependencies import (
-    get_hue_controller,
+    get_bridge_controller,
     get_scene_history_service,
 )
 from marvin_hue.api.models import (
@@ -16,6 +16,7 @@ from marvin_hue.api.models import (
     HistoryUndoResponse,
     SceneSnapshotResponse,
 )
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.controllers import HueController
 from marvin_hue.domain.scene_history import (
     SceneHistoryNotFoundError,
@@ -58,7 +59,7 @@ async def list_history(
 async def create_snapshot(
     body: HistorySnapshotRequest,
     svc: SceneHistoryService = Depends(get_scene_history_service),
-    hue: HueController = Depends(get_hue_controller),
+    hue: HueController | AsyncHueController = Depends(get_bridge_controller),
 ):
     source = (body.source or "manual").strip() or "manual"
     try:
@@ -76,7 +77,7 @@ async def create_snapshot(
 @router.post("/api/history/undo", response_model=HistoryUndoResponse)
 async def undo_last(
     svc: SceneHistoryService = Depends(get_scene_history_service),
-    hue: HueController = Depends(get_hue_controller),
+    hue: HueController | AsyncHueController = Depends(get_bridge_controller),
 ):
     try:
         result = await svc.restore_last(hue)
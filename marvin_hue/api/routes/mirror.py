@@ -14,6 +14,7 @@ from fastapi.templating import Jinja2Templates
 
 from marvin_hue.api.dependencies import (
     get_audio_mirror,
+    get_bridge_controller,
     get_entertainment_client,
     get_hue_controller,
     get_manager,
@@ -21,6 +22,7 @@ from marvin_hue.api.dependencies import (
     get_screen_mirror,
     set_entertainment_client,
 )
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.basics import LightSetupsManager
 from marvin_hue.api.models import (
     EntertainmentPairRequest,
@@ -118,6 +120,7 @@ def _unified_status(screen: ScreenMirror, audio: AudioMirror) -> dict[str, Any]:
         if not isinstance(status.get("transport"), str):
             status["transport"] = _safe_transport(audio)
         status.setdefault("entertainment_area_id", _safe_area_id(audio))
+        status.setdefault("timing", None)
         return status
     status = screen.get_status()
     if not isinstance(status, dict):
@@ -132,6 +135,7 @@ def _unified_status(screen: ScreenMirror, audio: AudioMirror) -> dict[str, Any]:
     status.setdefault("entertainment_enabled", bool(settings.entertainment_enabled))
     status["entertainment_ready"] = ready
     status.setdefault("entertainment_area_id", _safe_area_id(screen))
+    status.setdefault("timing", None)
     # Ensure transport is a plain string even if mock put something else
     if not isinstance(status.get("transport"), str):
         status["transport"] = _safe_transport(screen)
@@ -208,6 +212,9 @@ async def _build_port_for_mirror(
             mapped_channels=mapped or None,
             transition_time=transition_time,
             transport_preference=pref,
+            rest_max_in_flight=settings.rest_max_in_flight,
+            stream_fps=settings.entertainment_fps,
+            interpolation=settings.entertainment_interpolation,
         ),
         resolved_area,
         mapped,
@@ -246,7 +253,11 @@ async def _ensure_entertainment_started(
                 await client.stop_stream()
         except Exception:
             pass
-        return RestPhueAdapter(hue, transition_time=transition_time)
+        return RestPhueAdapter(
+            hue,
+            transition_time=transition_time,
+            max_in_flight=settings.rest_max_in_flight,
+        )
 
 
 async def prepare_audio_output_port(
@@ -377,7 +388,7 @@ async def start_mirror(
                 and port.transport == "entertainment"
                 and request.profile is None
             ):
-                fps = settings.entertainment_fps
+                fps = settings.entertainment_analysis_fps or settings.entertainment_fps
 
             audio_mirror.start(
                 fps=fps,
@@ -454,7 +465,7 @@ async def start_mirror(
             and port.transport == "entertainment"
             and request.profile is None
         ):
-            fps = settings.entertainment_fps
+            fps = settings.entertainment_analysis_fps or settings.entertainment_fps
 
         screen_mirror.start(
             fps=fps,
@@ -478,7 +489,7 @@ async def start_mirror(
 async def stop_mirror(
     screen_mirror: ScreenMirror = Depends(get_screen_mirror),
     audio_mirror: AudioMirror = Depends(get_audio_mirror),
-    hue: HueController = Depends(get_hue_controller),
+    hue: HueController | AsyncHueController = Depends(get_bridge_controller),
     history: SceneHistoryService = Depends(get_scene_history_service),
     ent_client: EntertainmentClient | None = Depends(get_entertainment_client),
 ):
@@ -609,6 +620,10 @@ async def update_mirror_settings(
             screen_mirror.smoothing_factor = request.smoothing_factor
         if request.transition_time is not None:
             screen_mirror.transition_time = request.transition_time
+        if request.color_engine is not None:
+            screen_mirror.set_color_engine(request.color_engine)
+        if request.pipelined is not None:
+            screen_mirror.pipelined = request.pipelined
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -708,6 +723,7 @@ async def entertainment_status(
         "transport": transport,
         "default_area_id": settings.entertainment_area_id or _pending_area_id,
         "fps_default": settings.entertainment_fps,
+        "interpolation": settings.entertainment_interpolation,
     }
 
 
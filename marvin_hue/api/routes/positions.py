@@ -11,6 +11,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from marvin_hue.api.models import PositionsUpdate
+from marvin_hue.positions_cache import invalidate_positions
 
 router = APIRouter(tags=["Positions"])
 
@@ -60,6 +61,8 @@ async def save_positions(request: PositionsUpdate):
     current = await load_json_file(POSITIONS_FILE)
     current["lights"] = [light.model_dump() for light in request.lights]
     await save_json_file(POSITIONS_FILE, current)
+    # Mirrors ativos pegam a nova configuração já no próximo frame
+    invalidate_positions(POSITIONS_FILE)
     return {"message": "Configuração salva com sucesso"}
 
 
@@ -132,4 +135,5 @@ async def reset_positions():
         ],
     }
     await save_json_file(POSITIONS_FILE, default_config)
+    invalidate_positions(POSITIONS_FILE)
     return default_config
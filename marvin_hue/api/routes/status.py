@@ -5,8 +5,9 @@ Endpoints para status da bridge e das lâmpadas.
 
 import asyncio
 from fastapi import APIRouter, HTTPException, Depends
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.controllers import HueController
-from marvin_hue.api.dependencies import get_hue_controller
+from marvin_hue.api.dependencies import get_bridge_controller, get_hue_controller
 
 router = APIRouter(tags=["Status"])
 
@@ -28,11 +29,16 @@ async def bridge_status(hue: HueController = Depends(get_hue_controller)):
 
 
 @router.get("/api/lights/status")
-async def lights_status(hue: HueController = Depends(get_hue_controller)):
+async def lights_status(
+    hue: HueController | AsyncHueController = Depends(get_bridge_controller),
+):
     """Retorna o estado atual de todas as lâmpadas com suas cores."""
     try:
-        loop = asyncio.get_event_loop()
-        status = await loop.run_in_executor(None, hue.get_lights_status)
+        if isinstance(hue, AsyncHueController):
+            status = await hue.get_lights_status()
+        else:
+            loop = asyncio.get_event_loop()
+            status = await loop.run_in_executor(None, hue.get_lights_status)
         return {"lights": status}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
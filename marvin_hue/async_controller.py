@@ -0,0 +1,325 @@
+"""
+Variante assíncrona do ``HueController`` sobre um cliente HTTP com pool.
+
+Rotas e serviços FastAPI chamavam o controlador síncrono (phue) via
+``asyncio.to_thread``: cada chamada à bridge ocupava uma thread do executor
+padrão enquanto esperava a rede. ``AsyncHueController`` fala REST v1
+diretamente com um ``httpx.AsyncClient`` (conexões keep-alive reutilizadas,
+limite de conexões simultâneas) e expõe a mesma superfície pública em
+corrotinas.
+
+Toda a lógica sem I/O — corpo combinado do PUT, clamp ocular e de gamut,
+lotes de group action, hash de cena, cache de estado — continua no
+``HueController`` e é compartilhada: os dois caminhos enviam exatamente os
+mesmos comandos. Só o índice de grupos/cenas, lido uma vez por conexão, ainda
+passa pelo phue (numa thread) quando ainda não está em memória.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+
+from marvin_hue.basics import LightConfig
+from marvin_hue.bridge_groups import ALL_LIGHTS_GROUP, response_ok
+from marvin_hue.bridge_limiter import RestWriteLimiter
+from marvin_hue.bridge_scenes import recall_body
+from marvin_hue.colors import Color
+from marvin_hue.controllers import HueController
+from marvin_hue.eye_safety import clamp_eye_safety, is_enabled_for_app
+from marvin_hue.light_state import LightStateCache
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("async_controller")
+
+# Conexões keep-alive simultâneas com a bridge
+DEFAULT_MAX_CONNECTIONS = 4
+
+
+class AsyncHueController:
+    """
+    ``HueController`` com I/O assíncrono (mesmos métodos, em corrotinas).
+
+    Example:
+        >>> hue_async = AsyncHueController(hue)
+        >>> await hue_async.apply_light_config(config, transition_time_secs=2)
+        >>> await hue_async.get_lights_status()
+        >>> await hue_async.aclose()
+    """
+
+    def __init__(
+        self,
+        hue: HueController,
+        *,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 10.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """
+        Args:
+            hue: Controlador síncrono já conectado (lâmpadas, caches, política)
+            client: Cliente pronto (testes); ``base_url`` deve ser ``/api/<user>``
+            timeout: Timeout por requisição em segundos
+            max_connections: Conexões simultâneas no pool
+        """
+        self.hue = hue
+        self._client = client or httpx.AsyncClient(
+            base_url=f"http://{hue.bridge.ip}/api/{hue.bridge.username}",
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    # --- transporte ---
+
+    async def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> Any:
+        if method != "GET":
+            limiter = getattr(self.hue, "rest_limiter", None)
+            if isinstance(limiter, RestWriteLimiter):
+                delay = limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        response = await self._client.request(method, path, json=body)
+        response.raise_for_status()
+        return response.json()
+
+    async def _put_light(self, light: Any, body: dict[str, Any]) -> bool:
+        result = await self._request("PUT", f"/lights/{light.light_id}/state", body)
+        if not response_ok(result):
+            logger.warning(f"Bridge rejected state for light {light.light_id}: {result}")
+            return False
+        self.hue.note_write([light.light_id], body)
+        return True
+
+    async def _put_group(self, group_id: str, body: dict[str, Any]) -> bool:
+        return response_ok(await self._request("PUT", f"/groups/{group_id}/action", body))
+
+    # --- escrita ---
+
+    async def set_light_state(
+        self,
+        light_name: str,
+        color: Color | None = None,
+        *,
+        on: bool | None = None,
+        transition_time: int | None = None,
+    ) -> Any:
+        """
+        Estado de uma lâmpada num único PUT (ver ``HueController.set_light_state``).
+
+        Raises:
+            ValueError: Se a lâmpada não for encontrada ou estiver desabilitada
+            RuntimeError: Se a requisição à bridge falhar ou for rejeitada
+        """
+        light = self.hue.target_light(light_name)
+        body = self.hue.light_state_body(
+            light_name, color, on=on, transition_time=transition_time
+        )
+        if not body:
+            return light
+        try:
+            ok = await self._put_light(light, body)
+        except httpx.HTTPError as e:
+            logger.error(f"Erro inesperado ao definir estado para '{light_name}': {e}")
+            raise RuntimeError(f"Erro ao aplicar cor: {e}") from e
+        if not ok:
+            raise RuntimeError(f"Erro ao aplicar cor: bridge rejeitou o estado de '{light_name}'")
+        logger.debug(f"Successfully applied state to '{light_name}': {body}")
+        return light
+
+    async def set_light_color(self, light_name: str, color: Color) -> Any:
+        return await self.set_light_state(light_name, color)
+
+    async def apply_light_config(
+        self, light_config: LightConfig, transition_time_secs: float = 0
+    ) -> "AsyncHueController":
+        """Mesmo fluxo do síncrono: recall de cena, group actions e PUT por lâmpada."""
+        transition_time = self.hue.config_transition(light_config, transition_time_secs)
+
+        # OPTIMIZATION: Scene recall - preset já materializado na bridge
+        if await self._recall_scene(light_config, transition_time):
+            logger.info(f"Configuration '{light_config.name}' recalled as bridge scene")
+            return self
+
+        # OPTIMIZATION: Group action - lâmpadas com o mesmo corpo num único PUT
+        batches, per_light = self.hue.plan_light_config(light_config, transition_time)
+        for key, members in batches.items():
+            if await self._apply_group_action([light for _, light in members], json.loads(key)):
+                continue
+            per_light.extend(setting for setting, _ in members)
+
+        # PUTs por lâmpada em paralelo (o pool limita as conexões simultâneas)
+        results = await asyncio.gather(
+            *(
+                self.set_light_state(
+                    setting.light_name, setting.color, on=True, transition_time=transition_time
+                )
+                for setting in per_light
+            ),
+            return_exceptions=True,
+        )
+        errors = [
+            f"{setting.light_name}: {result}"
+            for setting, result in zip(per_light, results)
+            if isinstance(result, Exception)
+        ]
+        if errors:
+            logger.warning(f"Configuração aplicada com {len(errors)} erro(s): {errors}")
+
+        logger.info(f"Configuration '{light_config.name}' applied successfully")
+        return self
+
+    async def _recall_scene(self, light_config: LightConfig, transition_time: int | None) -> bool:
+        scenes = self.hue.scenes
+        if scenes is None:
+            return False
+        try:
+            plan = self.hue.scene_plan(light_config)
+            if plan is None:
+                return False
+            content_hash, states = plan
+            if scenes.loaded:
+                scene_id = scenes.scene_for(content_hash)
+            else:
+                scene_id = await asyncio.to_thread(scenes.scene_for, content_hash)
+            if scene_id is None:
+                return False
+            if not await self._put_group(
+                ALL_LIGHTS_GROUP, recall_body(scene_id, transition_time)
+            ):
+                return False
+        except Exception as e:
+            logger.warning(f"Scene recall falhou para '{light_config.name}': {e}")
+            return False
+        for light_id, state in states.items():
+            self.hue.note_write([light_id], state)
+        return True
+
+    async def _apply_group_action(self, lights: list[Any], body: dict[str, Any]) -> bool:
+        groups = self.hue.groups
+        if groups is None or len(lights) < 2:
+            return False
+        ids = [light.light_id for light in lights]
+        all_ids = [light.light_id for light in self.hue.lights]
+        try:
+            group_id = groups.cached(ids, all_ids=all_ids)
+            if group_id is None:
+                # Índice frio ou grupo novo: leitura/criação pelo phue
+                group_id = await asyncio.to_thread(groups.resolve, ids, all_ids=all_ids)
+            if group_id is None or not await self._put_group(group_id, body):
+                return False
+        except Exception as e:
+            logger.warning(f"Group action falhou ({len(lights)} lâmpadas): {e}")
+            return False
+        logger.debug(f"Group action {group_id} applied to {len(lights)} lights: {body}")
+        self.hue.note_write(ids, body)
+        return True
+
+    async def _set_simple(self, light_name: str, body: dict[str, Any], action: str) -> bool:
+        if not is_enabled_for_app(light_name):
+            logger.debug(f"{action} skipped: '{light_name}' desabilitada no app")
+            return False
+        light = self.hue.get_light_by_name(light_name)
+        if light is None:
+            return False
+        return await self._put_light(light, body)
+
+    async def turn_on(self, light_name: str) -> bool:
+        """Liga uma lâmpada pelo nome. Retorna False se não encontrada ou desabilitada."""
+        return await self._set_simple(light_name, {"on": True}, "turn_on")
+
+    async def turn_off(self, light_name: str) -> bool:
+        """Desliga uma lâmpada pelo nome. Retorna False se não encontrada ou desabilitada."""
+        return await self._set_simple(light_name, {"on": False}, "turn_off")
+
+    async def set_brightness(self, light_name: str, hue_brightness: int) -> bool:
+        """Brilho (0-254) clampado pelo invariante ocular."""
+        safe = clamp_eye_safety(light_name, max(0, min(254, hue_brightness)), scale="hue")
+        return await self._set_simple(light_name, {"bri": safe}, "set_brightness")
+
+    # --- leitura ---
+
+    async def get_lights_status(self) -> list[dict[str, Any]]:
+        """
+        Estado de todas as lâmpadas (mesmo formato do síncrono).
+
+        Serve do ``state_cache`` quando válido; senão um ``GET /lights``
+        assíncrono, gravado no cache para as próximas leituras. Se a leitura
+        em lote falhar, lê cada lâmpada (``GET /lights/<id>``) e as que
+        falharem viram linhas com ``error``, como no síncrono.
+        """
+        cache: LightStateCache | None = getattr(self.hue, "state_cache", None)
+        states = cache.cached() if cache is not None else None
+        if states is None:
+            try:
+                lights = await self._request("GET", "/lights")
+            except httpx.HTTPError as e:
+                logger.warning(f"GET /lights falhou, lendo por lâmpada: {e}")
+                return list(
+                    await asyncio.gather(
+                        *(self._light_status(light) for light in self.hue.lights)
+                    )
+                )
+            states = cache.store(lights) if cache is not None else None
+            if states is None and isinstance(lights, dict):
+                states = {str(k): v for k, v in lights.items() if isinstance(v, dict)}
+        status: list[dict[str, Any]] = []
+        for light in self.hue.lights:
+            info = (states or {}).get(str(light.light_id))
+            if info is None:
+                status.append(_error_status(light.name, "Lâmpada ausente em GET /lights"))
+            else:
+                status.append(HueController._status_from_state(info))
+        return status
+
+    async def _light_status(self, light: Any) -> dict[str, Any]:
+        """Linha de status de uma lâmpada (``GET /lights/<id>``); erro vira ``error``."""
+        try:
+            info = await self._request("GET", f"/lights/{light.light_id}")
+        except httpx.HTTPError as e:
+            logger.warning(f"Error getting status for light '{light.name}': {e}")
+            return _error_status(light.name, str(e))
+        if not isinstance(info, dict):
+            return _error_status(light.name, f"Resposta inesperada: {info!r}")
+        return HueController._status_from_state(info)
+
+    def list_lights(self) -> list[str]:
+        return self.hue.list_lights()
+
+    async def list_bridge_lights(self) -> list[dict[str, Any]]:
+        """Inventário do catálogo (nome + uniqueid) num único ``GET /lights``."""
+        lights = await self._request("GET", "/lights")
+        if not isinstance(lights, dict):
+            return []
+        inventory: list[dict[str, Any]] = []
+        for light_id, info in lights.items():
+            if not isinstance(info, dict):
+                continue
+            uniqueid = info.get("uniqueid")
+            inventory.append(
+                {
+                    "name": info.get("name"),
+                    "bridge_light_id": str(uniqueid) if uniqueid else str(light_id),
+                }
+            )
+        return inventory
+
+
+def _error_status(name: str, error: str) -> dict[str, Any]:
+    """Status mínimo (desligada, cinza) para lâmpada que não pôde ser lida."""
+    return {
+        "name": name,
+        "on": False,
+        "brightness": 0,
+        "reachable": False,
+        "color": {"r": 50, "g": 50, "b": 50},
+        "error": error,
+    }
@@ -25,6 +25,8 @@ DEFAULT_HOP_SIZE = 1024
 DEFAULT_SPECTRUM_BINS = 48
 DEFAULT_SPECTRUM_FMIN_HZ = 30.0
 DEFAULT_SPECTRUM_FMAX_HZ = 16_000.0
+# rect: soma das faixas FFT de cada barra; triangular/mel: filtros sobrepostos
+SPECTRUM_WEIGHTINGS: tuple[str, ...] = ("rect", "triangular", "mel")
 
 # Multi-band edges (Hz)
 BAND_EDGES: dict[str, tuple[float, float]] = {
@@ -57,6 +59,9 @@ _CENTROID_MAX_HZ = 5500.0
 # Beat refractory (frames) after an onset fires
 _BEAT_REFRACTORY_FRAMES = 5
 
+# Precisão do caminho de análise (ring, janela, FFT)
+ANALYZER_DTYPES: tuple[str, ...] = ("float64", "float32")
+
 
 # ---------------------------------------------------------------------------
 # Color helpers
@@ -285,11 +290,26 @@ class AutoScaler:
         self.peak = self.min_peak
 
 
+def _hz_to_mel(hz: np.ndarray | float) -> np.ndarray:
+    return 2595.0 * np.log10(1.0 + np.asarray(hz, dtype=np.float64) / 700.0)
+
+
+def _mel_to_hz(mel: np.ndarray) -> np.ndarray:
+    return 700.0 * (10.0 ** (np.asarray(mel, dtype=np.float64) / 2595.0) - 1.0)
+
+
 class LogSpectrumBank:
     """
     Log-spaced FFT bin aggregator for UI spectrum bars.
 
-    Built once from sample rate / FFT size; rebuild when SR changes.
+    The filterbank is a sparse CSR matrix (``indptr`` / ``indices`` /
+    ``weights``, one row per bar) built once per (sample rate, FFT size):
+
+    - ``rect``: each bar sums its contiguous log-spaced FFT range (weight 1)
+    - ``triangular``: overlapping triangles centered on log-spaced frequencies
+    - ``mel``: triangles centered on mel-spaced frequencies
+
+    Mapping is then a gather + one ``reduceat`` — no Python work per bar.
     """
 
     def __init__(
@@ -299,13 +319,16 @@ class LogSpectrumBank:
         n_bins: int = DEFAULT_SPECTRUM_BINS,
         f_min: float = DEFAULT_SPECTRUM_FMIN_HZ,
         f_max: float = DEFAULT_SPECTRUM_FMAX_HZ,
+        weighting: str = "rect",
     ) -> None:
+        if weighting not in SPECTRUM_WEIGHTINGS:
+            raise ValueError(f"Unknown spectrum weighting: {weighting}")
         self.sample_rate = int(sample_rate)
         self.fft_size = int(fft_size)
         self.n_bins = max(8, int(n_bins))
         self.f_min = float(f_min)
         self.f_max = float(f_max)
-        self._bin_ranges: list[tuple[int, int]] = []
+        self.weighting = weighting
         self._build()
 
     def _build(self) -> None:
@@ -315,21 +338,57 @@ class LogSpectrumBank:
         nyq = sr / 2.0
         f_hi = min(self.f_max, nyq * 0.98)
         f_lo = max(1.0, min(self.f_min, f_hi * 0.5))
-        # Log edges: n_bins+1 boundaries
-        edges = np.geomspace(f_lo, f_hi, self.n_bins + 1)
-        # Map Hz → rFFT index
         freqs = np.fft.rfftfreq(n_fft, d=1.0 / sr)
-        ranges: list[tuple[int, int]] = []
+        if self.weighting == "rect":
+            rows = self._rect_rows(freqs, n_rfft, f_lo, f_hi)
+        else:
+            if self.weighting == "mel":
+                mels = np.linspace(_hz_to_mel(f_lo), _hz_to_mel(f_hi), self.n_bins + 2)
+                points = _mel_to_hz(mels)
+            else:
+                points = np.geomspace(f_lo, f_hi, self.n_bins + 2)
+            rows = self._triangle_rows(freqs, points)
+        counts = [idx.size for idx, _ in rows]
+        self.n_rfft = n_rfft
+        self.indptr = np.zeros(self.n_bins + 1, dtype=np.intp)
+        np.cumsum(counts, out=self.indptr[1:])
+        self.indices = np.concatenate([idx for idx, _ in rows]).astype(np.intp)
+        self.weights = np.concatenate([w for _, w in rows]).astype(np.float64)
+        # Every row is non-empty, so indptr[:-1] is strictly increasing (reduceat)
+        self._row_starts = self.indptr[:-1].copy()
+        self._gather = np.zeros(self.indices.size, dtype=np.float64)
+
+    def _rect_rows(
+        self, freqs: np.ndarray, n_rfft: int, f_lo: float, f_hi: float
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        # Log edges: n_bins+1 boundaries; inclusive start, exclusive end
+        edges = np.geomspace(f_lo, f_hi, self.n_bins + 1)
+        starts = np.searchsorted(freqs, edges[:-1], side="left")
+        ends = np.searchsorted(freqs, edges[1:], side="left")
+        starts = np.clip(starts, 0, n_rfft - 1)
+        ends = np.maximum(starts + 1, np.minimum(n_rfft, ends))
+        return [
+            (np.arange(a, b), np.ones(b - a))
+            for a, b in zip(starts.tolist(), ends.tolist())
+        ]
+
+    def _triangle_rows(
+        self, freqs: np.ndarray, points: np.ndarray
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        rows: list[tuple[np.ndarray, np.ndarray]] = []
         for i in range(self.n_bins):
-            lo_hz = float(edges[i])
-            hi_hz = float(edges[i + 1])
-            # inclusive start, exclusive end (last bin inclusive end)
-            start = int(np.searchsorted(freqs, lo_hz, side="left"))
-            end = int(np.searchsorted(freqs, hi_hz, side="left"))
-            start = max(0, min(n_rfft - 1, start))
-            end = max(start + 1, min(n_rfft, end))
-            ranges.append((start, end))
-        self._bin_ranges = ranges
+            left, center, right = points[i], points[i + 1], points[i + 2]
+            rise = (freqs - left) / max(center - left, 1e-9)
+            fall = (right - freqs) / max(right - center, 1e-9)
+            w = np.clip(np.minimum(rise, fall), 0.0, None)
+            idx = np.flatnonzero(w > 0.0)
+            if idx.size == 0:
+                # Triangle narrower than one FFT bin (low end): nearest bin
+                idx = np.array([int(np.argmin(np.abs(freqs - center)))])
+                rows.append((idx, np.ones(1)))
+            else:
+                rows.append((idx, w[idx]))
+        return rows
 
     def rebuild_if_needed(self, sample_rate: int, fft_size: int) -> None:
         if int(sample_rate) != self.sample_rate or int(fft_size) != self.fft_size:
@@ -337,20 +396,36 @@ class LogSpectrumBank:
             self.fft_size = int(fft_size)
             self._build()
 
-    def map_power(self, power_spec: np.ndarray, *, mode: str = "sum") -> np.ndarray:
-        """Aggregate linear FFT power into log bins (length n_bins)."""
-        out = np.zeros(self.n_bins, dtype=np.float64)
-        n = int(power_spec.size)
-        for i, (start, end) in enumerate(self._bin_ranges):
-            s = min(start, n)
-            e = min(end, n)
-            if e <= s:
-                continue
-            chunk = power_spec[s:e]
-            if mode == "max":
-                out[i] = float(np.max(chunk))
-            else:
-                out[i] = float(np.sum(chunk))
+    def map_power(
+        self,
+        power_spec: np.ndarray,
+        *,
+        mode: str = "sum",
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Aggregate linear FFT power into log bins (length n_bins).
+
+        ``out`` (float64, n_bins) is reused instead of allocating a result.
+
+        OPTIMIZATION: CSR - weighted sparse dot as gather + ``reduceat`` over
+        preallocated buffers; cost is O(nnz) in NumPy, independent of n_bins.
+
+        Raises:
+            ValueError: se ``power_spec`` não tiver ``fft_size // 2 + 1`` bins
+        """
+        if power_spec.size != self.n_rfft:
+            raise ValueError(
+                f"power_spec has {power_spec.size} bins, bank expects {self.n_rfft}"
+            )
+        if out is None:
+            out = np.zeros(self.n_bins, dtype=np.float64)
+        if self._gather.dtype != power_spec.dtype:
+            self._gather = np.zeros(self.indices.size, dtype=power_spec.dtype)
+        # mode="clip": indices are in range by construction, and "raise" buffers out
+        gather = np.take(power_spec, self.indices, out=self._gather, mode="clip")
+        gather *= self.weights
+        reduce = np.maximum if mode == "max" else np.add
+        reduce.reduceat(gather, self._row_starts, out=out)
         return out
 
 
@@ -399,8 +474,11 @@ class AnalysisFrame:
 class AnalyzerConfig:
     """Tunable analyzer parameters (profiles map into this)."""
 
+    # FFT size (janela de análise) / amostras novas por frame em process_hops
     buffer_size: int = DEFAULT_BUFFER_SIZE
     hop_size: int = DEFAULT_HOP_SIZE
+    # Streaming: consumidores (AudioMirror) usam process_hops — 1 frame por hop
+    streaming: bool = False
     attack: float = 0.45
     release: float = 0.10
     beat_sensitivity: float = 1.0
@@ -408,12 +486,89 @@ class AnalyzerConfig:
     hue_speed: float = 1.0
     energy_gain: float = 1.0
     spectrum_bins: int = DEFAULT_SPECTRUM_BINS
+    # rect | triangular | mel — ver SPECTRUM_WEIGHTINGS / LogSpectrumBank
+    spectrum_weighting: str = "rect"
     auto_scale_strength: float = 0.80
+    # float64 | float32 — ring/janela/FFT; float32 halves memory traffic
+    dtype: str = "float64"
     # Per-band attack/release overrides (optional)
     band_attack: Mapping[str, float] | None = None
     band_release: Mapping[str, float] | None = None
 
 
+class _FFTWorkspace:
+    """
+    Buffers preallocated for the per-block analysis path.
+
+    Everything that used to be rebuilt per call — ordered ring copy, windowed
+    frame, rFFT output, magnitude/power spectra, bin frequencies, band ranges,
+    pre-emphasis and flux weights — lives here and is written with ``out=``.
+    Frequency-dependent tables are rebuilt only on sample-rate change.
+    """
+
+    def __init__(self, size: int, sample_rate: int, dtype: str) -> None:
+        self.size = int(size)
+        self.dtype = np.dtype(dtype)
+        n_rfft = self.size // 2 + 1
+        self.window = np.hanning(self.size).astype(self.dtype)
+        self.buf = np.zeros(self.size, dtype=self.dtype)
+        self.windowed = np.zeros(self.size, dtype=self.dtype)
+        self.spec = np.zeros(n_rfft, dtype=np.result_type(self.dtype, np.complex64))
+        self.mag = np.zeros(n_rfft, dtype=self.dtype)
+        # Row 0: power spectrum; row 1: pre-emphasized (UI) — banded in one pass
+        self.powers = np.zeros((2, n_rfft), dtype=self.dtype)
+        self.power = self.powers[0]
+        self.power_ui = self.powers[1]
+        self.diff = np.zeros(n_rfft, dtype=self.dtype)
+        self.prev_mag = np.zeros(n_rfft, dtype=self.dtype)
+        # Mild pre-emphasis so treble is visible on bass-heavy tracks (UI meters)
+        self.pre = (
+            1.0 + 1.8 * (np.arange(n_rfft, dtype=np.float64) / max(n_rfft - 1, 1))
+        ).astype(self.dtype)
+        # Beat flux: emphasize lower ~40% of bins (bass/mid energy onsets)
+        self.flux_weights = np.linspace(1.6, 0.35, n_rfft).astype(self.dtype)
+        self._mix = np.zeros(0, dtype=self.dtype)
+        self.sample_rate = 0
+        self.set_sample_rate(sample_rate)
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        self.sample_rate = int(sample_rate)
+        self.freqs = np.fft.rfftfreq(self.size, d=1.0 / self.sample_rate)
+        nyq = self.sample_rate / 2.0
+        # Band → contiguous bin range [start, end) (freqs is sorted), laid out
+        # as interleaved starts/ends for one np.add.reduceat over both spectra.
+        # end <= n_rfft - 1 always: hi is capped at nyq == freqs[-1] (exclusive).
+        self.band_names: tuple[str, ...] = tuple(BAND_EDGES)
+        bounds: list[int] = []
+        counts: list[int] = []
+        for lo, hi in BAND_EDGES.values():
+            hi_c = min(hi, nyq)
+            if lo >= nyq or hi_c <= lo:
+                start = end = 0
+            else:
+                start = int(np.searchsorted(self.freqs, lo, side="left"))
+                end = int(np.searchsorted(self.freqs, hi_c, side="left"))
+            bounds.extend((start, end))
+            counts.append(max(0, end - start))
+        self.band_bounds = np.asarray(bounds, dtype=np.intp)
+        count_arr = np.asarray(counts, dtype=np.float64)
+        # Empty bands: reduceat would return a single bin — weight them to 0
+        self.band_inv_count = np.divide(
+            1.0, count_arr, out=np.zeros_like(count_arr), where=count_arr > 0
+        )
+        self.band_sums = np.zeros((2, len(bounds)), dtype=self.dtype)
+        self.band_density = np.zeros((2, len(counts)), dtype=np.float64)
+        # Centroid ignores DC / sub-20 for stability: bins [centroid_start, n)
+        self.centroid_start = int(np.searchsorted(self.freqs, 20.0, side="left"))
+        self.centroid_freqs = self.freqs[self.centroid_start :].astype(self.dtype)
+
+    def mix(self, n: int) -> np.ndarray:
+        """Scratch for the stereo → mono mix (grows to the largest block)."""
+        if self._mix.size < n:
+            self._mix = np.zeros(n, dtype=self.dtype)
+        return self._mix[:n]
+
+
 class AudioAnalyzer:
     """
     Stateful multi-band analyzer with ring buffer, envelopes, AutoScaler,
@@ -421,6 +576,16 @@ class AudioAnalyzer:
 
     Call ``process(block)`` with mono (N,) or stereo (N, 2) float samples.
     Returns an ``AnalysisFrame`` every call (uses latest filled ring buffer).
+
+    Streaming mode: ``process_hops(block)`` returns exactly one frame per
+    ``hop_size`` new samples (zero or several per block, remainder carried to
+    the next call), each over the last ``buffer_size`` samples — update rate
+    and latency depend only on hop / FFT size, not on the capture block size.
+
+    The array work of each call runs in a preallocated ``_FFTWorkspace``
+    (``AnalyzerConfig.dtype`` float64 | float32); in steady state it allocates
+    no NumPy arrays (NumPy's single-precision rFFT still uses an internal
+    scratch). ``scripts/bench_audio_engine.py`` measures latency/allocations.
     """
 
     def __init__(
@@ -430,11 +595,20 @@ class AudioAnalyzer:
     ) -> None:
         self.sample_rate = int(sample_rate)
         self.config = config or AnalyzerConfig()
+        dtype = str(self.config.dtype)
+        if dtype not in ANALYZER_DTYPES:
+            raise ValueError(f"Unknown analyzer dtype: {dtype}")
+        if int(self.config.hop_size) < 1:
+            raise ValueError(f"hop_size must be >= 1, got {self.config.hop_size}")
         n = max(512, int(self.config.buffer_size))
         self._buf_size = n
-        self._ring = np.zeros(n, dtype=np.float64)
-        self._ring_l = np.zeros(n, dtype=np.float64)
-        self._ring_r = np.zeros(n, dtype=np.float64)
+        self._hop = int(self.config.hop_size)
+        self._hop_pending = 0  # samples pushed since the last hop frame
+        # OPTIMIZATION: Workspace - o caminho por bloco não aloca em regime
+        self._ws = _FFTWorkspace(n, self.sample_rate, dtype)
+        self._ring = np.zeros(n, dtype=dtype)
+        self._ring_l = np.zeros(n, dtype=dtype)
+        self._ring_r = np.zeros(n, dtype=dtype)
         self._write = 0
         self._filled = 0
         self._stereo = False
@@ -465,15 +639,14 @@ class AudioAnalyzer:
 
         self._n_spec = max(8, int(self.config.spectrum_bins))
         self._log_bank = LogSpectrumBank(
-            self.sample_rate, self._buf_size, n_bins=self._n_spec
+            self.sample_rate,
+            self._buf_size,
+            n_bins=self._n_spec,
+            weighting=str(self.config.spectrum_weighting),
         )
-        # Per-bin envelope followers (liveliness) + global peak for relative shape
-        self._spec_envs: list[EnvelopeFollower] = [
-            EnvelopeFollower(attack=0.55, release=0.14) for _ in range(self._n_spec)
-        ]
+        # Per-bin envelope (liveliness) + global peak for relative shape
         self._spec_global_peak: float = 0.12
-        self._spectrum: list[float] = [0.0] * self._n_spec
-        self._spec_hold: list[float] = [0.0] * self._n_spec
+        self._alloc_spectrum_buffers()
 
         self._prev_mag: np.ndarray | None = None
         self._flux_ema: float = 0.0
@@ -482,7 +655,6 @@ class AudioAnalyzer:
         self._beat_refractory: int = 0
         self._phase: float = 0.0
         self._frame_count: int = 0
-        self._window = np.hanning(n)
         # UI spectrum coarse meters: auto-range ceiling + peak-hold
         self._ui_ceiling: dict[str, float] = {
             "bass": 0.18,
@@ -499,6 +671,7 @@ class AudioAnalyzer:
         self._ring_r.fill(0.0)
         self._write = 0
         self._filled = 0
+        self._hop_pending = 0
         self._prev_mag = None
         self._flux_ema = 0.0
         self._flux_var = 1e-6
@@ -510,20 +683,34 @@ class AudioAnalyzer:
             env.reset()
         for sc in self._env_scalers.values():
             sc.reset()
-        for env in self._spec_envs:
-            env.reset()
         self._spec_global_peak = 0.12
-        self._spectrum = [0.0] * self._n_spec
-        self._spec_hold = [0.0] * self._n_spec
+        self._spec_env.fill(0.0)
+        self._spec_hold.fill(0.0)
+        self._spectrum.fill(0.0)
         self._ui_ceiling = {"bass": 0.18, "mid": 0.18, "treble": 0.18}
         self._ui_hold = {"bass": 0.0, "mid": 0.0, "treble": 0.0}
         self._env_ui = {"bass": 0.0, "mid": 0.0, "treble": 0.0}
 
-    def configure(self, **kwargs: float | int) -> None:
+    def configure(self, **kwargs: float | int | str) -> None:
         """Update selected AnalyzerConfig fields and re-tune envelopes if needed."""
+        weighting = kwargs.get("spectrum_weighting")
+        if weighting is not None and weighting not in SPECTRUM_WEIGHTINGS:
+            raise ValueError(f"Unknown spectrum weighting: {weighting}")
+        dtype = kwargs.get("dtype")
+        if dtype is not None and dtype not in ANALYZER_DTYPES:
+            raise ValueError(f"Unknown analyzer dtype: {dtype}")
+        if "hop_size" in kwargs and int(kwargs["hop_size"]) < 1:
+            raise ValueError(f"hop_size must be >= 1, got {kwargs['hop_size']}")
         for key, val in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, val)
+        if dtype is not None and np.dtype(str(dtype)) != self._ws.dtype:
+            self._set_dtype(str(dtype))
+        if "buffer_size" in kwargs:
+            self._set_buffer_size(int(self.config.buffer_size))
+        if "hop_size" in kwargs:
+            self._hop = int(self.config.hop_size)
+            self._hop_pending = min(self._hop_pending, self._hop - 1)
         # Refresh envelope rates when attack/release change
         if "attack" in kwargs or "release" in kwargs:
             for name, env in self._envs.items():
@@ -539,28 +726,72 @@ class AudioAnalyzer:
             strength = float(self.config.auto_scale_strength)
             for sc in self._env_scalers.values():
                 sc.strength = max(0.0, min(1.0, strength))
-        if "spectrum_bins" in kwargs:
+        if "spectrum_bins" in kwargs or "spectrum_weighting" in kwargs:
             self._resize_spectrum(int(self.config.spectrum_bins))
 
+    def _set_dtype(self, dtype: str) -> None:
+        """Recreate workspace and rings in ``dtype``, keeping ring contents."""
+        old = self._ws
+        self._ws = _FFTWorkspace(self._buf_size, self.sample_rate, dtype)
+        np.copyto(self._ws.prev_mag, old.prev_mag, casting="unsafe")
+        if self._prev_mag is not None:
+            self._prev_mag = self._ws.prev_mag
+        self._ring = self._ring.astype(dtype)
+        self._ring_l = self._ring_l.astype(dtype)
+        self._ring_r = self._ring_r.astype(dtype)
+
+    def _set_buffer_size(self, size: int) -> None:
+        """Resize the FFT window; ring history is dropped (different length)."""
+        n = max(512, int(size))
+        if n == self._buf_size:
+            return
+        self._buf_size = n
+        dtype = self._ws.dtype
+        self._ws = _FFTWorkspace(n, self.sample_rate, str(dtype))
+        self._ring = np.zeros(n, dtype=dtype)
+        self._ring_l = np.zeros(n, dtype=dtype)
+        self._ring_r = np.zeros(n, dtype=dtype)
+        self._write = 0
+        self._filled = 0
+        self._hop_pending = 0
+        self._prev_mag = None
+        self._log_bank.rebuild_if_needed(self.sample_rate, n)
+
     def _resize_spectrum(self, n_bins: int) -> None:
         n_bins = max(8, int(n_bins))
-        if n_bins == self._n_spec:
+        weighting = str(self.config.spectrum_weighting)
+        if n_bins == self._n_spec and weighting == self._log_bank.weighting:
             return
         self._n_spec = n_bins
         self._log_bank = LogSpectrumBank(
-            self.sample_rate, self._buf_size, n_bins=self._n_spec
+            self.sample_rate, self._buf_size, n_bins=self._n_spec, weighting=weighting
         )
-        self._spec_envs = [
-            EnvelopeFollower(attack=0.55, release=0.14) for _ in range(self._n_spec)
-        ]
         self._spec_global_peak = 0.12
-        self._spectrum = [0.0] * self._n_spec
-        self._spec_hold = [0.0] * self._n_spec
+        self._alloc_spectrum_buffers()
+
+    def _alloc_spectrum_buffers(self) -> None:
+        n = self._n_spec
+        self._spec_raw = np.zeros(n, dtype=np.float64)
+        self._spec_levels = np.zeros(n, dtype=np.float64)
+        # Envelope/hold state per bar (EnvelopeFollower semantics, as arrays)
+        self._spec_env = np.zeros(n, dtype=np.float64)
+        self._spec_attack = np.full(n, 0.55, dtype=np.float64)
+        self._spec_release = np.full(n, 0.14, dtype=np.float64)
+        self._spec_hold = np.zeros(n, dtype=np.float64)
+        self._spectrum = np.zeros(n, dtype=np.float64)
+        # Scratch for the vectorized stages
+        self._spec_work = np.zeros(n, dtype=np.float64)
+        self._spec_local = np.zeros(n, dtype=np.float64)
+        self._spec_rate = np.zeros(n, dtype=np.float64)
+        self._spec_mask = np.zeros(n, dtype=bool)
+        # Mild high-frequency pre-emphasis (musical; not enough to invert pure bass)
+        self._spec_boost = 1.0 + 0.85 * (np.arange(n, dtype=np.float64) / max(n - 1, 1))
 
     def set_sample_rate(self, sample_rate: int) -> None:
         if int(sample_rate) != self.sample_rate:
             self.sample_rate = int(sample_rate)
             self._log_bank.rebuild_if_needed(self.sample_rate, self._buf_size)
+            self._ws.set_sample_rate(self.sample_rate)
 
     def _push(self, mono: np.ndarray, left: np.ndarray | None, right: np.ndarray | None) -> None:
         n = mono.size
@@ -593,45 +824,45 @@ class AudioAnalyzer:
         self._filled = min(self._buf_size, self._filled + n)
 
     def _ordered_buffer(self) -> np.ndarray:
-        if self._filled < self._buf_size:
+        """Ring in chronological order, copied into the workspace buffer."""
+        out = self._ws.buf
+        filled = self._filled
+        if filled < self._buf_size:
             # Partial: return what we have zero-padded (stable FFT size)
-            out = np.zeros(self._buf_size, dtype=np.float64)
-            if self._filled > 0:
-                out[-self._filled :] = self._ring[: self._filled]
+            out[: self._buf_size - filled] = 0.0
+            if filled > 0:
+                out[-filled:] = self._ring[:filled]
             return out
         # Full ring: chronological order
-        return np.concatenate((self._ring[self._write :], self._ring[: self._write]))
-
-    def _band_densities(self, power_spec: np.ndarray, freqs: np.ndarray) -> dict[str, float]:
-        nyq = self.sample_rate / 2.0
-        out: dict[str, float] = {}
-        for name, (lo, hi) in BAND_EDGES.items():
-            hi_c = min(hi, nyq)
-            if lo >= nyq or hi_c <= lo:
-                out[name] = 0.0
-                continue
-            mask = (freqs >= lo) & (freqs < hi_c)
-            n = int(np.count_nonzero(mask))
-            if n <= 0:
-                out[name] = 0.0
-            else:
-                out[name] = float(np.sum(power_spec[mask]) / n)
+        tail = self._buf_size - self._write
+        out[:tail] = self._ring[self._write :]
+        out[tail:] = self._ring[: self._write]
         return out
 
-    def _spectral_centroid(self, mag: np.ndarray, freqs: np.ndarray) -> float:
+    def _band_densities(self) -> tuple[dict[str, float], dict[str, float]]:
+        """Mean density per band for the power and UI spectra (workspace rows).
+
+        OPTIMIZATION: Band ranges - one ``np.add.reduceat`` over precomputed
+        bin ranges for all bands of both spectra (no per-band masks).
+        """
+        ws = self._ws
+        np.add.reduceat(ws.powers, ws.band_bounds, axis=1, out=ws.band_sums)
+        np.multiply(ws.band_sums[:, ::2], ws.band_inv_count, out=ws.band_density)
+        power, ui = ws.band_density.tolist()
+        return dict(zip(ws.band_names, power)), dict(zip(ws.band_names, ui))
+
+    def _spectral_centroid(self, mag: np.ndarray) -> float:
         total = float(np.sum(mag))
         if total < 1e-12:
             return 0.0
-        # Ignore DC / sub-20 for stability
-        mask = freqs >= 20.0
-        if not np.any(mask):
+        ws = self._ws
+        m = mag[ws.centroid_start :]
+        if m.size == 0:
             return 0.0
-        m = mag[mask]
-        f = freqs[mask]
         s = float(np.sum(m))
         if s < 1e-12:
             return 0.0
-        hz = float(np.sum(f * m) / s)
+        hz = float(np.dot(m, ws.centroid_freqs)) / s
         # Log-ish normalize
         lo = math.log(_CENTROID_MIN_HZ)
         hi = math.log(_CENTROID_MAX_HZ)
@@ -644,20 +875,18 @@ class AudioAnalyzer:
         Weight low/mid bins (kicks/snares) more than airy highs so continuous
         music still produces readable beat flashes on the lights.
         """
+        ws = self._ws
         if self._prev_mag is None or self._prev_mag.shape != mag.shape:
-            self._prev_mag = mag.copy()
+            self._prev_mag = ws.prev_mag
+            np.copyto(self._prev_mag, mag)
             self._beat_env *= float(self.config.beat_decay)
             return self._beat_env
 
-        diff = np.maximum(mag - self._prev_mag, 0.0)
-        self._prev_mag = mag.copy()
-        n = diff.size
-        if n <= 1:
-            flux = float(np.sum(diff))
-        else:
-            # Emphasize lower ~40% of bins (bass/mid energy onsets)
-            weights = np.linspace(1.6, 0.35, n, dtype=np.float64)
-            flux = float(np.sum(diff * weights))
+        diff = ws.diff
+        np.subtract(mag, self._prev_mag, out=diff)
+        np.maximum(diff, 0.0, out=diff)
+        np.copyto(self._prev_mag, mag)
+        flux = float(np.dot(diff, ws.flux_weights))
 
         # Adaptive threshold via EMA of flux
         alpha = 0.12
@@ -698,18 +927,15 @@ class AudioAnalyzer:
         dominant); per-bin envelope + hold keeps bars lively like AutoScaler.
         """
         self._log_bank.rebuild_if_needed(self.sample_rate, self._buf_size)
-        raw_bins = self._log_bank.map_power(power_spec, mode="sum")
-        # Mild high-frequency pre-emphasis (musical; not enough to invert pure bass)
-        n = raw_bins.size
-        if n > 1:
-            boost = 1.0 + 0.85 * (np.arange(n, dtype=np.float64) / (n - 1))
-            raw_bins = raw_bins * boost
+        raw_bins = self._log_bank.map_power(power_spec, mode="sum", out=self._spec_raw)
+        raw_bins *= self._spec_boost
 
         strength = max(0.0, min(1.0, float(self.config.auto_scale_strength)))
-        levels = np.zeros(self._n_spec, dtype=np.float64)
-        for i in range(self._n_spec):
-            lin = float(raw_bins[i]) if i < raw_bins.size else 0.0
-            levels[i] = float(np.log1p(max(0.0, lin) * 1.2e4))
+        # OPTIMIZATION: Vectorized bars - every stage below is one NumPy op over
+        # all bins (cost no longer scales with Python-level bin count)
+        levels = np.maximum(raw_bins, 0.0, out=self._spec_levels)
+        levels *= 1.2e4
+        np.log1p(levels, out=levels)
 
         frame_max = float(np.max(levels)) if levels.size else 0.0
         # Peak follower for auto-normalize (fast attack / slow release)
@@ -719,43 +945,66 @@ class AudioAnalyzer:
             self._spec_global_peak += (frame_max - self._spec_global_peak) * 0.02
         self._spec_global_peak = max(0.08, min(50.0, self._spec_global_peak))
 
-        display: list[float] = []
-        for i in range(self._n_spec):
-            raw_n = levels[i] / max(self._spec_global_peak, 1e-9)
-            # Soft gate / floor
-            if raw_n < 0.03:
-                gated = 0.0
-            else:
-                gated = max(0.0, raw_n - 0.02)
-            compressed = math.tanh(gated * 1.45)
-            # Blend absolute-ish (frame-local) with global-scaled
-            local = levels[i] / max(frame_max, 1e-9) if frame_max > 1e-9 else 0.0
-            local = max(0.0, min(1.0, local))
-            blended = (1.0 - strength) * local + strength * compressed
-            scaled = self._spec_envs[i].process(blended)
-            hold = self._spec_hold[i]
-            if scaled >= hold:
-                hold = scaled
-            else:
-                hold = hold * 0.90
-            self._spec_hold[i] = hold
-            bar = max(0.0, min(1.0, 0.82 * scaled + 0.18 * hold))
-            display.append(bar)
-        self._spectrum = display
-        return display
+        # Soft gate / floor, then tanh compression
+        peak = max(self._spec_global_peak, 1e-9)
+        raw_n = np.divide(levels, peak, out=self._spec_work)
+        gate = np.less(raw_n, 0.03, out=self._spec_mask)
+        compressed = np.subtract(raw_n, 0.02, out=raw_n)
+        np.maximum(compressed, 0.0, out=compressed)
+        np.copyto(compressed, 0.0, where=gate)
+        compressed *= 1.45
+        np.tanh(compressed, out=compressed)
+        # Blend absolute-ish (frame-local) with global-scaled
+        local = self._spec_local
+        if frame_max > 1e-9:
+            np.divide(levels, frame_max, out=local)
+            np.clip(local, 0.0, 1.0, out=local)
+        else:
+            local.fill(0.0)
+        local *= 1.0 - strength
+        compressed *= strength
+        blended = np.add(local, compressed, out=compressed)
+
+        scaled = self._follow_spectrum(blended)
+        hold = self._spec_hold
+        rising = np.greater_equal(scaled, hold, out=self._spec_mask)
+        hold *= 0.90
+        np.copyto(hold, scaled, where=rising)
+        bars = np.multiply(scaled, 0.82, out=self._spectrum)
+        bars += 0.18 * hold
+        np.clip(bars, 0.0, 1.0, out=bars)
+        bars_list: list[float] = bars.tolist()
+        return bars_list
+
+    def _follow_spectrum(self, target: np.ndarray) -> np.ndarray:
+        """Per-bin attack/release envelope step (``EnvelopeFollower.process``).
+
+        ``target`` is used as scratch.
+        """
+        env = self._spec_env
+        np.maximum(target, 0.0, out=target)
+        rate = self._spec_rate
+        np.copyto(rate, self._spec_release)
+        rising = np.greater(target, env, out=self._spec_mask)
+        np.copyto(rate, self._spec_attack, where=rising)
+        target -= env
+        target *= rate
+        env += target
+        return env
 
     def _decay_spectrum(self) -> list[float]:
         """Graceful spectrum + envelope decay on silence."""
         self._spec_global_peak = max(0.08, self._spec_global_peak * 0.94)
-        out: list[float] = []
-        for i in range(self._n_spec):
-            self._spec_envs[i].process(0.0)
-            self._spec_hold[i] *= 0.88
-            v = self._spectrum[i] * 0.88 if i < len(self._spectrum) else 0.0
-            v = max(0.0, min(1.0, 0.7 * v + 0.3 * self._spec_hold[i]))
-            out.append(v)
-        self._spectrum = out
-        return out
+        silence = self._spec_work
+        silence.fill(0.0)
+        self._follow_spectrum(silence)
+        self._spec_hold *= 0.88
+        bars = self._spectrum
+        bars *= 0.88 * 0.7
+        bars += 0.3 * self._spec_hold
+        np.clip(bars, 0.0, 1.0, out=bars)
+        bars_list: list[float] = bars.tolist()
+        return bars_list
 
     def process(self, block: np.ndarray) -> AnalysisFrame:
         """
@@ -763,14 +1012,52 @@ class AudioAnalyzer:
 
         Stereo is preserved for L/R bias; mono mix is used for spectrum.
         """
-        arr = np.asarray(block, dtype=np.float64)
+        mono, left, right = self._split_block(block)
+        if mono.size == 0:
+            return AnalysisFrame(spectrum=[0.0] * self._n_spec)
+        self._push(mono, left, right)
+        return self._analyze()
+
+    def process_hops(self, block: np.ndarray) -> list[AnalysisFrame]:
+        """
+        Streaming mode: one AnalysisFrame per completed hop in ``block``.
+
+        The block is pushed hop-aligned; a frame is analyzed each time
+        ``hop_size`` new samples have arrived since the previous one. Samples
+        that do not complete a hop stay pending for the next call, so small
+        blocks return ``[]`` and large blocks return several frames.
+        """
+        mono, left, right = self._split_block(block)
+        frames: list[AnalysisFrame] = []
+        pos, n = 0, mono.size
+        while pos < n:
+            end = pos + min(n - pos, self._hop - self._hop_pending)
+            self._push(
+                mono[pos:end],
+                None if left is None else left[pos:end],
+                None if right is None else right[pos:end],
+            )
+            self._hop_pending += end - pos
+            pos = end
+            if self._hop_pending >= self._hop:
+                self._hop_pending = 0
+                frames.append(self._analyze())
+        return frames
+
+    def _split_block(
+        self, block: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray | None, np.ndarray | None]:
+        """(mono, left, right) views of a mono (N,) or stereo (N, C) block."""
+        arr = np.asarray(block)
         left: np.ndarray | None = None
         right: np.ndarray | None = None
 
         if arr.ndim == 2 and arr.shape[1] >= 2:
             left = arr[:, 0]
             right = arr[:, 1]
-            mono = 0.5 * (left + right)
+            mono = self._ws.mix(left.shape[0])
+            np.add(left, right, out=mono, dtype=mono.dtype)
+            mono *= 0.5
             self._stereo = True
         elif arr.ndim == 2:
             mono = arr[:, 0]
@@ -778,13 +1065,12 @@ class AudioAnalyzer:
         else:
             mono = arr.reshape(-1)
             self._stereo = False
+        return mono, left, right
 
-        if mono.size == 0:
-            return AnalysisFrame(spectrum=[0.0] * self._n_spec)
-
-        self._push(mono, left, right)
+    def _analyze(self) -> AnalysisFrame:
+        """Analyze the current ring contents (last ``buffer_size`` samples)."""
         buf = self._ordered_buffer()
-        rms = float(np.sqrt(np.mean(buf * buf) + 1e-20))
+        rms = math.sqrt(float(np.dot(buf, buf)) / self._buf_size + 1e-20)
 
         # Silence short-circuit (still decay envelopes / beat / spectrum)
         if rms < 1e-5:
@@ -812,22 +1098,19 @@ class AudioAnalyzer:
                 spectrum=list(spectrum),
             )
 
-        windowed = buf * self._window
-        spectrum_c = np.fft.rfft(windowed)
-        mag = np.abs(spectrum_c)
-        power_spec = (mag ** 2) / max(self._buf_size, 1)
-        freqs = np.fft.rfftfreq(self._buf_size, d=1.0 / self.sample_rate)
-
-        # Mild pre-emphasis so treble is visible on bass-heavy tracks (UI meters)
-        if mag.size > 4:
-            n_bins = mag.size
-            pre = 1.0 + 1.8 * (np.arange(n_bins, dtype=np.float64) / max(n_bins - 1, 1))
-            power_ui = ((mag * pre) ** 2) / max(self._buf_size, 1)
-        else:
-            power_ui = power_spec
-
-        densities = self._band_densities(power_spec, freqs)
-        densities_ui = self._band_densities(power_ui, freqs)
+        # OPTIMIZATION: Workspace - janela, rFFT, |X| e potências com out=
+        ws = self._ws
+        np.multiply(buf, ws.window, out=ws.windowed)
+        np.fft.rfft(ws.windowed, out=ws.spec)
+        mag = np.abs(ws.spec, out=ws.mag)
+        power_spec = np.multiply(mag, mag, out=ws.power)
+        power_spec /= self._buf_size
+        # Pre-emphasized copy for the UI meters
+        power_ui = np.multiply(mag, ws.pre, out=ws.power_ui)
+        np.multiply(power_ui, power_ui, out=power_ui)
+        power_ui /= self._buf_size
+
+        densities, densities_ui = self._band_densities()
         sens = float(self.config.energy_gain)
 
         raw_levels: dict[str, float] = {
@@ -900,24 +1183,18 @@ class AudioAnalyzer:
         # Multi-bar log spectrum (UI)
         spectrum = self._update_spectrum(power_spec)
 
-        centroid = self._spectral_centroid(mag, freqs)
+        centroid = self._spectral_centroid(mag)
         beat = self._update_beat(mag)
 
         # Stereo bias -1..1 from ring L/R RMS
         stereo_bias = 0.0
         if self._stereo and self._filled >= 64:
-            if self._filled < self._buf_size:
-                lbuf = self._ring_l[: self._filled]
-                rbuf = self._ring_r[: self._filled]
-            else:
-                lbuf = np.concatenate(
-                    (self._ring_l[self._write :], self._ring_l[: self._write])
-                )
-                rbuf = np.concatenate(
-                    (self._ring_r[self._write :], self._ring_r[: self._write])
-                )
-            rms_l = float(np.sqrt(np.mean(lbuf * lbuf) + 1e-20))
-            rms_r = float(np.sqrt(np.mean(rbuf * rbuf) + 1e-20))
+            # RMS ignores order: read the ring in place (no chronological copy)
+            filled = self._filled
+            lbuf = self._ring_l[:filled]
+            rbuf = self._ring_r[:filled]
+            rms_l = math.sqrt(float(np.dot(lbuf, lbuf)) / filled + 1e-20)
+            rms_r = math.sqrt(float(np.dot(rbuf, rbuf)) / filled + 1e-20)
             stereo_bias = (rms_r - rms_l) / (rms_r + rms_l + 1e-9)
             stereo_bias = max(-1.0, min(1.0, stereo_bias))
 
@@ -948,6 +1225,15 @@ class AudioAnalyzer:
     def spectrum_bins(self) -> int:
         return self._n_spec
 
+    @property
+    def hop_size(self) -> int:
+        return self._hop
+
+    @property
+    def hop_rate(self) -> float:
+        """Frames per second emitted by ``process_hops`` (sample_rate / hop)."""
+        return self.sample_rate / self._hop
+
     def color_for_position(self, position: str, frame: AnalysisFrame) -> tuple[int, int, int]:
         """Map light color from auto-scaled envelope levels (smooth), not raw UI meters."""
         return entertainment_color(
@@ -8,16 +8,16 @@ lâmpadas conforme a posição configurada (light_positions.json).
 
 from __future__ import annotations
 
-import json
 import os
 import subprocess
 import threading
-import time
 from typing import Any, Callable
 
 import numpy as np
 
 from marvin_hue.audio_engine import (
+    DEFAULT_BUFFER_SIZE,
+    DEFAULT_HOP_SIZE,
     DEFAULT_SPECTRUM_BINS,
     AnalyzerConfig,
     AudioAnalyzer,
@@ -26,16 +26,20 @@ from marvin_hue.audio_engine import (
 )
 from marvin_hue.basics import LightConfig
 from marvin_hue.controllers import HueController
-from marvin_hue.eye_safety import is_enabled_for_app
+from marvin_hue.eye_safety import is_enabled_for_app, runtime_policy_version
+from marvin_hue.frame_pipeline import FrameScheduler
 from marvin_hue.logging_config import get_logger
 from marvin_hue.output.port import LightFrameColor, LightOutputPort
 from marvin_hue.output.rest_adapter import RestPhueAdapter
+from marvin_hue.positions_cache import get_positions_cache
 
 logger = get_logger("audio_mirror")
 
 # party: reativo, alto contraste, fps alto, transition 0
 # chill: suave, beat baixo, hue lento
 # pulse: beat-ish, ataque rápido, transition 0
+# buffer_size/hop_size/streaming: janela FFT e análise por hop (AudioAnalyzer);
+# party/pulse usam janela menor + streaming para resposta mais rápida ao beat
 AUDIO_MIRROR_PROFILES: dict[str, dict[str, float | int]] = {
     "party": {
         "fps": 36,
@@ -47,6 +51,9 @@ AUDIO_MIRROR_PROFILES: dict[str, dict[str, float | int]] = {
         "hue_speed": 1.1,
         "attack": 0.55,
         "release": 0.12,
+        "buffer_size": 2048,
+        "hop_size": 512,
+        "streaming": True,
     },
     "chill": {
         "fps": 18,
@@ -58,6 +65,9 @@ AUDIO_MIRROR_PROFILES: dict[str, dict[str, float | int]] = {
         "hue_speed": 0.35,
         "attack": 0.32,
         "release": 0.06,
+        "buffer_size": DEFAULT_BUFFER_SIZE,
+        "hop_size": DEFAULT_HOP_SIZE,
+        "streaming": False,
     },
     "pulse": {
         "fps": 38,
@@ -69,6 +79,9 @@ AUDIO_MIRROR_PROFILES: dict[str, dict[str, float | int]] = {
         "hue_speed": 0.85,
         "attack": 0.60,
         "release": 0.14,
+        "buffer_size": 2048,
+        "hop_size": 256,
+        "streaming": True,
     },
 }
 
@@ -85,6 +98,9 @@ AUDIO_INTENSITY_PROFILES: dict[str, dict[str, float | int]] = {
         "hue_speed": 0.8,
         "attack": 0.45,
         "release": 0.10,
+        "buffer_size": DEFAULT_BUFFER_SIZE,
+        "hop_size": DEFAULT_HOP_SIZE,
+        "streaming": False,
     },
     "high": {**AUDIO_MIRROR_PROFILES["party"]},
     "extreme": {**AUDIO_MIRROR_PROFILES["pulse"]},
@@ -684,6 +700,9 @@ class AudioMirror:
         self.hue_speed = 1.0
         self.attack = 0.45
         self.release = 0.10
+        self.buffer_size = DEFAULT_BUFFER_SIZE
+        self.hop_size = DEFAULT_HOP_SIZE
+        self.streaming = False
         self.active_profile: str | None = None
         self.entertainment_area_id: str | None = None
         self.entertainment_enabled: bool = False
@@ -716,12 +735,17 @@ class AudioMirror:
                 beat_sensitivity=self.beat_sensitivity,
                 hue_speed=self.hue_speed,
                 energy_gain=self.energy_gain,
+                buffer_size=self.buffer_size,
+                hop_size=self.hop_size,
+                streaming=self.streaming,
             ),
         )
         self._last_beat: float = 0.0
         self._session_started = False
         # Cached light positions — loaded on start / explicit reload; not every frame
         self._cached_positions: list[dict[str, Any]] | None = None
+        self._cached_positions_key: tuple[int, int] | None = None
+        self._scheduler: FrameScheduler | None = None
         # LightConfig base colors: audio modulates intensity, not invents hue
         self.config_name: str | None = None
         self._base_colors: dict[str, tuple[int, int, int]] = {}
@@ -777,6 +801,9 @@ class AudioMirror:
             beat_sensitivity=float(self.beat_sensitivity),
             hue_speed=float(self.hue_speed),
             energy_gain=float(self.energy_gain),
+            buffer_size=int(self.buffer_size),
+            hop_size=int(self.hop_size),
+            streaming=bool(self.streaming),
         )
 
     def apply_profile(self, name: str) -> None:
@@ -795,37 +822,37 @@ class AudioMirror:
         Carrega lâmpadas ativas para o espelhamento de áudio.
 
         position ``none`` participa como ``ambient`` (full entertainment mix).
-        Result is cached after the first successful load; pass ``force_reload=True``
-        (or call :meth:`reload_light_positions`) to re-read the JSON file.
+        Backed by the shared mtime-driven positions cache: edits are picked up on
+        the next frame without per-frame file I/O. ``force_reload=True`` (or
+        :meth:`reload_light_positions`) re-reads the JSON file unconditionally.
         """
-        if self._cached_positions is not None and not force_reload:
+        cache = get_positions_cache(self.positions_file)
+        if force_reload:
+            cache.invalidate()
+        raw = cache.lights()
+        key = (cache.version, runtime_policy_version())
+        if (
+            self._cached_positions is not None
+            and self._cached_positions_key == key
+            and not force_reload
+        ):
             return self._cached_positions
-        try:
-            with open(self.positions_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                lights: list[dict[str, Any]] = []
-                for light in data.get("lights", []):
-                    if not light.get("enabled", True):
-                        continue
-                    name = str(light.get("name", ""))
-                    if not is_enabled_for_app(name):
-                        continue
-                    entry = dict(light)
-                    pos = str(entry.get("position") or "none")
-                    if pos == "none":
-                        entry["position"] = "ambient"
-                    lights.append(entry)
-                logger.debug(f"Audio mirror: {len(lights)} active lights")
-                self._cached_positions = lights
-                return lights
-        except FileNotFoundError:
-            logger.warning(f"Positions file not found: {self.positions_file}")
-            self._cached_positions = []
-            return []
-        except json.JSONDecodeError as e:
-            logger.exception(f"Error parsing positions file: {e}")
-            self._cached_positions = []
-            return []
+        lights: list[dict[str, Any]] = []
+        for light in raw:
+            if not light.get("enabled", True):
+                continue
+            name = str(light.get("name", ""))
+            if not is_enabled_for_app(name):
+                continue
+            entry = dict(light)
+            pos = str(entry.get("position") or "none")
+            if pos == "none":
+                entry["position"] = "ambient"
+            lights.append(entry)
+        logger.debug(f"Audio mirror: {len(lights)} active lights")
+        self._cached_positions = lights
+        self._cached_positions_key = key
+        return lights
 
     def reload_light_positions(self) -> list[dict[str, Any]]:
         """Invalidate cache and reload positions from disk."""
@@ -941,7 +968,14 @@ class AudioMirror:
         if sample_rate != self._analyzer.sample_rate:
             self._analyzer.set_sample_rate(sample_rate)
 
-        frame = self._analyzer.process(samples)
+        if self._analyzer.config.streaming:
+            # One analysis per hop; lights follow the newest (envelopes saw all)
+            frames = self._analyzer.process_hops(samples)
+            if not frames:
+                return
+            frame = frames[-1]
+        else:
+            frame = self._analyzer.process(samples)
         beat = float(frame.beat)
         self._last_beat = beat
         # UI spectrum: reactive meters + multi-bar log spectrum from analyzer
@@ -1087,8 +1121,8 @@ class AudioMirror:
                     f"Audio stream open device={device} rate={sample_rate} "
                     f"channels={channels} block={block} pulse_source={pulse_source!r}"
                 )
+                scheduler = self._scheduler = FrameScheduler(self.fps)
                 while self.running:
-                    start = time.time()
                     try:
                         data, overflowed = stream.read(block)
                         if overflowed:
@@ -1102,10 +1136,8 @@ class AudioMirror:
                     except Exception as frame_exc:
                         logger.debug(f"Audio frame error: {frame_exc}")
 
-                    frame_time = 1.0 / max(1, self.fps)
-                    elapsed = time.time() - start
-                    if elapsed < frame_time:
-                        time.sleep(frame_time - elapsed)
+                    scheduler.set_fps(max(1, self.fps))
+                    scheduler.wait()
         except Exception as exc:
             logger.exception(f"Audio mirror stream failed: {exc}")
             self.running = False
@@ -1209,6 +1241,7 @@ class AudioMirror:
             self._pulse_source = None
             raise RuntimeError(f"Falha ao iniciar transporte de saída: {e}") from e
 
+        self._scheduler = None
         self.running = True
         self.thread = threading.Thread(target=self._mirror_loop, daemon=True)
         self.thread.start()
@@ -1268,6 +1301,9 @@ class AudioMirror:
             "energy_gain": self.energy_gain,
             "beat_sensitivity": self.beat_sensitivity,
             "hue_speed": self.hue_speed,
+            "buffer_size": self.buffer_size,
+            "hop_size": self.hop_size,
+            "streaming": self.streaming,
             "active_profile": self.active_profile,
             "colors": self._current_colors.copy(),
             "sample_rate": self._sample_rate,
@@ -1288,6 +1324,7 @@ class AudioMirror:
                 False
             ),
             "config_name": self.config_name,
+            "timing": self._scheduler.stats() if self._scheduler else None,
         }
 
     def set_status_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
@@ -0,0 +1,179 @@
+"""
+Group actions da Hue Bridge (REST v1) para escritas em lote.
+
+Um preset com N lâmpadas no mesmo estado custa N PUTs em ``/lights``; um
+``PUT /groups/<id>/action`` aplica o mesmo corpo a todas de uma vez.
+``BridgeGroups`` resolve um conjunto de lâmpadas para um grupo com
+exatamente esses membros:
+
+* grupo ``0`` (todas as lâmpadas da bridge) quando o conjunto é completo;
+* um grupo existente com os mesmos membros (rooms/zones do app Hue);
+* só se habilitado (``max_created > 0``), um ``LightGroup`` criado uma vez e
+  reutilizado (``marvin-…``), até ``max_created`` grupos próprios.
+
+Por padrão nada é criado: escritas comuns não alteram a configuração da
+bridge. ``delete_created()`` remove os grupos ``marvin-…``.
+
+Sem grupo disponível (ou se a action falhar) o chamador volta ao PUT por
+lâmpada.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Any, Iterable
+
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("bridge_groups")
+
+# Prefixo dos grupos criados pelo app (identifica os próprios ao recarregar)
+GROUP_PREFIX = "marvin-"
+
+# Limite de grupos próprios quando a criação está habilitada (a bridge aceita
+# ~64 grupos no total)
+DEFAULT_MAX_CREATED = 8
+
+# Grupo especial da API v1 que contém todas as lâmpadas
+ALL_LIGHTS_GROUP = "0"
+
+
+def group_name(light_ids: Iterable[str]) -> str:
+    """Nome estável (<= 32 chars) do grupo próprio para um conjunto de ids."""
+    key = ",".join(sorted(light_ids, key=lambda i: (len(i), i)))
+    return GROUP_PREFIX + hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+
+
+def response_ok(response: Any) -> bool:
+    """Resposta REST v1 de escrita: ``[{"success": ...}, ...]`` sem nenhum ``error``."""
+    if not isinstance(response, list) or not response:
+        return False
+    return all(isinstance(entry, dict) and "success" in entry for entry in response)
+
+
+def response_error(response: Any) -> str | None:
+    """Descrição do primeiro ``error`` de uma resposta REST v1 (``None`` se não há)."""
+    if not isinstance(response, list):
+        return None
+    for entry in response:
+        if isinstance(entry, dict) and "error" in entry:
+            error = entry["error"]
+            if isinstance(error, dict):
+                return str(error.get("description", error))
+            return str(error)
+    return None
+
+
+def _action_succeeded(result: Any) -> bool:
+    """Resposta de ``set_group``: uma resposta REST por grupo."""
+    return isinstance(result, list) and bool(result) and all(map(response_ok, result))
+
+
+class BridgeGroups:
+    """
+    Mapeia conjuntos de lâmpadas para grupos da bridge e envia group actions.
+
+    A lista de grupos é lida uma vez (``GET /groups``) e mantida em cache até
+    ``invalidate()`` (ex.: ``HueController.refresh_lights``).
+
+    Example:
+        >>> groups = BridgeGroups(bridge)
+        >>> gid = groups.resolve(["1", "2", "5"], all_ids=["1", "2", "3", "5"])
+        >>> groups.action(gid, {"on": True, "bri": 200})
+        True
+    """
+
+    def __init__(self, bridge: Any, *, max_created: int = 0) -> None:
+        self.bridge = bridge
+        self.max_created = max(0, int(max_created))
+        self._by_lights: dict[frozenset[str], str] | None = None
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[frozenset[str], str]:
+        groups = self.bridge.get_group()
+        by_lights: dict[frozenset[str], str] = {}
+        created = 0
+        if isinstance(groups, dict):
+            for gid, group in groups.items():
+                if not isinstance(group, dict):
+                    continue
+                lights = group.get("lights")
+                if str(group.get("name", "")).startswith(GROUP_PREFIX):
+                    created += 1
+                if isinstance(lights, list) and lights:
+                    by_lights.setdefault(frozenset(str(i) for i in lights), str(gid))
+        self._created = created
+        return by_lights
+
+    def _create(self, key: frozenset[str]) -> str | None:
+        ids = sorted(key, key=lambda i: (len(i), i))
+        result = self.bridge.create_group(group_name(ids), ids)
+        try:
+            gid = str(result[0]["success"]["id"])
+        except (KeyError, IndexError, TypeError):
+            logger.debug(f"Bridge refused group for lights {ids}: {result}")
+            return None
+        self._created += 1
+        logger.info(f"Created bridge group {gid} for lights {ids}")
+        return gid
+
+    def resolve(self, light_ids: Iterable[Any], *, all_ids: Iterable[Any]) -> str | None:
+        """Id do grupo com exatamente ``light_ids``; ``None`` se não houver/puder criar."""
+        key = frozenset(str(i) for i in light_ids)
+        if len(key) < 2:
+            return None
+        if key == frozenset(str(i) for i in all_ids):
+            return ALL_LIGHTS_GROUP
+        with self._lock:
+            if self._by_lights is None:
+                self._by_lights = self._load()
+            gid = self._by_lights.get(key)
+            if gid is not None:
+                return gid
+            if self._created >= self.max_created:
+                return None
+            gid = self._create(key)
+            if gid is not None:
+                self._by_lights[key] = gid
+            return gid
+
+    def cached(self, light_ids: Iterable[Any], *, all_ids: Iterable[Any]) -> str | None:
+        """Como :meth:`resolve`, mas só com o que já está em memória (sem I/O)."""
+        key = frozenset(str(i) for i in light_ids)
+        if len(key) < 2:
+            return None
+        if key == frozenset(str(i) for i in all_ids):
+            return ALL_LIGHTS_GROUP
+        with self._lock:
+            return None if self._by_lights is None else self._by_lights.get(key)
+
+    def action(self, group_id: str, body: dict[str, Any]) -> bool:
+        """``PUT /groups/<id>/action`` com ``body``; ``True`` se a bridge confirmou."""
+        result = self.bridge.set_group(int(group_id), dict(body))
+        return _action_succeeded(result)
+
+    def invalidate(self) -> None:
+        """Relê os grupos da bridge na próxima resolução."""
+        with self._lock:
+            self._by_lights = None
+
+    def delete_created(self) -> int:
+        """Apaga da bridge os grupos ``marvin-…`` criados pelo app; retorna quantos."""
+        with self._lock:
+            groups = self.bridge.get_group()
+            deleted = 0
+            if isinstance(groups, dict):
+                for gid, group in list(groups.items()):
+                    if not isinstance(group, dict):
+                        continue
+                    if not str(group.get("name", "")).startswith(GROUP_PREFIX):
+                        continue
+                    if response_ok(self.bridge.delete_group(int(gid))):
+                        deleted += 1
+                        logger.info(f"Deleted bridge group {gid} ({group.get('name')})")
+                    else:
+                        logger.warning(f"Bridge refused to delete group {gid}")
+            self._by_lights = None
+            return deleted
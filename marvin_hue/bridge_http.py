@@ -0,0 +1,124 @@
+"""
+Transporte HTTP keep-alive para a Hue Bridge (REST v1 via phue).
+
+``phue.Bridge.request`` abre e fecha uma ``HTTPConnection`` por chamada: cada
+PUT paga um handshake TCP. ``KeepAliveTransport`` mantém uma conexão
+persistente por thread (o pool de workers do RestPhueAdapter reutiliza as
+suas) com a mesma assinatura ``request(mode, address, data)``. Com um
+``RestWriteLimiter`` em ``transport.limiter``, toda escrita espera um token.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import threading
+from typing import TYPE_CHECKING, Any
+
+from phue import PhueRequestTimeout
+
+from marvin_hue.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from marvin_hue.bridge_limiter import RestWriteLimiter
+
+logger = get_logger("bridge_http")
+
+# Falhas de uma conexão keep-alive que a bridge fechou: reconecta uma vez
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.ResponseNotReady,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Métodos que escrevem na bridge (passam pelo limitador de taxa)
+_WRITE_METHODS = frozenset({"PUT", "POST", "DELETE"})
+
+
+class KeepAliveTransport:
+    """
+    ``request`` compatível com phue sobre conexões HTTP/1.1 persistentes.
+
+    Uma conexão por thread (``threading.local``): ``http.client`` não é
+    thread-safe, e cada worker do fan-out REST fica com a sua.
+
+    Example:
+        >>> transport = KeepAliveTransport("192.168.1.100")
+        >>> transport.request("GET", "/api/<user>/lights")
+    """
+
+    def __init__(self, host: str, timeout: float = 10.0) -> None:
+        self.host = host
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.limiter: RestWriteLimiter | None = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, timeout=self.timeout)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+
+    def request(self, mode: str = "GET", address: str | None = None, data: Any = None) -> Any:
+        """Mesmo contrato de ``phue.Bridge.request`` (retorna o JSON decodificado)."""
+        body = json.dumps(data) if mode in ("PUT", "POST") else None
+        if self.limiter is not None and mode in _WRITE_METHODS:
+            self.limiter.acquire()
+        for attempt in (0, 1):
+            conn = self._connection()
+            try:
+                conn.request(mode, address or "/", body)
+                response = conn.getresponse()
+                payload = response.read()
+                if response.will_close:
+                    self._drop_connection()
+                break
+            except socket.timeout as e:
+                self._drop_connection()
+                error = f"{mode} Request to {self.host}{address} timed out."
+                logger.warning(error)
+                raise PhueRequestTimeout(None, error) from e
+            except _STALE_CONNECTION_ERRORS:
+                self._drop_connection()
+                if attempt:
+                    raise
+                logger.debug(f"Bridge keep-alive connection dropped; reconnecting ({mode} {address})")
+        return json.loads(payload.decode("utf-8"))
+
+    def close(self) -> None:
+        """Fecha todas as conexões abertas (de todas as threads)."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+
+def install_keepalive(bridge: Any, timeout: float = 10.0) -> KeepAliveTransport | None:
+    """
+    Troca ``bridge.request`` pelo transporte keep-alive (no próprio objeto).
+
+    Ignora objetos sem ``ip`` string (ex.: mocks em testes).
+    """
+    host = getattr(bridge, "ip", None)
+    if not isinstance(host, str) or not host:
+        return None
+    transport = KeepAliveTransport(host, timeout=timeout)
+    bridge.request = transport.request
+    return transport
@@ -0,0 +1,315 @@
+"""
+Limitador de escrita REST para a Hue Bridge (token bucket + coalescência).
+
+A bridge aguenta ~10 comandos de lâmpada por segundo; acima disso enfileira
+internamente e o efeito chega com segundos de atraso. ``RestWriteLimiter``
+fica na frente de todas as escritas REST:
+
+* ``acquire()`` — escritas síncronas (presets, tools, property setters do
+  phue) esperam um token do bucket antes do PUT;
+* ``submit(key, fn)`` — escritas de streaming (mirrors via REST) não
+  bloqueiam: o comando pendente de cada lâmpada é substituído pelo mais novo
+  (last-write-wins) e um dispatcher envia no ritmo do bucket.
+
+Os contadores (``coalesced``, ``dropped``, ``throttled``...) aparecem em
+``/api/health``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("bridge_limiter")
+
+# Limite documentado da bridge para comandos /lights
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """
+    Token bucket com reserva: ``reserve()`` consome um token e retorna quanto
+    o chamador deve esperar (0 se havia saldo).
+
+    O saldo pode ficar negativo, então chamadores concorrentes ficam em fila
+    na ordem de reserva em vez de competir pelo mesmo token.
+
+    Example:
+        >>> bucket = TokenBucket(rate=10, burst=2)
+        >>> bucket.reserve(), bucket.reserve(), bucket.reserve()
+        (0.0, 0.0, 0.1)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate deve ser > 0: {rate}")
+        self.rate = float(rate)
+        self.burst = float(max(1, int(burst)))
+        self._clock = clock
+        self._tokens = self.burst
+        self._stamp = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def reserve(self) -> float:
+        """Consome um token; retorna a espera em segundos até ele valer."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self) -> None:
+        """Devolve um token reservado e não usado."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1.0)
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RestWriteLimiter:
+    """
+    Token bucket compartilhado por todas as escritas REST + coalescedor por
+    lâmpada para o streaming dos mirrors.
+
+    ``submit`` guarda no máximo um comando pendente por ``key`` (nome da
+    lâmpada); um comando ainda não enviado é descartado quando chega outro
+    para a mesma lâmpada (``coalesced``). O dispatcher pega um token, retira
+    o comando pendente mais antigo cuja lâmpada não tem PUT em voo e o executa
+    num pool de ``max_in_flight`` workers. O comando executado já tem o seu
+    token: o ``acquire()`` que ele dispara no transporte passa direto.
+
+    Example:
+        >>> limiter = RestWriteLimiter(rate=10, burst=10)
+        >>> limiter.submit("Sala", lambda: hue.set_light_state("Sala", color))
+        >>> limiter.stats()["coalesced"]
+        0
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        *,
+        max_in_flight: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.bucket = TokenBucket(rate, burst, clock=clock)
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._sleep = sleep
+        self._pending: OrderedDict[Hashable, Callable[[], Any]] = OrderedDict()
+        self._in_flight: set[Hashable] = set()
+        self._cond = threading.Condition()
+        self._slots = threading.Semaphore(self.max_in_flight)
+        self._local = threading.local()
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._closed = False
+
+        self.submitted = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.throttled = 0
+        self.errors = 0
+
+    # ------------------------------------------------------------------
+    # Escritas síncronas
+    # ------------------------------------------------------------------
+
+    def acquire(self) -> None:
+        """Bloqueia até haver token para uma escrita (no-op em comandos já despachados)."""
+        if getattr(self._local, "prepaid", False):
+            # Um token por comando despachado (ver _dispatch)
+            self._local.prepaid = False
+            return
+        delay = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+
+    def reserve(self) -> float:
+        """Reserva um token sem dormir; retorna a espera (s) — para chamadores async."""
+        delay = self.bucket.reserve()
+        if delay > 0:
+            with self._cond:
+                self.throttled += 1
+        return delay
+
+    # ------------------------------------------------------------------
+    # Streaming (coalescência por lâmpada)
+    # ------------------------------------------------------------------
+
+    def submit(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        """Agenda ``fn`` para ``key`` sem bloquear; substitui o pendente da mesma key."""
+        with self._cond:
+            if self._closed:
+                self.dropped += 1
+                return
+            self.submitted += 1
+            if key in self._pending:
+                # Last-write-wins: o comando antigo nunca chega à bridge
+                self.coalesced += 1
+            self._pending[key] = fn
+            self._ensure_dispatcher()
+            self._cond.notify_all()
+
+    def discard(self, keys: Any = None) -> int:
+        """Descarta comandos pendentes (de ``keys`` ou todos); retorna quantos."""
+        with self._cond:
+            targets = list(self._pending) if keys is None else [k for k in keys if k in self._pending]
+            for key in targets:
+                del self._pending[key]
+            self.dropped += len(targets)
+            return len(targets)
+
+    def flush(self, timeout: float | None = None, keys: Any = None) -> bool:
+        """
+        Espera a fila e os PUTs em voo (de ``keys`` ou todos) esvaziarem.
+
+        Retorna ``False`` se o timeout expirou.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        wanted = None if keys is None else set(keys)
+
+        def busy() -> bool:
+            if wanted is None:
+                return bool(self._pending or self._in_flight)
+            return any(k in wanted for k in self._pending) or bool(
+                self._in_flight & wanted
+            )
+
+        with self._cond:
+            while busy():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _ensure_dispatcher(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="hue-rest-limiter", daemon=True
+            )
+            self._thread.start()
+
+    def _next_ready(self) -> Hashable | None:
+        # Ordem de chegada, pulando lâmpadas com PUT em voo (preserva a ordem
+        # por lâmpada mesmo com vários workers)
+        for key in self._pending:
+            if key not in self._in_flight:
+                return key
+        return None
+
+    def _run(self) -> None:
+        while True:
+            self._slots.acquire()
+            with self._cond:
+                while not self._closed and self._next_ready() is None:
+                    self._cond.wait()
+                if self._closed:
+                    self._slots.release()
+                    return
+            # Token antes de retirar o comando: o que chegar durante a espera
+            # ainda é coalescido
+            delay = self.bucket.reserve()
+            if delay > 0:
+                self._sleep(delay)
+            with self._cond:
+                key = self._next_ready()
+                if key is None or self._closed:
+                    self.bucket.refund()
+                    self._slots.release()
+                    if self._closed:
+                        return
+                    continue
+                fn = self._pending.pop(key)
+                self._in_flight.add(key)
+            self._executor().submit(self._dispatch, key, fn)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_in_flight, thread_name_prefix="hue-rest"
+            )
+        return self._pool
+
+    def _dispatch(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        self._local.prepaid = True
+        failed = False
+        try:
+            fn()
+        except Exception as e:
+            failed = True
+            logger.debug(f"Rate-limited REST write for '{key}' failed: {e}")
+        finally:
+            self._local.prepaid = False
+            with self._cond:
+                self._in_flight.discard(key)
+                self.sent += 1
+                if failed:
+                    self.errors += 1
+                self._cond.notify_all()
+            self._slots.release()
+
+    def close(self) -> None:
+        """Para o dispatcher; comandos ainda pendentes contam como ``dropped``."""
+        with self._cond:
+            self._closed = True
+            self.dropped += len(self._pending)
+            self._pending.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def stats(self) -> dict[str, Any]:
+        """Contadores para /api/health."""
+        with self._cond:
+            return {
+                "enabled": True,
+                "rate": self.bucket.rate,
+                "burst": int(self.bucket.burst),
+                "submitted": self.submitted,
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "pending": len(self._pending),
+                "in_flight": len(self._in_flight),
+            }
+
+
+def build_rest_limiter(
+    rate: float, burst: int, *, max_in_flight: int = 4
+) -> RestWriteLimiter | None:
+    """Limitador a partir das settings; ``rate <= 0`` desliga (retorna ``None``)."""
+    if rate <= 0:
+        return None
+    return RestWriteLimiter(rate, burst, max_in_flight=max_in_flight)
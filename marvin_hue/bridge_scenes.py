@@ -0,0 +1,177 @@
+"""
+Presets materializados como cenas nativas da Hue Bridge (REST v1).
+
+Aplicar um preset lâmpada a lâmpada custa um PUT por lâmpada; uma cena
+gravada na bridge é recuperada com um único ``PUT /groups/0/action
+{"scene": id}``, com latência quase constante.
+
+As cenas são endereçadas por conteúdo: o hash (16 hex) dos ``lightstates``
+finais do preset — já com clamp ocular e lâmpadas desabilitadas excluídas —
+vai em ``appdata.data`` da cena. Um sync só envia presets cujo hash ainda
+não existe na bridge e remove as cenas próprias que nenhum preset usa mais.
+Na aplicação o hash é recalculado: se o preset ou a política mudou desde o
+sync, não há cena com esse hash e o controller volta ao caminho por lâmpada.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any
+
+from marvin_hue.bridge_groups import ALL_LIGHTS_GROUP, response_ok
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("bridge_scenes")
+
+# Prefixo das cenas criadas pelo app (nome da cena: até 32 caracteres)
+SCENE_PREFIX = "marvin:"
+_SCENE_NAME_MAX = 32
+
+# ``appdata.data`` da API v1 aceita até 16 caracteres
+HASH_LENGTH = 16
+
+
+def scene_content_hash(lightstates: dict[str, dict[str, Any]]) -> str:
+    """Hash estável dos estados por lâmpada (``{light_id: body}``)."""
+    payload = json.dumps(lightstates, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def scene_name(preset_name: str) -> str:
+    """Nome da cena na bridge para um preset (truncado ao limite da API)."""
+    return (SCENE_PREFIX + preset_name)[:_SCENE_NAME_MAX]
+
+
+def recall_body(scene_id: str, transition_time: int | None = None) -> dict[str, Any]:
+    """Corpo do ``PUT /groups/0/action`` que recupera a cena ``scene_id``."""
+    body: dict[str, Any] = {"scene": scene_id}
+    if transition_time is not None:
+        body["transitiontime"] = max(0, int(transition_time))
+    return body
+
+
+class BridgeSceneStore:
+    """
+    Índice ``hash -> scene_id`` das cenas próprias + upload/recall/sync.
+
+    O índice é lido uma vez (``GET /scenes``) e refeito a cada ``sync``.
+
+    Example:
+        >>> store = BridgeSceneStore(bridge)
+        >>> store.sync({"relax": {"1": {"on": True, "xy": [0.5, 0.4], "bri": 120}}})
+        {'uploaded': ['relax'], 'unchanged': [], 'deleted': 0, 'failed': []}
+        >>> store.recall(store.scene_for(scene_content_hash(...)))
+        True
+    """
+
+    def __init__(self, bridge: Any) -> None:
+        self.bridge = bridge
+        self._by_hash: dict[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def _api(self, path: str) -> str:
+        return f"/api/{self.bridge.username}{path}"
+
+    def _load(self) -> dict[str, str]:
+        scenes = self.bridge.request("GET", self._api("/scenes"))
+        by_hash: dict[str, str] = {}
+        if isinstance(scenes, dict):
+            for scene_id, scene in scenes.items():
+                if not isinstance(scene, dict):
+                    continue
+                if not str(scene.get("name", "")).startswith(SCENE_PREFIX):
+                    continue
+                data = (scene.get("appdata") or {}).get("data")
+                if isinstance(data, str) and data:
+                    by_hash[data] = str(scene_id)
+        return by_hash
+
+    def _index(self) -> dict[str, str]:
+        if self._by_hash is None:
+            self._by_hash = self._load()
+        return self._by_hash
+
+    @property
+    def loaded(self) -> bool:
+        """Índice de cenas já lido (``scene_for`` não faz I/O)."""
+        return self._by_hash is not None
+
+    def scene_for(self, content_hash: str) -> str | None:
+        """Cena com exatamente esse conteúdo, se já materializada."""
+        with self._lock:
+            return self._index().get(content_hash)
+
+    def upload(
+        self, preset_name: str, lightstates: dict[str, dict[str, Any]], content_hash: str
+    ) -> str | None:
+        """Cria a cena (``POST /scenes`` com ``lightstates``); retorna o id."""
+        data = {
+            "name": scene_name(preset_name),
+            "type": "LightScene",
+            "lights": sorted(lightstates, key=lambda i: (len(i), i)),
+            "recycle": False,
+            "lightstates": lightstates,
+            "appdata": {"version": 1, "data": content_hash},
+        }
+        result = self.bridge.request("POST", self._api("/scenes"), data)
+        try:
+            return str(result[0]["success"]["id"])
+        except (KeyError, IndexError, TypeError):
+            logger.warning(f"Bridge refused scene for preset '{preset_name}': {result}")
+            return None
+
+    def delete(self, scene_id: str) -> bool:
+        return response_ok(self.bridge.request("DELETE", self._api(f"/scenes/{scene_id}")))
+
+    def recall(self, scene_id: str, transition_time: int | None = None) -> bool:
+        """Uma chamada: ``PUT /groups/0/action {"scene": id}``."""
+        result = self.bridge.request(
+            "PUT",
+            self._api(f"/groups/{ALL_LIGHTS_GROUP}/action"),
+            recall_body(scene_id, transition_time),
+        )
+        return response_ok(result)
+
+    def sync(self, presets: dict[str, dict[str, dict[str, Any]]]) -> dict[str, Any]:
+        """
+        Materializa ``{preset: lightstates}``; só envia o que mudou.
+
+        Returns:
+            dict: ``uploaded``/``unchanged``/``failed`` (nomes) e ``deleted`` (qtd)
+        """
+        with self._lock:
+            index = self._load()
+            wanted: dict[str, str] = {}
+            summary: dict[str, Any] = {"uploaded": [], "unchanged": [], "deleted": 0, "failed": []}
+            for name, states in presets.items():
+                content_hash = scene_content_hash(states)
+                if content_hash in index:
+                    summary["unchanged"].append(name)
+                    wanted[name] = content_hash
+                    continue
+                scene_id = self.upload(name, states, content_hash)
+                if scene_id is None:
+                    summary["failed"].append(name)
+                    continue
+                index[content_hash] = scene_id
+                wanted[name] = content_hash
+                summary["uploaded"].append(name)
+
+            live = set(wanted.values())
+            for content_hash in [h for h in index if h not in live]:
+                if self.delete(index[content_hash]):
+                    summary["deleted"] += 1
+                del index[content_hash]
+            self._by_hash = index
+        logger.info(
+            f"Scene sync: {len(summary['uploaded'])} uploaded, "
+            f"{len(summary['unchanged'])} unchanged, {summary['deleted']} deleted"
+        )
+        return summary
+
+    def invalidate(self) -> None:
+        """Relê as cenas da bridge na próxima consulta."""
+        with self._lock:
+            self._by_hash = None
@@ -22,6 +22,14 @@ class Settings(BaseSettings):
     Attributes:
         bridge_ip: Endereço IP do Philips Hue Bridge (obrigatório)
         bridge_timeout: Timeout em segundos para operações com a bridge
+        rest_max_in_flight: PUTs REST simultâneos por frame no transporte REST
+        rest_rate_limit: Comandos REST por segundo (token bucket; 0 desliga)
+        rest_burst: Rajada máxima de comandos REST acima da taxa
+        rest_group_actions: Lâmpadas com estado idêntico num único PUT de grupo
+        rest_group_create: Permite criar grupos ``marvin-…`` na bridge para isso
+        scene_sync: Presets materializados como cenas da bridge (recall em uma chamada)
+        light_state_ttl: Validade (s) do cache de estado das lâmpadas (0 desliga)
+        light_events: Status mantido pelo event stream v2 da bridge (SSE)
 
         api_key: API key opcional para autenticação
         cors_origins: Lista de origens permitidas para CORS (separadas por vírgula em .env)
@@ -51,6 +59,49 @@ class Settings(BaseSettings):
         le=60,
         description="Timeout em segundos para operações com a bridge",
     )
+    rest_max_in_flight: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Máximo de PUTs REST simultâneos por frame do mirror (1 = serial)",
+    )
+    rest_rate_limit: float = Field(
+        default=10.0,
+        ge=0,
+        le=100,
+        description="Comandos REST por segundo para a bridge (token bucket; 0 desliga)",
+    )
+    rest_burst: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Rajada máxima de comandos REST antes de aplicar a taxa",
+    )
+    rest_group_actions: bool = Field(
+        default=True,
+        description="Presets/set_all: lâmpadas com estado idêntico via group action da bridge",
+    )
+    rest_group_create: bool = Field(
+        default=False,
+        description=(
+            "Group actions podem criar LightGroups marvin-… na bridge "
+            "(senão só grupo 0 e rooms/zones existentes)"
+        ),
+    )
+    scene_sync: bool = Field(
+        default=False,
+        description="Sincroniza presets como cenas nativas da bridge e aplica via recall",
+    )
+    light_state_ttl: float = Field(
+        default=2.0,
+        ge=0,
+        le=60,
+        description="Segundos de validade do status em lote (GET /lights); 0 desliga o cache",
+    )
+    light_events: bool = Field(
+        default=False,
+        description="Assina o event stream v2 (SSE) da bridge e serve o status por eventos",
+    )
 
     # --- Hue Entertainment (DTLS stream); optional ---
     entertainment_enabled: bool = Field(
@@ -77,7 +128,23 @@ class Settings(BaseSettings):
         default=40,
         ge=10,
         le=60,
-        description="Target Entertainment stream FPS when transport=entertainment",
+        description=(
+            "Entertainment stream rate (fixed clock, interpolated between "
+            "analysis frames); also the analysis FPS default without profile"
+        ),
+    )
+    entertainment_interpolation: Literal["linear", "cubic", "spring"] = Field(
+        default="linear",
+        description="Upsampling of analysis frames to the Entertainment stream rate",
+    )
+    entertainment_analysis_fps: int | None = Field(
+        default=None,
+        ge=1,
+        le=60,
+        description=(
+            "Analysis FPS default on Entertainment without profile "
+            "(None = ENTERTAINMENT_FPS); lower saves CPU, the stream interpolates"
+        ),
     )
 
     # API Configuration
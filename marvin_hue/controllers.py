@@ -1,9 +1,22 @@
+import json
 from typing import Any
 from phue import Bridge, Light
 
 from marvin_hue.colors import Color
 from marvin_hue.basics import LightConfig
+from marvin_hue.bridge_groups import (
+    DEFAULT_MAX_CREATED,
+    BridgeGroups,
+    response_error,
+    response_ok,
+)
+from marvin_hue.bridge_http import install_keepalive
+from marvin_hue.bridge_limiter import RestWriteLimiter
+from marvin_hue.bridge_scenes import BridgeSceneStore, scene_content_hash
 from marvin_hue.eye_safety import clamp_eye_safety, is_enabled_for_app
+from marvin_hue.gamut import GamutRegistry
+from marvin_hue.light_events import LightEventStream
+from marvin_hue.light_state import DEFAULT_TTL, LightStateCache
 from marvin_hue.utils import RGBtoXYAdapter, ColorConverter
 from marvin_hue.logging_config import get_logger
 
@@ -17,14 +30,37 @@ class HueController:
     Attributes:
         bridge: Instância da conexão com a bridge
         lights: Lista de objetos Light disponíveis
+        gamuts: Triângulo de gamut (A/B/C) por lâmpada, lido na conexão
+        rest_limiter: Token bucket das escritas REST (``None`` = sem limite)
+        state_cache: Snapshot de ``GET /lights`` com TTL (``None`` = sem cache)
+        light_events: Assinatura SSE v2 que mantém ``state_cache`` ao vivo (opcional)
+
+    Planejamento sem I/O (``config_transition``, ``plan_light_config``,
+    ``scene_plan``, ``target_light``) e o write-through ``note_write`` são
+    públicos: o ``AsyncHueController`` usa os mesmos passos e só troca o I/O.
     """
 
-    def __init__(self, ip_address: str):
+    def __init__(
+        self,
+        ip_address: str,
+        *,
+        rest_limiter: RestWriteLimiter | None = None,
+        group_actions: bool = True,
+        group_create: bool = False,
+        scene_recall: bool = False,
+        state_ttl: float = DEFAULT_TTL,
+    ):
         """
         Inicializa o controlador.
 
         Args:
             ip_address: Endereço IP da Philips Hue Bridge
+            rest_limiter: Limitador opcional aplicado a todo PUT/POST/DELETE
+            group_actions: Lâmpadas com estado idêntico num único PUT de grupo
+            group_create: Permite criar grupos ``marvin-…`` na bridge quando não
+                há grupo 0/room/zone com os mesmos membros
+            scene_recall: Presets sincronizados como cenas da bridge (uma chamada)
+            state_ttl: Validade (s) do cache de estado das lâmpadas; 0 desliga
 
         Raises:
             ValueError: Se o IP for inválido
@@ -36,19 +72,54 @@ class HueController:
         logger.info(f"Initializing Hue Controller with bridge IP: {ip_address}")
         try:
             self.bridge = Bridge(ip_address)
+            # OPTIMIZATION: Keep-alive - reusa conexões HTTP por thread
+            self._transport = install_keepalive(self.bridge)
+            self.rest_limiter = rest_limiter
+            if self._transport is not None:
+                self._transport.limiter = rest_limiter
+            self._groups = (
+                BridgeGroups(
+                    self.bridge,
+                    max_created=DEFAULT_MAX_CREATED if group_create else 0,
+                )
+                if group_actions
+                else None
+            )
+            self._scenes = BridgeSceneStore(self.bridge) if scene_recall else None
+            # OPTIMIZATION: Status em lote - um GET /lights em vez de ~5 GETs por lâmpada
+            self.state_cache = (
+                LightStateCache(lambda: self.bridge.get_light(), state_ttl)
+                if state_ttl > 0
+                else None
+            )
+            self.light_events: LightEventStream | None = None
             self.bridge.connect()
             self.lights = self.bridge.get_light_objects()
             self._light_cache: dict[str, Light] = {}
             self._refresh_cache()
+            # OPTIMIZATION: Gamut cache - capabilities lidas uma vez por conexão
+            self.gamuts = GamutRegistry.from_bridge(self.bridge)
             logger.info(f"Connected to Hue Bridge. Found {len(self.lights)} lights")
         except Exception as e:
             logger.error(f"Erro ao conectar à bridge {ip_address}: {e}")
             raise ConnectionError(f"Não foi possível conectar à bridge Hue: {e}") from e
 
+    @property
+    def groups(self) -> BridgeGroups | None:
+        """Resolvedor de group actions (``None`` = desabilitado)."""
+        return self._groups
+
+    @property
+    def scenes(self) -> BridgeSceneStore | None:
+        """Índice de cenas próprias para recall (``None`` = desabilitado)."""
+        return self._scenes
+
     def set_light_color(self, light_name: str, color: Color) -> Light:
         """
         Define a cor de uma lâmpada específica.
 
+        Envia ``xy`` e ``bri`` num único PUT (ver :meth:`set_light_state`).
+
         Args:
             light_name: Nome da lâmpada
             color: Objeto Color com RGB e brightness
@@ -62,9 +133,111 @@ class HueController:
         logger.debug(
             f"Setting light '{light_name}' to RGB({color.red}, {color.green}, {color.blue}), brightness={color.brightness}"
         )
+        return self.set_light_state(light_name, color)
+
+    def light_state_body(
+        self,
+        light_name: str,
+        color: Color | None = None,
+        *,
+        on: bool | None = None,
+        transition_time: int | None = None,
+        xy: tuple[float, float] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Corpo ``/lights/<id>/state`` combinado: ``{on, xy, bri, transitiontime}``.
+
+        Só inclui os campos informados. ``bri`` já sai clampado pelo
+        invariante ocular; ``transition_time`` em décimos de segundo. ``xy``
+        pré-calculado e já no gamut da lâmpada (ex.: frame convertido e
+        clampado em lote pelo RestPhueAdapter) dispensa conversão e clamp.
+        """
+        body: dict[str, Any] = {}
+        if on is not None:
+            body["on"] = bool(on)
+        if color is not None:
+            if xy is None:
+                # Converte RGB para XY (já validado em RGBtoXYAdapter)
+                xy = RGBtoXYAdapter.convert(color.red, color.green, color.blue)
+                xy = self._xy_in_gamut(light_name, xy)
+
+            # Invariante ocular (defesa em profundidade): clampa o brilho na
+            # ORIGEM, cobrindo presets (apply_light_config -> set_light_state),
+            # screen-mirror e tools diretas. Escala "hue" (0-254).
+            body["xy"] = [float(xy[0]), float(xy[1])]
+            body["bri"] = clamp_eye_safety(light_name, color.brightness, scale="hue")
+        if transition_time is not None:
+            body["transitiontime"] = max(0, int(transition_time))
+        return body
+
+    def set_light_state(
+        self,
+        light_name: str,
+        color: Color | None = None,
+        *,
+        on: bool | None = None,
+        transition_time: int | None = None,
+        xy: tuple[float, float] | None = None,
+    ) -> Light:
+        """
+        Escreve o estado de uma lâmpada num único PUT.
+
+        Substitui os setters de propriedade do phue (``light.xy``,
+        ``light.brightness``, ``light.on``, cada um um PUT próprio) por um
+        corpo combinado ``{on, xy, bri, transitiontime}``.
+
+        Args:
+            light_name: Nome da lâmpada
+            color: Cor e brilho (omitir = não altera xy/bri)
+            on: Liga/desliga (omitir = não altera)
+            transition_time: Transição em décimos de segundo (omitir = padrão Hue)
+            xy: Cromaticidade já convertida de ``color`` (omitir = converte aqui)
+
+        Returns:
+            Light: Objeto da lâmpada atualizada
 
-        # Verifica se a lâmpada existe
-        light = self._get_light_by_name(light_name)
+        Raises:
+            ValueError: Se a lâmpada não for encontrada ou estiver desabilitada
+            RuntimeError: Se a bridge falhar ou rejeitar o estado
+        """
+        light = self.target_light(light_name)
+        try:
+            body = self.light_state_body(
+                light_name, color, on=on, transition_time=transition_time, xy=xy
+            )
+            if body:
+                result = light.bridge.set_light(light.light_id, body)
+                # phue devolve uma resposta REST por lâmpada: [[{...}, ...]]
+                if (
+                    isinstance(result, list)
+                    and len(result) == 1
+                    and isinstance(result[0], list)
+                ):
+                    result = result[0]
+                error = response_error(result)
+                if error is not None:
+                    raise RuntimeError(f"Bridge rejeitou o estado: {error}")
+                # Só respostas de sucesso entram no cache (write-through)
+                if response_ok(result):
+                    self.note_write([light.light_id], body)
+            logger.debug(f"Successfully applied state to '{light_name}': {body}")
+            return light
+
+        except ValueError as e:
+            logger.error(f"Erro ao definir estado para '{light_name}': {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Erro inesperado ao definir estado para '{light_name}': {e}")
+            raise RuntimeError(f"Erro ao aplicar cor: {e}") from e
+
+    def target_light(self, light_name: str) -> Light:
+        """
+        Lâmpada para uma escrita.
+
+        Raises:
+            ValueError: Se a lâmpada não existe ou está desabilitada no app
+        """
+        light = self.get_light_by_name(light_name)
         if light is None:
             logger.warning(f"Light '{light_name}' not found")
             raise ValueError(
@@ -73,38 +246,12 @@ class HueController:
 
         if not is_enabled_for_app(light_name):
             logger.warning(
-                f"Light '{light_name}' desabilitada no app (enabled_for_app=false); skip set_light_color"
+                f"Light '{light_name}' desabilitada no app (enabled_for_app=false); skip set_light_state"
             )
             raise ValueError(
                 f"Lâmpada '{light_name}' desabilitada no app (enabled_for_app=false)"
             )
-
-        try:
-            # Converte RGB para XY (já validado em RGBtoXYAdapter)
-            xy = RGBtoXYAdapter.convert(color.red, color.green, color.blue)
-
-            # Valida coordenadas XY
-            if not self._validate_xy(xy):
-                logger.warning(
-                    f"Coordenadas XY fora do gamut: {xy}, usando valores corrigidos"
-                )
-                xy = self._clamp_xy(xy)
-
-            # Aplica as configurações.
-            # Invariante ocular (defesa em profundidade): clampa o brilho na
-            # ORIGEM, cobrindo presets (apply_light_config -> set_light_color),
-            # screen-mirror e tools diretas. Escala "hue" (0-254).
-            light.xy = xy
-            light.brightness = clamp_eye_safety(light_name, color.brightness, scale="hue")
-            logger.debug(f"Successfully applied color to '{light_name}'")
-            return light
-
-        except ValueError as e:
-            logger.error(f"Erro ao definir cor para '{light_name}': {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Erro inesperado ao definir cor para '{light_name}': {e}")
-            raise RuntimeError(f"Erro ao aplicar cor: {e}") from e
+        return light
 
     def apply_light_config(
         self, light_config: LightConfig, transition_time_secs: float = 0
@@ -122,6 +269,56 @@ class HueController:
         Raises:
             ValueError: Se houver erros na configuração
         """
+        transition_time = self.config_transition(light_config, transition_time_secs)
+
+        # OPTIMIZATION: Scene recall - preset já materializado na bridge
+        if self._recall_scene(light_config, transition_time):
+            logger.info(f"Configuration '{light_config.name}' recalled as bridge scene")
+            return self
+
+        # OPTIMIZATION: Group action - lâmpadas com o mesmo corpo num único PUT
+        batches, per_light = self.plan_light_config(light_config, transition_time)
+        for key, members in batches.items():
+            if self._apply_group_action([light for _, light in members], json.loads(key)):
+                continue
+            per_light.extend(setting for setting, _ in members)
+
+        errors = []
+        for setting in per_light:
+            try:
+                # OPTIMIZATION: Coalesced PUT - on + xy + bri + transitiontime juntos
+                self.set_light_state(
+                    setting.light_name,
+                    setting.color,
+                    on=True,
+                    transition_time=transition_time,
+                )
+            except ValueError as e:
+                logger.warning(
+                    f"Erro ao aplicar configuração para '{setting.light_name}': {e}"
+                )
+                errors.append(str(e))
+            except Exception as e:
+                logger.error(
+                    f"Erro inesperado ao aplicar configuração para '{setting.light_name}': {e}"
+                )
+                errors.append(str(e))
+
+        if errors:
+            logger.warning(f"Configuração aplicada com {len(errors)} erro(s): {errors}")
+
+        logger.info(f"Configuration '{light_config.name}' applied successfully")
+        return self
+
+    def config_transition(
+        self, light_config: LightConfig, transition_time_secs: float
+    ) -> int | None:
+        """
+        Valida o preset e converte a transição para décimos de segundo.
+
+        Raises:
+            ValueError: Se o preset for inválido
+        """
         if not light_config or not hasattr(light_config, "settings"):
             raise ValueError("LightConfig inválido")
 
@@ -136,35 +333,168 @@ class HueController:
             f"Applying configuration '{light_config.name}' with {len(light_config.settings)} lights (transition: {transition_time_secs}s)"
         )
 
-        errors = []
+        # Hue usa décimos de segundo (transitiontime * 10)
+        return int(transition_time_secs * 10) if transition_time_secs > 0 else None
+
+    def plan_light_config(
+        self, light_config: LightConfig, transition_time: int | None
+    ) -> tuple[dict[str, list[tuple[Any, Light]]], list[Any]]:
+        """
+        Separa o preset em lotes de corpo idêntico (chave = corpo em JSON,
+        candidatos a group action) e configurações para o PUT por lâmpada.
+
+        Sem I/O: compartilhado com o ``AsyncHueController``. Sem group
+        actions (``groups`` é ``None``) tudo vai para o PUT por lâmpada.
+        """
+        per_light: list[Any] = []
+        batches: dict[str, list[tuple[Any, Light]]] = {}
         for setting in light_config.settings:
             if not is_enabled_for_app(setting.light_name):
                 logger.debug(
                     f"Skipping disabled light '{setting.light_name}' in apply_light_config"
                 )
                 continue
+            light = self.get_light_by_name(setting.light_name)
+            if light is None or self._groups is None:
+                per_light.append(setting)
+                continue
             try:
-                light = self.set_light_color(setting.light_name, setting.color)
-                if transition_time_secs > 0:
-                    # Hue usa décimos de segundo (transitiontime * 10)
-                    light.transitiontime = int(transition_time_secs * 10)
-                light.on = True
-            except ValueError as e:
-                logger.warning(
-                    f"Erro ao aplicar configuração para '{setting.light_name}': {e}"
+                body = self.light_state_body(
+                    setting.light_name,
+                    setting.color,
+                    on=True,
+                    transition_time=transition_time,
                 )
-                errors.append(str(e))
-            except Exception as e:
-                logger.error(
-                    f"Erro inesperado ao aplicar configuração para '{setting.light_name}': {e}"
+            except ValueError:
+                per_light.append(setting)  # erro reportado no caminho por lâmpada
+                continue
+            key = json.dumps(body, sort_keys=True)
+            batches.setdefault(key, []).append((setting, light))
+        return batches, per_light
+
+    def preset_lightstates(self, light_config: LightConfig) -> dict[str, dict[str, Any]] | None:
+        """
+        Estados finais por ``light_id`` de um preset (o que o caminho por
+        lâmpada enviaria, sem ``transitiontime``).
+
+        Lâmpadas desabilitadas no app ficam de fora; retorna ``None`` se alguma
+        lâmpada não existir ou nenhuma sobrar (o preset não é materializável).
+        """
+        states: dict[str, dict[str, Any]] = {}
+        for setting in light_config.settings:
+            if not is_enabled_for_app(setting.light_name):
+                continue
+            light = self.get_light_by_name(setting.light_name)
+            if light is None:
+                return None
+            try:
+                states[str(light.light_id)] = self.light_state_body(
+                    setting.light_name, setting.color, on=True
                 )
-                errors.append(str(e))
+            except ValueError:
+                return None
+        return states or None
 
-        if errors:
-            logger.warning(f"Configuração aplicada com {len(errors)} erro(s): {errors}")
+    def scene_plan(
+        self, light_config: LightConfig
+    ) -> tuple[str, dict[str, dict[str, Any]]] | None:
+        """
+        Hash de conteúdo e estados finais de um preset para o recall de cena.
 
-        logger.info(f"Configuration '{light_config.name}' applied successfully")
-        return self
+        Sem I/O. ``None`` se o preset não é materializável (ver
+        :meth:`preset_lightstates`).
+        """
+        states = self.preset_lightstates(light_config)
+        if states is None:
+            return None
+        # Hash dos estados ATUAIS (preset + política ocular): cena desatualizada não casa
+        return scene_content_hash(states), states
+
+    def sync_scenes(self, configs: list[LightConfig]) -> dict[str, Any]:
+        """
+        Materializa presets como cenas da bridge (só os que mudaram).
+
+        Returns:
+            dict: Resumo ``uploaded``/``unchanged``/``failed``/``skipped``/``deleted``
+
+        Raises:
+            RuntimeError: Se o recall de cenas estiver desabilitado
+        """
+        scenes = self._scenes
+        if scenes is None:
+            raise RuntimeError("Recall de cenas desabilitado (SCENE_SYNC=false)")
+        presets: dict[str, dict[str, dict[str, Any]]] = {}
+        skipped: list[str] = []
+        for config in configs:
+            states = self.preset_lightstates(config)
+            if states is None:
+                skipped.append(config.name)
+            else:
+                presets[config.name] = states
+        summary = scenes.sync(presets)
+        summary["skipped"] = skipped
+        return summary
+
+    def _recall_scene(self, light_config: LightConfig, transition_time: int | None) -> bool:
+        """Recall em uma chamada se a bridge tem uma cena com o conteúdo atual do preset."""
+        scenes = self._scenes
+        if scenes is None:
+            return False
+        try:
+            plan = self.scene_plan(light_config)
+            if plan is None:
+                return False
+            content_hash, states = plan
+            scene_id = scenes.scene_for(content_hash)
+            if scene_id is None:
+                return False
+            if not scenes.recall(scene_id, transition_time):
+                return False
+            for light_id, state in states.items():
+                self.note_write([light_id], state)
+            return True
+        except Exception as e:
+            logger.warning(f"Scene recall falhou para '{light_config.name}': {e}")
+            return False
+
+    def _apply_group_action(self, lights: list[Light], body: dict[str, Any]) -> bool:
+        """
+        Aplica ``body`` a ``lights`` num único ``PUT /groups/<id>/action``.
+
+        Retorna ``False`` (o chamador faz o PUT por lâmpada) com menos de duas
+        lâmpadas, sem grupo equivalente na bridge ou se a action falhar.
+        """
+        groups = self._groups
+        if groups is None or len(lights) < 2:
+            return False
+        try:
+            group_id = groups.resolve(
+                [light.light_id for light in lights],
+                all_ids=[light.light_id for light in self.lights],
+            )
+            if group_id is None or not groups.action(group_id, body):
+                return False
+        except Exception as e:
+            logger.warning(f"Group action falhou ({len(lights)} lâmpadas): {e}")
+            return False
+        logger.debug(f"Group action {group_id} applied to {len(lights)} lights: {body}")
+        self.note_write([light.light_id for light in lights], body)
+        return True
+
+    def delete_app_groups(self) -> int:
+        """Remove da bridge os grupos ``marvin-…`` criados pelo app; retorna quantos."""
+        groups = self._groups
+        return (groups or BridgeGroups(self.bridge)).delete_created()
+
+    def note_write(self, light_ids: list[Any], body: dict[str, Any]) -> None:
+        """
+        Write-through no cache de estado (status reflete o que acabamos de enviar).
+
+        Chamar só depois que a bridge confirmou a escrita.
+        """
+        cache = self.state_cache
+        if cache is not None:
+            cache.apply_write(light_ids, body)
 
     def _refresh_cache(self) -> None:
         """
@@ -186,9 +516,19 @@ class HueController:
         logger.info("Refreshing lights from bridge")
         self.lights = self.bridge.get_light_objects()
         self._refresh_cache()
+        self.gamuts = GamutRegistry.from_bridge(self.bridge)
+        groups = self._groups
+        if groups is not None:
+            groups.invalidate()
+        scenes = self._scenes
+        if scenes is not None:
+            scenes.invalidate()
+        cache = self.state_cache
+        if cache is not None:
+            cache.invalidate()
         logger.info(f"Lights refreshed. Found {len(self.lights)} lights")
 
-    def _get_light_by_name(self, light_name: str) -> Light | None:
+    def get_light_by_name(self, light_name: str) -> Light | None:
         """
         Busca lâmpada por nome usando cache O(1).
 
@@ -205,10 +545,11 @@ class HueController:
         if not is_enabled_for_app(light_name):
             logger.debug(f"turn_on skipped: '{light_name}' desabilitada no app")
             return False
-        light = self._get_light_by_name(light_name)
+        light = self.get_light_by_name(light_name)
         if light is None:
             return False
         light.on = True
+        self.note_write([light.light_id], {"on": True})
         return True
 
     def turn_off(self, light_name: str) -> bool:
@@ -216,10 +557,11 @@ class HueController:
         if not is_enabled_for_app(light_name):
             logger.debug(f"turn_off skipped: '{light_name}' desabilitada no app")
             return False
-        light = self._get_light_by_name(light_name)
+        light = self.get_light_by_name(light_name)
         if light is None:
             return False
         light.on = False
+        self.note_write([light.light_id], {"on": False})
         return True
 
     def set_brightness(self, light_name: str, hue_brightness: int) -> bool:
@@ -230,25 +572,61 @@ class HueController:
         if not is_enabled_for_app(light_name):
             logger.debug(f"set_brightness skipped: '{light_name}' desabilitada no app")
             return False
-        light = self._get_light_by_name(light_name)
+        light = self.get_light_by_name(light_name)
         if light is None:
             return False
         safe = clamp_eye_safety(light_name, max(0, min(254, hue_brightness)), scale="hue")
         light.brightness = safe
+        self.note_write([light.light_id], {"bri": safe})
         return True
 
     def set_all(self, on: bool) -> None:
-        """Liga/desliga lâmpadas habilitadas no app."""
+        """Liga/desliga lâmpadas habilitadas no app (group action quando possível)."""
+        targets = []
         for light in self.lights:
             if not is_enabled_for_app(light.name):
                 logger.debug(f"set_all skipped: '{light.name}' desabilitada no app")
                 continue
+            targets.append(light)
+        if self._apply_group_action(targets, {"on": bool(on)}):
+            return
+        for light in targets:
             light.on = on
+            self.note_write([light.light_id], {"on": bool(on)})
 
     def set_all_brightness(self, hue_brightness: int) -> None:
-        """Brilho de lâmpadas habilitadas — clampado POR LÂMPADA (fecha o furo "all")."""
+        """Brilho de lâmpadas habilitadas — clampado POR LÂMPADA (fecha o furo "all").
+
+        Lâmpadas que terminam com o mesmo ``bri`` após o clamp compartilham
+        uma group action; as demais recebem o PUT individual.
+        """
+        requested = max(0, min(254, hue_brightness))
+        by_bri: dict[int, list[Light]] = {}
         for light in self.lights:
-            self.set_brightness(light.name, hue_brightness)
+            if not is_enabled_for_app(light.name):
+                logger.debug(f"set_all_brightness skipped: '{light.name}' desabilitada no app")
+                continue
+            safe = clamp_eye_safety(light.name, requested, scale="hue")
+            by_bri.setdefault(safe, []).append(light)
+        for safe, lights in by_bri.items():
+            if self._apply_group_action(lights, {"bri": safe}):
+                continue
+            for light in lights:
+                self.set_brightness(light.name, hue_brightness)
+
+    def _xy_in_gamut(self, light_name: str, xy: tuple[float, float]) -> tuple[float, float]:
+        """xy no gamut da lâmpada (A/B/C do registro) ou no clamp genérico."""
+        gamuts = self.gamuts
+        if gamuts is not None and light_name in gamuts:
+            return gamuts.clamp_one(light_name, xy)
+
+        # Valida coordenadas XY
+        if not self._validate_xy(xy):
+            logger.warning(
+                f"Coordenadas XY fora do gamut: {xy}, usando valores corrigidos"
+            )
+            xy = self._clamp_xy(xy)
+        return xy
 
     def _validate_xy(self, xy: tuple[float, float]) -> bool:
         """
@@ -335,46 +713,79 @@ class HueController:
         """
         Retorna o estado atual de todas as lâmpadas com cores RGB.
 
+        Com ``state_cache`` o status vem de um único ``GET /lights`` (ou de
+        nenhum, dentro do TTL); sem ele — ou se a leitura em lote falhar —
+        cada lâmpada é lida pelas propriedades do ``phue.Light``.
+
         Returns:
             list[dict[str, Any]]: Lista de dicionários com status de cada lâmpada
         """
+        cache = self.state_cache
+        states = cache.snapshot() if cache is not None else None
         lights_status: list[dict[str, Any]] = []
         for light in self.lights:
-            try:
-                status: dict[str, Any] = {
-                    "name": light.name,
-                    "on": light.on,
-                    "brightness": light.brightness if light.on else 0,
-                    "reachable": light.reachable,
-                }
-                # Converter XY para RGB se a lâmpada estiver ligada e tiver cor
-                if light.on and hasattr(light, "xy") and light.xy:
-                    rgb = ColorConverter.xy_to_rgb(light.xy, light.brightness)
-                    status["color"] = {"r": rgb[0], "g": rgb[1], "b": rgb[2]}
-                else:
-                    status["color"] = {
-                        "r": 50,
-                        "g": 50,
-                        "b": 50,
-                    }  # Cinza quando desligada
-                lights_status.append(status)
-            except Exception as e:
-                logger.warning(
-                    f"Error getting status for light '{light.name}': {str(e)}"
-                )
-                # Adiciona status mínimo para lâmpadas com erro
-                lights_status.append(
-                    {
-                        "name": light.name,
-                        "on": False,
-                        "brightness": 0,
-                        "reachable": False,
-                        "color": {"r": 50, "g": 50, "b": 50},
-                        "error": str(e),
-                    }
-                )
+            info = states.get(str(light.light_id)) if states is not None else None
+            if info is not None:
+                lights_status.append(self._status_from_state(info))
+            else:
+                lights_status.append(self._status_from_light(light))
         return lights_status
 
+    @staticmethod
+    def _status_from_state(info: dict[str, Any]) -> dict[str, Any]:
+        """Linha de status a partir do JSON de ``GET /lights/<id>`` (sem I/O)."""
+        state = info.get("state") or {}
+        on = bool(state.get("on", False))
+        brightness = int(state.get("bri") or 0)
+        status: dict[str, Any] = {
+            "name": info.get("name"),
+            "on": on,
+            "brightness": brightness if on else 0,
+            "reachable": bool(state.get("reachable", False)),
+        }
+        xy = state.get("xy")
+        if on and xy:
+            rgb = ColorConverter.xy_to_rgb(tuple(xy), brightness)
+            status["color"] = {"r": rgb[0], "g": rgb[1], "b": rgb[2]}
+        else:
+            status["color"] = {"r": 50, "g": 50, "b": 50}  # Cinza quando desligada
+        return status
+
+    @staticmethod
+    def _status_from_light(light: Light) -> dict[str, Any]:
+        """Linha de status lida pelas propriedades do ``phue.Light`` (um GET cada)."""
+        try:
+            status: dict[str, Any] = {
+                "name": light.name,
+                "on": light.on,
+                "brightness": light.brightness if light.on else 0,
+                "reachable": light.reachable,
+            }
+            # Converter XY para RGB se a lâmpada estiver ligada e tiver cor
+            if light.on and hasattr(light, "xy") and light.xy:
+                rgb = ColorConverter.xy_to_rgb(light.xy, light.brightness)
+                status["color"] = {"r": rgb[0], "g": rgb[1], "b": rgb[2]}
+            else:
+                status["color"] = {
+                    "r": 50,
+                    "g": 50,
+                    "b": 50,
+                }  # Cinza quando desligada
+            return status
+        except Exception as e:
+            logger.warning(
+                f"Error getting status for light '{light.name}': {str(e)}"
+            )
+            # Adiciona status mínimo para lâmpadas com erro
+            return {
+                "name": light.name,
+                "on": False,
+                "brightness": 0,
+                "reachable": False,
+                "color": {"r": 50, "g": 50, "b": 50},
+                "error": str(e),
+            }
+
     def _xy_to_rgb(self, xy: tuple, brightness: int = 254) -> tuple[int, int, int]:
         """
         DEPRECATED: Use ColorConverter.xy_to_rgb() instead.
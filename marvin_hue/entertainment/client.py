@@ -6,6 +6,7 @@ import asyncio
 from typing import Any, Coroutine, TypeVar
 
 from marvin_hue.entertainment.credentials import EntertainmentCredentials
+from marvin_hue.entertainment.frame_buffer import RGB8_TO_16, ChannelFrameBuffer
 from marvin_hue.entertainment.models import (
     ChannelColor,
     ChannelInfo,
@@ -20,8 +21,7 @@ T = TypeVar("T")
 
 def _rgb8_to_16(v: int) -> int:
     """Map 0–255 → 0–65535 (``v * 257`` ≡ ``(v << 8) | v``)."""
-    v = max(0, min(255, int(v)))
-    return (v << 8) | v
+    return RGB8_TO_16[max(0, min(255, int(v)))]
 
 
 class EntertainmentClient:
@@ -212,6 +212,17 @@ class EntertainmentClient:
         ]
         self._session.send(cmds)
 
+    def send_buffer(self, buffer: ChannelFrameBuffer) -> None:
+        """Non-blocking send of the channels written to ``buffer`` this frame.
+
+        OPTIMIZATION: the buffer's commands are already 16-bit and reused
+        across frames — nothing is converted or allocated here.
+        """
+        if not self._streaming or self._session is None:
+            raise RuntimeError("Entertainment stream not active")
+        if buffer.frame:
+            self._session.send(buffer.frame)
+
     async def stop_stream(self) -> None:
         if self._session is not None:
             stop = getattr(self._session, "stop", None)
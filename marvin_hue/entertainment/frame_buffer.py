@@ -0,0 +1,58 @@
+"""Preallocated per-area channel frame for the Entertainment stream."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+# 0–255 → 0–65535 (``v * 257``), indexed instead of computed per component
+RGB8_TO_16: tuple[int, ...] = tuple((v << 8) | v for v in range(256))
+
+
+def _light_color_command(channel_id: int) -> Any:
+    from hue_entertainment import LightColorCommand
+
+    return LightColorCommand(channel_id=channel_id)
+
+
+class ChannelFrameBuffer:
+    """
+    One reusable 16-bit command per area channel, updated in place each frame.
+
+    ``hue_entertainment`` only reads ``channel_id/red/green/blue`` while
+    ``session.send`` packs the HueStream message (synchronously), so the same
+    ``LightColorCommand`` objects and the same outgoing list are handed to the
+    session every frame: no per-frame command objects or lists.
+
+    Example:
+        >>> buf = ChannelFrameBuffer([0, 1, 2])
+        >>> buf.begin()
+        >>> buf.put(1, 255, 0, 128)
+        >>> [c.channel_id for c in buf.frame]
+        [1]
+    """
+
+    def __init__(
+        self,
+        channel_ids: Sequence[int],
+        *,
+        command_factory: Callable[[int], Any] = _light_color_command,
+    ) -> None:
+        self.channel_ids: tuple[int, ...] = tuple(channel_ids)
+        self._commands: list[Any] = [command_factory(cid) for cid in self.channel_ids]
+        # Channels touched since begin() — the list handed to session.send
+        self.frame: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.channel_ids)
+
+    def begin(self) -> None:
+        """Start a new frame (keeps the list's capacity)."""
+        self.frame.clear()
+
+    def put(self, slot: int, r: int, g: int, b: int) -> None:
+        """Write 8-bit RGB (0–255) into channel ``slot`` and queue it for this frame."""
+        cmd = self._commands[slot]
+        cmd.red = RGB8_TO_16[r]
+        cmd.green = RGB8_TO_16[g]
+        cmd.blue = RGB8_TO_16[b]
+        self.frame.append(cmd)
@@ -23,6 +23,9 @@ EYE_SAFETY_LIMITS: dict[str, int] = {"Fita Led": 25, "Led cima": 25}
 _runtime_limits_pct: dict[str, int | None] | None = None
 _runtime_disabled: set[str] | None = None
 
+# Bumped on every policy change; lets hot loops cache per-light flags
+_policy_version = 0
+
 
 def set_runtime_policy(
     *,
@@ -30,28 +33,37 @@ def set_runtime_policy(
     disabled_names: set[str],
 ) -> None:
     """Install policy from registry (sync cache). Call from async layer after load."""
-    global _runtime_limits_pct, _runtime_disabled
+    global _runtime_limits_pct, _runtime_disabled, _policy_version
     _runtime_limits_pct = dict(limits_pct)
     _runtime_disabled = set(disabled_names)
+    _policy_version += 1
 
 
 def set_runtime_limits(limits_pct: dict[str, int | None]) -> None:
     """Override only brightness limits (keeps current disabled set)."""
-    global _runtime_limits_pct
+    global _runtime_limits_pct, _policy_version
     _runtime_limits_pct = dict(limits_pct)
+    _policy_version += 1
 
 
 def set_runtime_enabled(enabled_by_name: dict[str, bool]) -> None:
     """Set enabled_for_app map; False names go into the disabled set."""
-    global _runtime_disabled
+    global _runtime_disabled, _policy_version
     _runtime_disabled = {name for name, enabled in enabled_by_name.items() if not enabled}
+    _policy_version += 1
 
 
 def clear_runtime_policy() -> None:
     """Clear runtime overlays (tests / shutdown)."""
-    global _runtime_limits_pct, _runtime_disabled
+    global _runtime_limits_pct, _runtime_disabled, _policy_version
     _runtime_limits_pct = None
     _runtime_disabled = None
+    _policy_version += 1
+
+
+def runtime_policy_version() -> int:
+    """Monotonic counter of runtime policy changes (cache invalidation key)."""
+    return _policy_version
 
 
 def is_enabled_for_app(light_name: str) -> bool:
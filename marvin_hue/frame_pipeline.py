@@ -0,0 +1,201 @@
+"""
+Primitivas de temporização e pipeline dos mirrors.
+
+``LatestSlot`` é uma fila de uma posição "latest wins": o produtor nunca
+bloqueia e um item ainda não consumido é substituído (descartado ou mesclado)
+pelo novo. ``StageTimer`` acumula tempo por estágio (última, média móvel e
+máximo) para exposição em ``get_status()``. ``FrameScheduler`` é o relógio de
+frames (monotônico, por deadline) compartilhado por ScreenMirror e AudioMirror.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Generic, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+# Peso da amostra nova na média móvel exponencial dos tempos de estágio
+_EMA_ALPHA = 0.1
+
+# Frames mantidos para as estatísticas do scheduler (percentis, FPS atingido)
+_SCHEDULER_WINDOW = 240
+
+
+class LatestSlot(Generic[T]):
+    """
+    Fila single-slot: ``put`` sobrescreve o item pendente, ``get`` bloqueia.
+
+    ``merge(old, new)`` opcional combina o item pendente com o novo em vez de
+    descartá-lo (ex.: cores por lâmpada, onde só a mais recente importa).
+
+    Example:
+        >>> slot = LatestSlot()
+        >>> slot.put(1); slot.put(2)
+        >>> slot.get(timeout=0.1), slot.dropped
+        (2, 1)
+    """
+
+    def __init__(self, merge: Callable[[T, T], T] | None = None) -> None:
+        self._merge = merge
+        self._item: T | None = None
+        self._has_item = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item: T) -> None:
+        """Publica ``item``; um item anterior não consumido é descartado/mesclado."""
+        with self._cond:
+            if self._has_item:
+                self.dropped += 1
+                if self._merge is not None:
+                    item = self._merge(self._item, item)  # type: ignore[arg-type]
+            self._item = item
+            self._has_item = True
+            self._cond.notify()
+
+    def get(self, timeout: float | None = None) -> T | None:
+        """Próximo item, ou ``None`` se o slot foi fechado / o timeout expirou."""
+        with self._cond:
+            if not self._has_item and not self._closed:
+                self._cond.wait(timeout)
+            if not self._has_item:
+                return None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            return item
+
+    def close(self) -> None:
+        """Acorda consumidores bloqueados; ``get`` passa a retornar ``None``."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class StageTimer:
+    """Tempo de um estágio do pipeline em ms (último, EMA, máximo, contagem)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        self.count += 1
+        self.last_ms = ms
+        self.avg_ms = ms if self.count == 1 else self.avg_ms + _EMA_ALPHA * (ms - self.avg_ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "last_ms": round(self.last_ms, 3),
+            "avg_ms": round(self.avg_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class FrameScheduler:
+    """
+    Relógio de frames por deadline sobre ``time.monotonic``.
+
+    Cada frame tem um deadline absoluto (``início + n * período``), então o
+    tempo de trabalho e o erro do ``sleep`` não acumulam drift, e saltos do
+    relógio de parede não afetam o ritmo. Em overrun o scheduler pula para o
+    próximo deadline futuro (sem rajada de frames atrasados) e conta os
+    deadlines perdidos.
+
+    Example:
+        >>> scheduler = FrameScheduler(30)
+        >>> while running:
+        ...     do_frame()
+        ...     scheduler.wait()
+        >>> scheduler.stats()["achieved_fps"]
+        29.98
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        window: int = _SCHEDULER_WINDOW,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self.fps = max(1.0, float(fps))
+        self.period = 1.0 / self.fps
+        self.missed_deadlines = 0
+        self.frames = 0
+        self._intervals: deque[float] = deque(maxlen=window)
+        self._work: deque[float] = deque(maxlen=window)
+        self._jitter: deque[float] = deque(maxlen=window)
+        self._last_tick = clock()
+        self._deadline = self._last_tick + self.period
+
+    def set_fps(self, fps: float) -> None:
+        """Troca o FPS alvo em runtime; o próximo deadline é rebaseado."""
+        fps = max(1.0, float(fps))
+        if fps == self.fps:
+            return
+        self.fps = fps
+        self.period = 1.0 / fps
+        self._deadline = self._last_tick + self.period
+
+    def wait(self) -> None:
+        """Fim do frame: dorme até o deadline ou pula deadlines já perdidos."""
+        now = self._clock()
+        self._work.append(now - self._last_tick)
+        if now < self._deadline:
+            self._sleep(self._deadline - now)
+            tick = self._clock()
+            self._jitter.append(abs(tick - self._deadline))
+            self._deadline += self.period
+        else:
+            # Overrun: próximo deadline estritamente no futuro (skip-ahead)
+            late = int(math.floor((now - self._deadline) / self.period)) + 1
+            self.missed_deadlines += late
+            self._deadline += late * self.period
+            tick = now
+        self._intervals.append(tick - self._last_tick)
+        self._last_tick = tick
+        self.frames += 1
+
+    def stats(self) -> dict[str, Any]:
+        """FPS atingido, percentis de frame/trabalho/jitter (ms) e deadlines perdidos."""
+        out: dict[str, Any] = {
+            "target_fps": round(self.fps, 3),
+            "achieved_fps": 0.0,
+            "frame_ms_p50": 0.0,
+            "frame_ms_p99": 0.0,
+            "work_ms_p50": 0.0,
+            "work_ms_p99": 0.0,
+            "jitter_ms_p50": 0.0,
+            "jitter_ms_p99": 0.0,
+            "missed_deadlines": self.missed_deadlines,
+            "frames": self.frames,
+        }
+        if self._intervals:
+            # list(): snapshot atômico (o loop do mirror continua gravando)
+            intervals = np.asarray(list(self._intervals)) * 1000.0
+            mean = float(intervals.mean())
+            out["achieved_fps"] = round(1000.0 / mean, 3) if mean > 0 else 0.0
+            p50, p99 = np.percentile(intervals, (50, 99))
+            out["frame_ms_p50"] = round(float(p50), 3)
+            out["frame_ms_p99"] = round(float(p99), 3)
+        for key, samples in (("work", self._work), ("jitter", self._jitter)):
+            if samples:
+                p50, p99 = np.percentile(np.asarray(list(samples)) * 1000.0, (50, 99))
+                out[f"{key}_ms_p50"] = round(float(p50), 3)
+                out[f"{key}_ms_p99"] = round(float(p99), 3)
+        return out
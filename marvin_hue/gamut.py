@@ -0,0 +1,182 @@
+"""
+Gamut de cor por lâmpada (Hue gamut A/B/C) e clamp vetorizado em xy.
+
+Cada modelo de lâmpada Hue só reproduz as cores dentro do seu triângulo de
+gamut no diagrama CIE xy. A bridge aplica o clamp por conta própria, mas um
+xy fora do gamut gasta um comando com uma cor que a lâmpada não exibe — e
+duas cores pedidas diferentes podem virar a mesma cor real.
+
+``GamutRegistry`` lê ``capabilities.control`` de ``GET /lights`` uma vez (na
+conexão) e guarda os triângulos num array ``(K, 3, 2)``. ``clamp`` leva um
+lote de xy (uma linha por lâmpada) ao ponto mais próximo dentro do triângulo
+de cada lâmpada, sem loop Python. Lâmpadas sem gamut informado (brancas /
+ambiance / desconhecidas) usam o clamp genérico ``0 <= x, y`` e ``x + y <= 1``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+import numpy as np
+
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("gamut")
+
+# Triângulos (vermelho, verde, azul) documentados pela Philips
+GAMUTS: dict[str, tuple[tuple[float, float], ...]] = {
+    "A": ((0.704, 0.296), (0.2151, 0.7106), (0.138, 0.08)),
+    "B": ((0.675, 0.322), (0.409, 0.518), (0.167, 0.04)),
+    "C": ((0.6915, 0.3083), (0.17, 0.7), (0.1532, 0.0475)),
+}
+
+# Tolerância do teste "dentro do triângulo" (xy tem 4 casas na bridge)
+_INSIDE_EPS = 1e-9
+
+
+def _parse_triangle(control: dict[str, Any]) -> np.ndarray | None:
+    points = control.get("colorgamut")
+    if isinstance(points, list) and len(points) == 3:
+        try:
+            tri = np.asarray(points, dtype=np.float64)
+        except (TypeError, ValueError):
+            tri = None
+        if tri is not None and tri.shape == (3, 2) and np.isfinite(tri).all():
+            return tri
+    gamut_type = control.get("colorgamuttype")
+    if gamut_type in GAMUTS:
+        return np.asarray(GAMUTS[gamut_type], dtype=np.float64)
+    return None
+
+
+def _generic_clamp(xy: np.ndarray) -> np.ndarray:
+    """Clamp sem gamut (mesma regra do antigo ``HueController._clamp_xy``)."""
+    out = np.clip(xy, 0.0, 1.0)
+    total = out.sum(axis=-1, keepdims=True)
+    clamped: np.ndarray = np.where(
+        total > 1.0, out / np.where(total > 1.0, total, 1.0), out
+    )
+    return clamped
+
+
+def clamp_to_triangles(xy: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """
+    Ponto mais próximo de cada ``xy[i]`` dentro de ``triangles[i]``.
+
+    Args:
+        xy: Array ``(N, 2)``
+        triangles: Array ``(N, 3, 2)`` (vértices em qualquer orientação)
+
+    Returns:
+        np.ndarray: ``(N, 2)``; pontos já dentro do triângulo saem inalterados
+    """
+    p = xy[:, None, :]  # (N, 1, 2)
+    starts = triangles
+    edges = np.roll(triangles, -1, axis=1) - starts  # (N, 3, 2)
+    rel = p - starts
+
+    # Dentro se o ponto está do mesmo lado das 3 arestas (produto vetorial 2D)
+    cross = edges[..., 0] * rel[..., 1] - edges[..., 1] * rel[..., 0]  # (N, 3)
+    inside = (cross >= -_INSIDE_EPS).all(axis=1) | (cross <= _INSIDE_EPS).all(axis=1)
+
+    # Projeção em cada aresta (segmento), escolhendo a mais próxima
+    length2 = np.einsum("nkj,nkj->nk", edges, edges)
+    t = np.einsum("nkj,nkj->nk", rel, edges) / np.where(length2 > 0, length2, 1.0)
+    closest = starts + np.clip(t, 0.0, 1.0)[..., None] * edges  # (N, 3, 2)
+    dist2 = ((closest - p) ** 2).sum(axis=-1)
+    best = closest[np.arange(len(xy)), dist2.argmin(axis=1)]
+    return np.where(inside[:, None], xy, best)
+
+
+class GamutRegistry:
+    """
+    Triângulo de gamut por nome de lâmpada, em cache desde a conexão.
+
+    Example:
+        >>> registry = GamutRegistry.from_bridge(bridge)
+        >>> registry.gamut_of("Hue Play 1")
+        'C'
+        >>> registry.clamp(["Hue Play 1", "Fita Led"], xy)  # (2, 2) -> (2, 2)
+    """
+
+    def __init__(self, triangles: dict[str, np.ndarray] | None = None) -> None:
+        triangles = triangles or {}
+        self._names: dict[str, int] = {name: i for i, name in enumerate(triangles)}
+        self._triangles = (
+            np.stack(list(triangles.values()))
+            if triangles
+            else np.empty((0, 3, 2), dtype=np.float64)
+        )
+
+    @classmethod
+    def from_lights(cls, lights: dict[str, Any]) -> "GamutRegistry":
+        """A partir do JSON de ``GET /lights`` (``{id: {name, capabilities, ...}}``)."""
+        triangles: dict[str, np.ndarray] = {}
+        for info in lights.values():
+            if not isinstance(info, dict) or "name" not in info:
+                continue
+            control = (info.get("capabilities") or {}).get("control") or {}
+            tri = _parse_triangle(control) if isinstance(control, dict) else None
+            if tri is not None:
+                triangles[str(info["name"])] = tri
+        return cls(triangles)
+
+    @classmethod
+    def from_bridge(cls, bridge: Any) -> "GamutRegistry":
+        """Um ``GET /lights``; registro vazio se a resposta não for utilizável."""
+        try:
+            lights = bridge.get_light()
+        except Exception as e:
+            logger.warning(f"Could not read light capabilities for gamuts: {e}")
+            return cls()
+        if not isinstance(lights, dict):
+            return cls()
+        registry = cls.from_lights(lights)
+        logger.debug(f"Gamut registry: {len(registry)} color lights")
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, light_name: object) -> bool:
+        return light_name in self._names
+
+    def triangle(self, light_name: str) -> np.ndarray | None:
+        index = self._names.get(light_name)
+        return None if index is None else self._triangles[index]
+
+    def gamut_of(self, light_name: str) -> str | None:
+        """``"A"``/``"B"``/``"C"`` se o triângulo é um dos padrões, senão ``None``."""
+        tri = self.triangle(light_name)
+        if tri is None:
+            return None
+        for name, points in GAMUTS.items():
+            if np.allclose(tri, points):
+                return name
+        return None
+
+    def clamp(self, light_names: Iterable[str], xy: Any) -> np.ndarray:
+        """
+        Leva cada linha de ``xy`` ao gamut da lâmpada correspondente.
+
+        Args:
+            light_names: Um nome por linha de ``xy``
+            xy: Array ``(N, 2)``
+
+        Returns:
+            np.ndarray: ``(N, 2)`` float64 no gamut de cada lâmpada
+        """
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        indices = np.fromiter(
+            (self._names.get(name, -1) for name in light_names), dtype=np.intp, count=len(xy)
+        )
+        known = indices >= 0
+        out = _generic_clamp(xy)
+        if known.any():
+            out[known] = clamp_to_triangles(xy[known], self._triangles[indices[known]])
+        return out
+
+    def clamp_one(self, light_name: str, xy: tuple[float, float]) -> tuple[float, float]:
+        """Versão escalar de :meth:`clamp` para uma lâmpada."""
+        x, y = self.clamp([light_name], [xy])[0]
+        return (float(x), float(y))
@@ -0,0 +1,272 @@
+"""
+Espelho do estado das lâmpadas via event stream da API v2 (SSE).
+
+A bridge publica em ``GET /eventstream/clip/v2`` (Server-Sent Events) toda
+mudança de recurso — inclusive as feitas pelo app Hue, interruptores e
+automações. ``LightEventStream`` mantém essa assinatura numa thread de fundo
+e aplica cada update de ``light`` / ``zigbee_connectivity`` ao
+``LightStateCache``, traduzido para o formato de estado v1 (``on``, ``bri``,
+``xy``, ``ct``, ``reachable``) pelo ``id_v1`` do recurso. Com o stream
+conectado, ``get_lights_status`` (status, health, contexto do chat) não
+consulta mais a bridge: um ``GET /lights`` por conexão e o resto por evento.
+
+Queda do stream volta o cache ao TTL e reconecta com backoff exponencial.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import ssl
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from marvin_hue.light_state import LightStateCache
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("light_events")
+
+EVENTSTREAM_PATH = "/eventstream/clip/v2"
+
+# Backoff de reconexão (segundos)
+DEFAULT_RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+
+def iter_sse_data(readline: Callable[[], bytes]) -> Iterator[str]:
+    """
+    Payloads ``data:`` de um stream SSE, um por evento (linhas juntadas com ``\\n``).
+
+    Comentários (``: hi``) e campos ``id``/``event``/``retry`` são ignorados;
+    termina quando ``readline`` devolve ``b""`` (conexão fechada).
+    """
+    data: list[str] = []
+    while True:
+        raw = readline()
+        if not raw:
+            return
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith("data:"):
+            data.append(line[5:].removeprefix(" "))
+
+
+def _v1_id(resource: dict[str, Any]) -> str | None:
+    id_v1 = resource.get("id_v1")
+    if isinstance(id_v1, str) and id_v1.startswith("/lights/"):
+        return id_v1.rsplit("/", 1)[1]
+    return None
+
+
+def v1_light_changes(resource: dict[str, Any]) -> tuple[str, dict[str, Any]] | None:
+    """
+    Traduz um recurso v2 de um evento para ``(light_id_v1, mudanças de estado v1)``.
+
+    ``None`` para recursos que não são lâmpadas v1 ou sem campos de estado.
+    """
+    light_id = _v1_id(resource)
+    if light_id is None:
+        return None
+    changes: dict[str, Any] = {}
+    kind = resource.get("type")
+    if kind == "light":
+        on = resource.get("on")
+        if isinstance(on, dict) and "on" in on:
+            changes["on"] = bool(on["on"])
+        dimming = resource.get("dimming")
+        if isinstance(dimming, dict) and "brightness" in dimming:
+            # v2 em % (0-100), v1 em 1-254
+            changes["bri"] = max(1, min(254, round(float(dimming["brightness"]) * 2.54)))
+        xy = (resource.get("color") or {}).get("xy")
+        if isinstance(xy, dict) and "x" in xy and "y" in xy:
+            changes["xy"] = [float(xy["x"]), float(xy["y"])]
+            changes["colormode"] = "xy"
+        mirek = (resource.get("color_temperature") or {}).get("mirek")
+        if isinstance(mirek, int):
+            changes["ct"] = mirek
+            if "xy" not in changes:
+                changes["colormode"] = "ct"
+    elif kind == "zigbee_connectivity" and "status" in resource:
+        changes["reachable"] = resource["status"] == "connected"
+    if not changes:
+        return None
+    return light_id, changes
+
+
+class LightEventStream:
+    """
+    Assinatura SSE da bridge alimentando um ``LightStateCache``.
+
+    Example:
+        >>> stream = LightEventStream("192.168.1.100", app_key, hue.state_cache)
+        >>> stream.start()
+        >>> stream.stats()["connected"]
+        True
+        >>> stream.stop()
+    """
+
+    def __init__(
+        self,
+        host: str,
+        app_key: str,
+        cache: LightStateCache,
+        *,
+        port: int | None = None,
+        tls: bool = True,
+        timeout: float = 10.0,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    ) -> None:
+        self.host = host
+        self.app_key = app_key
+        self.cache = cache
+        self.port = port
+        self.tls = tls
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._conn: http.client.HTTPConnection | None = None
+        # http.client solta conn.sock em respostas sem keep-alive: guarda o socket
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+        self.connected = False
+        self.connects = 0
+        self.events = 0
+        self.updates = 0
+        self.errors = 0
+        self._last_event_at: float | None = None
+
+    # --- lifecycle ---
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="hue-events", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Encerra a assinatura (desbloqueia a leitura fechando o socket)."""
+        self._stop.set()
+        with self._lock:
+            sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        age = None
+        if self._last_event_at is not None:
+            age = round(time.monotonic() - self._last_event_at, 1)
+        return {
+            "connected": self.connected,
+            "connects": self.connects,
+            "events": self.events,
+            "updates": self.updates,
+            "errors": self.errors,
+            "last_event_age_s": age,
+        }
+
+    # --- stream ---
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if not self.tls:
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        # Certificado da bridge é assinado pela CA da Philips (CN = bridge id),
+        # não por uma CA pública: LAN only, sem verificação de hostname.
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return http.client.HTTPSConnection(
+            self.host, self.port, timeout=self.timeout, context=context
+        )
+
+    def _run(self) -> None:
+        delay = self.reconnect_delay
+        while not self._stop.is_set():
+            try:
+                if self._listen():
+                    delay = self.reconnect_delay
+            except Exception as e:
+                if not self._stop.is_set():
+                    self.errors += 1
+                    logger.warning(f"Hue event stream error: {e}")
+            finally:
+                self._disconnected()
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def _listen(self) -> bool:
+        """Uma conexão até cair; ``True`` se chegou a conectar."""
+        conn = self._connection()
+        with self._lock:
+            self._conn = conn
+        conn.connect()
+        with self._lock:
+            self._sock = conn.sock
+        if self._stop.is_set():
+            return False
+        conn.request(
+            "GET",
+            EVENTSTREAM_PATH,
+            headers={"hue-application-key": self.app_key, "Accept": "text/event-stream"},
+        )
+        response = conn.getresponse()
+        if response.status != 200:
+            self.errors += 1
+            logger.warning(f"Hue event stream refused: HTTP {response.status}")
+            return False
+        # Conectado: sem timeout de leitura (a bridge fica quieta sem mudanças)
+        self._sock.settimeout(None)
+        self.connected = True
+        self.connects += 1
+        self.cache.set_live(True)
+        self.cache.snapshot()  # baseline já com o stream aberto
+        logger.info("Hue event stream connected; light status served from events")
+        for payload in iter_sse_data(response.readline):
+            self._handle(payload)
+        return True
+
+    def _handle(self, payload: str) -> None:
+        try:
+            events = json.loads(payload)
+        except ValueError:
+            self.errors += 1
+            return
+        if not isinstance(events, list):
+            return
+        self._last_event_at = time.monotonic()
+        for event in events:
+            self.events += 1
+            if not isinstance(event, dict) or event.get("type") != "update":
+                continue
+            for resource in event.get("data") or []:
+                if not isinstance(resource, dict):
+                    continue
+                parsed = v1_light_changes(resource)
+                if parsed is not None:
+                    self.updates += 1
+                    self.cache.apply_event(*parsed)
+
+    def _disconnected(self) -> None:
+        was_connected = self.connected
+        self.connected = False
+        self.cache.set_live(False)
+        with self._lock:
+            conn, self._conn, self._sock = self._conn, None, None
+        if conn is not None:
+            conn.close()
+        if was_connected and not self._stop.is_set():
+            logger.warning("Hue event stream disconnected; status back to TTL polling")
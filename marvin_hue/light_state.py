@@ -0,0 +1,159 @@
+"""
+Cache em memória do estado das lâmpadas (``GET /lights`` em lote).
+
+Cada propriedade de ``phue.Light`` (``name``, ``on``, ``brightness``,
+``reachable``, ``xy``) é um GET na bridge: montar o status de N lâmpadas
+custava ~5×N requisições. ``LightStateCache`` guarda a resposta de um único
+``GET /lights`` por ``ttl`` segundos e aplica write-through dos comandos do
+próprio app (PUT de estado, group actions, recall de cena), então o status
+lido logo após uma escrita já reflete o que foi enviado.
+
+Com o event stream v2 conectado (``light_events.LightEventStream``) o cache
+fica em modo *live*: o snapshot só é lido uma vez por conexão e as mudanças
+chegam por evento (inclusive as feitas por outros apps), sem TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("light_state")
+
+# Validade padrão de um snapshot (segundos); settings.light_state_ttl
+DEFAULT_TTL = 2.0
+
+# Campos de um corpo de escrita que mudam o estado reportado por GET /lights
+_STATE_KEYS = frozenset({"on", "bri", "xy", "ct", "hue", "sat"})
+
+
+class LightStateCache:
+    """
+    Snapshot ``{light_id: {"name", "state", ...}}`` com TTL + write-through.
+
+    Example:
+        >>> cache = LightStateCache(bridge.get_light, ttl=2.0)
+        >>> cache.snapshot()["1"]["state"]["on"]
+        True
+        >>> cache.apply_write(["1"], {"on": False})
+        >>> cache.snapshot()["1"]["state"]["on"]
+        False
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Any],
+        ttl: float = DEFAULT_TTL,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self.ttl = float(ttl)
+        self._clock = clock
+        self._lights: dict[str, dict[str, Any]] | None = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self.live = False
+        self.hits = 0
+        self.fetches = 0
+        self.events = 0
+
+    def _fresh(self) -> bool:
+        if self._lights is None:
+            return False
+        return self.live or self._clock() - self._fetched_at < self.ttl
+
+    def snapshot(self) -> dict[str, dict[str, Any]] | None:
+        """Estado de todas as lâmpadas (um GET se expirado); ``None`` se a leitura falhar."""
+        with self._lock:
+            if self._fresh():
+                self.hits += 1
+                return dict(self._lights)  # type: ignore[arg-type]
+            try:
+                lights = self._fetch()
+            except Exception as e:
+                logger.warning(f"Bulk light state fetch failed: {e}")
+                return None
+            return self._store(lights)
+
+    def cached(self) -> dict[str, dict[str, Any]] | None:
+        """Snapshot ainda válido, sem ir à bridge (``None`` se expirado)."""
+        with self._lock:
+            if not self._fresh():
+                return None
+            self.hits += 1
+            return dict(self._lights)  # type: ignore[arg-type]
+
+    def store(self, lights: Any) -> dict[str, dict[str, Any]] | None:
+        """Grava um ``GET /lights`` lido por fora (ex.: cliente HTTP async)."""
+        with self._lock:
+            return self._store(lights)
+
+    def _store(self, lights: Any) -> dict[str, dict[str, Any]] | None:
+        if not isinstance(lights, dict):
+            return None
+        self.fetches += 1
+        self._lights = {
+            str(light_id): info for light_id, info in lights.items() if isinstance(info, dict)
+        }
+        self._fetched_at = self._clock()
+        return dict(self._lights)
+
+    def apply_write(self, light_ids: Iterable[Any], body: dict[str, Any]) -> None:
+        """Write-through: aplica ao snapshot os campos de estado de ``body``."""
+        changes = {k: v for k, v in body.items() if k in _STATE_KEYS}
+        if not changes:
+            return
+        if "xy" in changes:
+            changes["colormode"] = "xy"
+        with self._lock:
+            self._merge(light_ids, changes)
+
+    def apply_event(self, light_id: Any, changes: dict[str, Any]) -> None:
+        """Mudança vinda do event stream (já no formato de estado v1)."""
+        with self._lock:
+            self.events += 1
+            self._merge([light_id], changes)
+
+    def set_live(self, live: bool) -> None:
+        """
+        Liga/desliga o modo live (stream conectado ignora o TTL).
+
+        Ao ligar, descarta o snapshot: o próximo é lido já com o stream
+        aberto, então nenhum evento fica entre a leitura e a assinatura.
+        """
+        with self._lock:
+            if live and not self.live:
+                self._lights = None
+            self.live = live
+
+    def _merge(self, light_ids: Iterable[Any], changes: dict[str, Any]) -> None:
+        if self._lights is None:
+            return
+        for light_id in light_ids:
+            info = self._lights.get(str(light_id))
+            if info is None:
+                continue
+            # Cópia nova: snapshots já entregues não mudam sob o leitor
+            self._lights[str(light_id)] = {
+                **info,
+                "state": {**(info.get("state") or {}), **changes},
+            }
+
+    def invalidate(self) -> None:
+        """Força um novo ``GET /lights`` na próxima leitura."""
+        with self._lock:
+            self._lights = None
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "ttl": self.ttl,
+                "live": self.live,
+                "hits": self.hits,
+                "fetches": self.fetches,
+                "events": self.events,
+            }
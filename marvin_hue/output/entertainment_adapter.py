@@ -2,30 +2,37 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+
 from marvin_hue.entertainment.channel_map import MappedChannel
 from marvin_hue.entertainment.client import EntertainmentClient
-from marvin_hue.entertainment.models import ChannelColor
-from marvin_hue.eye_safety import clamp_eye_safety, is_enabled_for_app
+from marvin_hue.entertainment.frame_buffer import ChannelFrameBuffer
+from marvin_hue.eye_safety import (
+    clamp_eye_safety,
+    is_enabled_for_app,
+    runtime_policy_version,
+)
 from marvin_hue.logging_config import get_logger
+from marvin_hue.output.interpolation import FrameInterpolator
 from marvin_hue.output.port import LightFrameColor, TransportName
+from marvin_hue.output.stream_clock import StreamClock
 
 logger = get_logger("output.entertainment")
 
 
-def _apply_bri(r: int, g: int, b: int, bri: int) -> tuple[int, int, int]:
-    """Scale RGB by Hue brightness (0–254) so absolute level is limited."""
-    bri = max(0, min(254, int(bri)))
-    if bri <= 0:
-        return 0, 0, 0
-    return (
-        max(0, min(255, r * bri // 254)),
-        max(0, min(255, g * bri // 254)),
-        max(0, min(255, b * bri // 254)),
-    )
-
-
 class EntertainmentStreamAdapter:
-    """Map light names → channels and stream via EntertainmentClient."""
+    """Map light names → channels and stream via EntertainmentClient.
+
+    With ``stream_fps`` the stream runs on its own ``StreamClock``: analysis
+    frames only become keyframes of a ``FrameInterpolator`` (``interpolation``
+    = linear | cubic | spring), and the clock sends its samples at a fixed
+    rate. A 20 Hz analyzer thus drives a smooth 50 Hz stream, and a slow
+    analysis frame no longer stalls output.
+    """
 
     def __init__(
         self,
@@ -35,15 +42,46 @@ class EntertainmentStreamAdapter:
         *,
         start_timeout: float = 15.0,
         stop_timeout: float = 10.0,
+        stream_fps: float | None = None,
+        interpolation: str = "linear",
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._client = client
         self._area_id = area_id
         self._channels = list(channels)
-        self._name_to_channel: dict[str, int] = {
-            m.light_name: m.channel_id for m in self._channels
+        # OPTIMIZATION: one reusable 16-bit command per channel (see
+        # ChannelFrameBuffer); light name → slot is resolved per frame layout,
+        # not per light per frame.
+        channel_ids = list(dict.fromkeys(m.channel_id for m in self._channels))
+        self._buffer = ChannelFrameBuffer(channel_ids)
+        slot_of = {cid: i for i, cid in enumerate(channel_ids)}
+        self._slot_by_name: dict[str, int] = {
+            m.light_name: slot_of[m.channel_id] for m in self._channels
         }
+        # Frame layout (light names in order) → slot (-1 = skip) + bri cap
+        self._layout: list[str] = []
+        self._layout_slots: list[int] = []
+        self._layout_caps: list[int] = []
+        self._layout_policy = -1
         self._start_timeout = start_timeout
         self._stop_timeout = stop_timeout
+        # Fixed-rate stream: (slot, rgb) state shared with the clock thread
+        n = len(channel_ids)
+        self._stream_fps = stream_fps if stream_fps and stream_fps > 0 else None
+        self._now = clock
+        self._clock: StreamClock | None = None
+        self._frame_lock = threading.Lock()
+        self._interp = FrameInterpolator(
+            (n, 3),
+            interpolation,
+            min_interval=1.0 / self._stream_fps if self._stream_fps else 0.0,
+        )
+        self._to = np.zeros((n, 3), dtype=np.float64)
+        self._seen = np.zeros(n, dtype=bool)
+        self._snap = np.zeros(n, dtype=bool)
+        self._staged: list[int] = []
+        self._active: list[int] = []
+        self._has_frame = False
 
     @property
     def transport(self) -> TransportName:
@@ -63,6 +101,7 @@ class EntertainmentStreamAdapter:
             logger.debug(
                 f"Entertainment session already active area={self._area_id}"
             )
+            self._start_clock()
             return
         try:
             self._client.run_coro(
@@ -81,22 +120,125 @@ class EntertainmentStreamAdapter:
                 ) from e
             raise
         logger.info(f"Entertainment session begun area={self._area_id}")
+        self._start_clock()
 
-    def apply_frame(self, colors: list[LightFrameColor]) -> None:
-        cmds: list[ChannelColor] = []
-        for c in colors:
-            if not is_enabled_for_app(c.light_name):
+    @property
+    def stream_clock(self) -> StreamClock | None:
+        return self._clock
+
+    def _start_clock(self) -> None:
+        if self._stream_fps is None or (self._clock is not None and self._clock.running):
+            return
+        with self._frame_lock:
+            self._interp.reset()
+            self._has_frame = False
+            self._seen[:] = False
+            self._active = []
+        self._clock = StreamClock(
+            self._stream_fps, self._tick, name="hue-ent-clock", clock=self._now
+        )
+        self._clock.start()
+        logger.info(f"Entertainment stream clock at {self._stream_fps:g} fps")
+
+    def _stop_clock(self) -> None:
+        clock, self._clock = self._clock, None
+        if clock is not None:
+            clock.stop()
+
+    def _layout_matches(self, colors: list[LightFrameColor]) -> bool:
+        if self._layout_policy != runtime_policy_version():
+            return False
+        layout = self._layout
+        if len(layout) != len(colors):
+            return False
+        for name, c in zip(layout, colors):
+            if name != c.light_name:
+                return False
+        return True
+
+    def _compile_layout(self, colors: list[LightFrameColor]) -> None:
+        """Slot and eye-safety brightness cap for each position of the frame."""
+        self._layout_policy = runtime_policy_version()
+        self._layout = [c.light_name for c in colors]
+        self._layout_slots = []
+        self._layout_caps = []
+        for name in self._layout:
+            slot = self._slot_by_name.get(name, -1)
+            if slot >= 0 and not is_enabled_for_app(name):
+                slot = -1
+            self._layout_slots.append(slot)
+            self._layout_caps.append(clamp_eye_safety(name, 254, scale="hue"))
+
+    def _scale_into(self, colors: list[LightFrameColor], put: Callable[..., None]) -> None:
+        for c, slot, cap in zip(colors, self._layout_slots, self._layout_caps):
+            if slot < 0:
                 continue
-            channel_id = self._name_to_channel.get(c.light_name)
-            if channel_id is None:
+            # Scale RGB by Hue brightness (0–254) so absolute level is limited
+            bri = min(int(c.brightness), cap)
+            if bri <= 0:
+                put(slot, 0, 0, 0)
                 continue
-            bri = clamp_eye_safety(c.light_name, int(c.brightness), scale="hue")
-            r, g, b = _apply_bri(c.r, c.g, c.b, bri)
-            cmds.append(ChannelColor(channel_id=channel_id, r=r, g=g, b=b))
-        if cmds:
-            self._client.send_frame(cmds)
+            put(
+                slot,
+                max(0, min(255, c.r * bri // 254)),
+                max(0, min(255, c.g * bri // 254)),
+                max(0, min(255, c.b * bri // 254)),
+            )
+
+    def apply_frame(self, colors: list[LightFrameColor]) -> None:
+        if not self._layout_matches(colors):
+            self._compile_layout(colors)
+        clock = self._clock
+        if clock is not None:
+            if clock.error is not None:
+                # Surface stream failures to the producer (FallbackOutputPort)
+                raise RuntimeError(f"Entertainment stream clock failed: {clock.error}")
+            self._stage(colors)
+            return
+        buffer = self._buffer
+        buffer.begin()
+        self._scale_into(colors, buffer.put)
+        if buffer.frame:
+            self._client.send_buffer(buffer)
+
+    # --- fixed-rate stream (clock thread) ---
+
+    def _stage_slot(self, slot: int, r: int, g: int, b: int) -> None:
+        to = self._to[slot]
+        to[0], to[1], to[2] = r, g, b
+        if not self._seen[slot]:
+            # Canal novo no stream: começa na cor alvo, sem fade a partir do preto
+            self._seen[slot] = True
+            self._snap[slot] = True
+        self._staged.append(slot)
+
+    def _stage(self, colors: list[LightFrameColor]) -> None:
+        """New analysis frame: next keyframe of the interpolator."""
+        with self._frame_lock:
+            self._staged.clear()
+            self._snap[:] = False
+            self._scale_into(colors, self._stage_slot)
+            self._interp.push(self._to, self._now(), snap=self._snap)
+            self._active, self._staged = self._staged, self._active
+            self._has_frame = True
+
+    def _tick(self, now: float) -> None:
+        """Clock tick: send the interpolated state of the latest keyframes."""
+        buffer = self._buffer
+        with self._frame_lock:
+            if not self._has_frame or not self._active:
+                return
+            shown = self._interp.sample(now)
+            # cubic/spring may overshoot the 0–255 range slightly
+            rows = np.rint(np.clip(shown, 0, 255)).astype(np.intp).tolist()
+            buffer.begin()
+            for slot in self._active:
+                r, g, b = rows[slot]
+                buffer.put(slot, r, g, b)
+        self._client.send_buffer(buffer)
 
     def end_session(self) -> None:
+        self._stop_clock()
         if not self._client.is_streaming:
             return
         try:
@@ -9,7 +9,7 @@ from marvin_hue.logging_config import get_logger
 from marvin_hue.output.entertainment_adapter import EntertainmentStreamAdapter
 from marvin_hue.output.fallback import FallbackOutputPort
 from marvin_hue.output.port import LightOutputPort
-from marvin_hue.output.rest_adapter import RestPhueAdapter
+from marvin_hue.output.rest_adapter import DEFAULT_MAX_IN_FLIGHT, RestPhueAdapter
 
 logger = get_logger("output.factory")
 
@@ -23,16 +23,25 @@ def build_audio_output_port(
     mapped_channels: list[MappedChannel] | None,
     transition_time: int = 0,
     transport_preference: str = "auto",
+    rest_max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    stream_fps: float | None = None,
+    interpolation: str = "linear",
 ) -> LightOutputPort:
     """
     Build output port for audio mirror.
 
+    ``stream_fps`` runs the Entertainment stream on its own fixed-rate clock,
+    upsampling analysis frames with ``interpolation`` (linear | cubic |
+    spring); ``None`` sends per frame.
+
     transport_preference:
       - auto: entertainment when enabled+ready, else REST
       - rest: force REST
       - entertainment: require entertainment or raise ValueError
     """
-    rest = RestPhueAdapter(hue, transition_time=transition_time)
+    rest = RestPhueAdapter(
+        hue, transition_time=transition_time, max_in_flight=rest_max_in_flight
+    )
     pref = (transport_preference or "auto").strip().lower()
 
     if pref == "rest":
@@ -60,6 +69,8 @@ def build_audio_output_port(
             client=client,
             area_id=area_id,
             channels=mapped_channels,
+            stream_fps=stream_fps,
+            interpolation=interpolation,
         )
         logger.info(
             f"Building FallbackOutputPort entertainment area={area_id} "
@@ -79,6 +90,9 @@ def build_mirror_output_port(
     mapped_channels: list[MappedChannel] | None,
     transition_time: int = 0,
     transport_preference: str = "auto",
+    rest_max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    stream_fps: float | None = None,
+    interpolation: str = "linear",
 ) -> LightOutputPort:
     """Alias for screen/audio — same dual-transport rules."""
     return build_audio_output_port(
@@ -89,4 +103,7 @@ def build_mirror_output_port(
         mapped_channels=mapped_channels,
         transition_time=transition_time,
         transport_preference=transport_preference,
+        rest_max_in_flight=rest_max_in_flight,
+        stream_fps=stream_fps,
+        interpolation=interpolation,
     )
@@ -2,45 +2,170 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+from marvin_hue.bridge_limiter import RestWriteLimiter
 from marvin_hue.colors import Color
 from marvin_hue.controllers import HueController
 from marvin_hue.eye_safety import is_enabled_for_app
+from marvin_hue.gamut import GamutRegistry
 from marvin_hue.logging_config import get_logger
 from marvin_hue.output.port import LightFrameColor, TransportName
+from marvin_hue.utils import ColorConverter
 
 logger = get_logger("output.rest")
 
+# Requisições simultâneas à bridge por frame (settings.rest_max_in_flight)
+DEFAULT_MAX_IN_FLIGHT = 4
+# Espera máxima (s) pelos PUTs do limiter já em voo ao encerrar a sessão
+END_SESSION_TIMEOUT = 2.0
+
 
 class RestPhueAdapter:
-    """Per-light REST color updates (existing HueController path)."""
+    """
+    Per-light REST color updates (existing HueController path).
+
+    Frames with several lights fan out over a bounded worker pool: at most
+    ``max_in_flight`` PUTs are in flight at once (``1`` = serial), each worker
+    reusing its own keep-alive bridge connection. ``apply_frame`` still
+    returns only after every light of the frame was sent.
 
-    def __init__(self, hue: HueController, transition_time: int = 0) -> None:
+    When the controller has a ``rest_limiter``, frames are handed to it
+    instead: ``apply_frame`` returns immediately, each light keeps only its
+    newest pending color and the limiter sends at the bridge's rate. Colors
+    still queued when the session ends are discarded, so a preset applied
+    right after stopping a mirror is not overwritten by stale frames.
+
+    Each frame is converted to xy in one call and clamped to every lamp's
+    gamut (``hue.gamuts``). A light whose in-gamut color and brightness equal
+    the last ones sent is skipped: the lamp could not show the difference.
+    """
+
+    def __init__(
+        self,
+        hue: HueController,
+        transition_time: int = 0,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
         self._hue = hue
         self.transition_time = transition_time
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._pool: ThreadPoolExecutor | None = None
+        # light_name -> (x, y, bri) do último envio, na precisão da bridge
+        self._last_sent: dict[str, tuple[float, float, int]] = {}
+        # Lâmpadas com comandos entregues ao limiter nesta sessão
+        self._submitted: set[str] = set()
+        self.skipped_unchanged = 0
 
     @property
     def transport(self) -> TransportName:
         return "rest"
 
+    def _limiter(self) -> RestWriteLimiter | None:
+        limiter = getattr(self._hue, "rest_limiter", None)
+        return limiter if isinstance(limiter, RestWriteLimiter) else None
+
     def begin_session(self) -> None:
-        return None
+        self._last_sent.clear()
+        self._discard_pending()
 
     def end_session(self) -> None:
-        return None
+        self._last_sent.clear()
+        self._discard_pending()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _discard_pending(self) -> None:
+        """Drop this adapter's queued limiter writes and wait for those in flight."""
+        limiter = self._limiter()
+        if limiter is None or not self._submitted:
+            self._submitted.clear()
+            return
+        keys = list(self._submitted)
+        self._submitted.clear()
+        dropped = limiter.discard(keys)
+        if not limiter.flush(timeout=END_SESSION_TIMEOUT, keys=keys):
+            logger.warning("REST writes still in flight after end_session timeout")
+        if dropped:
+            logger.debug(f"Discarded {dropped} queued REST writes")
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_in_flight, thread_name_prefix="hue-rest"
+            )
+        return self._pool
+
+    def _apply_one(self, c: LightFrameColor, xy: tuple[float, float] | None = None) -> None:
+        try:
+            # One PUT per light; HueController clamps eye safety
+            self._hue.set_light_state(
+                c.light_name,
+                Color(c.r, c.g, c.b, max(0, min(254, int(c.brightness)))),
+                transition_time=int(self.transition_time),
+                xy=xy,
+            )
+        except ValueError as e:
+            self._last_sent.pop(c.light_name, None)
+            logger.debug(f"REST light '{c.light_name}' unavailable: {e}")
+        except Exception as e:
+            self._last_sent.pop(c.light_name, None)
+            logger.debug(f"REST apply_frame error for '{c.light_name}': {e}")
 
     def apply_frame(self, colors: list[LightFrameColor]) -> None:
-        for c in colors:
-            if not is_enabled_for_app(c.light_name):
-                continue
-            try:
-                # HueController.set_light_color already clamps eye safety
-                light = self._hue.set_light_color(
-                    c.light_name,
-                    Color(c.r, c.g, c.b, max(0, min(254, int(c.brightness)))),
-                )
-                if light is not None:
-                    light.transitiontime = int(self.transition_time)
-            except ValueError as e:
-                logger.debug(f"REST light '{c.light_name}' unavailable: {e}")
-            except Exception as e:
-                logger.debug(f"REST apply_frame error for '{c.light_name}': {e}")
+        pending = [c for c in colors if is_enabled_for_app(c.light_name)]
+        if not pending:
+            return
+        # OPTIMIZATION: Vectorized XY - o frame inteiro converte numa chamada
+        xys = self._frame_xy(pending)
+        pending, xys = self._drop_unchanged(pending, xys)
+        if not pending:
+            return
+        limiter = self._limiter()
+        if limiter is not None:
+            # OPTIMIZATION: Rate limit - cores não enviadas são coalescidas por lâmpada
+            for c, xy in zip(pending, xys):
+                self._submitted.add(c.light_name)
+                limiter.submit(c.light_name, partial(self._apply_one, c, xy))
+            return
+        if self.max_in_flight == 1 or len(pending) <= 1:
+            for c, xy in zip(pending, xys):
+                self._apply_one(c, xy)
+            return
+        # OPTIMIZATION: Fan-out - N lâmpadas em ~N/max_in_flight round-trips
+        pool = self._executor()
+        wait([pool.submit(self._apply_one, c, xy) for c, xy in zip(pending, xys)])
+
+    def _frame_xy(self, pending: list[LightFrameColor]) -> list[tuple[float, float] | None]:
+        rgb = [(c.r, c.g, c.b) for c in pending]
+        try:
+            xy = ColorConverter.rgb_to_xy_array(rgb)
+        except ValueError:
+            # RGB inválido: cada lâmpada valida/reporta no caminho escalar
+            return [None] * len(pending)
+        gamuts = getattr(self._hue, "gamuts", None)
+        if isinstance(gamuts, GamutRegistry) and len(gamuts):
+            # OPTIMIZATION: Gamut clamp vetorizado - uma chamada por frame
+            xy = gamuts.clamp([c.light_name for c in pending], xy)
+        return [(x, y) for x, y in xy.tolist()]
+
+    def _drop_unchanged(
+        self,
+        pending: list[LightFrameColor],
+        xys: list[tuple[float, float] | None],
+    ) -> tuple[list[LightFrameColor], list[tuple[float, float] | None]]:
+        send: list[LightFrameColor] = []
+        send_xy: list[tuple[float, float] | None] = []
+        for c, xy in zip(pending, xys):
+            if xy is not None:
+                # A bridge guarda xy com 4 casas
+                key = (round(xy[0], 4), round(xy[1], 4), int(c.brightness))
+                if self._last_sent.get(c.light_name) == key:
+                    self.skipped_unchanged += 1
+                    continue
+                self._last_sent[c.light_name] = key
+            send.append(c)
+            send_xy.append(xy)
+        return send, send_xy
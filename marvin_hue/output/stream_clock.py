@@ -0,0 +1,93 @@
+"""Fixed-rate ticker thread for streaming transports."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("output.stream_clock")
+
+
+class StreamClock:
+    """
+    Call ``tick(now)`` every ``1 / fps`` seconds on a daemon thread.
+
+    Deadlines are absolute (``next += period``) so jitter in one tick does not
+    drift the rate; if the thread falls more than a period behind it resyncs
+    instead of bursting. An exception from ``tick`` stops the clock and is
+    kept in ``error`` for the producer side to surface.
+
+    Example:
+        >>> clock = StreamClock(50, lambda now: send_latest(now))
+        >>> clock.start()
+        >>> clock.stop()
+    """
+
+    def __init__(
+        self,
+        fps: float,
+        tick: Callable[[float], None],
+        *,
+        name: str = "stream-clock",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError(f"fps must be > 0, got {fps}")
+        self.period = 1.0 / float(fps)
+        self._tick = tick
+        self._name = name
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.error: BaseException | None = None
+        self.ticks = 0
+        self.late = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "fps": round(1.0 / self.period, 1),
+            "running": self.running,
+            "ticks": self.ticks,
+            "late": self.late,
+            "error": str(self.error) if self.error is not None else None,
+        }
+
+    def _run(self) -> None:
+        deadline = self._clock()
+        while not self._stop.is_set():
+            now = self._clock()
+            try:
+                self._tick(now)
+            except Exception as e:
+                self.error = e
+                logger.warning(f"{self._name} stopped: {e}")
+                return
+            self.ticks += 1
+            deadline += self.period
+            now = self._clock()
+            if now - deadline > self.period:
+                self.late += 1
+                deadline = now
+            if self._stop.wait(max(0.0, deadline - now)):
+                return
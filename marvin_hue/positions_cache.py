@@ -0,0 +1,114 @@
+"""
+Cache compartilhado do arquivo de posições das lâmpadas (light_positions.json).
+
+ScreenMirror e AudioMirror leem as posições a cada frame; aqui o JSON só é
+re-parseado quando o ``mtime``/tamanho do arquivo muda (um ``stat`` por
+leitura, sem abrir o arquivo) ou quando ``POST /positions`` invalida o cache.
+Uma instância por caminho absoluto, compartilhada entre os mirrors.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from marvin_hue.logging_config import get_logger
+
+logger = get_logger("positions_cache")
+
+# (st_mtime_ns, st_size) do arquivo; None quando ausente
+_Signature = tuple[int, int] | None
+
+_MISSING = object()
+
+
+class PositionsCache:
+    """
+    Lista ``lights`` do arquivo de posições, recarregada só quando o arquivo muda.
+
+    ``version`` é incrementado a cada recarga com conteúdo novo; os mirrors o
+    usam como chave para os próprios caches derivados (filtros, FramePlan).
+
+    Example:
+        >>> cache = get_positions_cache(".res/light_positions.json")
+        >>> cache.lights()
+        [{"name": "Hue Play 1", "position": "left", "enabled": True}]
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self.version = 0
+        self._lights: list[dict[str, Any]] = []
+        self._signature: Any = _MISSING
+        self._lock = threading.Lock()
+
+    def _stat(self) -> _Signature:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def lights(self) -> list[dict[str, Any]]:
+        """Entradas ``lights`` cruas do JSON (não copiar/mutar: lista compartilhada)."""
+        signature = self._stat()
+        if signature == self._signature:
+            return self._lights
+        with self._lock:
+            if signature != self._signature:
+                self._reload(signature)
+            return self._lights
+
+    def _reload(self, signature: _Signature) -> None:
+        lights: list[dict[str, Any]] = []
+        if signature is None:
+            logger.warning(f"Positions file not found: {self.path}")
+        else:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                lights = list(data.get("lights", []))
+            except FileNotFoundError:
+                logger.warning(f"Positions file not found: {self.path}")
+                signature = None
+            except json.JSONDecodeError as e:
+                logger.exception(f"Error parsing positions file: {e}")
+        self._lights = lights
+        self._signature = signature
+        self.version += 1
+        logger.debug(f"Positions reloaded (v{self.version}): {len(lights)} lights")
+
+    def invalidate(self) -> None:
+        """Força re-leitura na próxima chamada de :meth:`lights`."""
+        with self._lock:
+            self._signature = _MISSING
+
+
+_caches: dict[str, PositionsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_positions_cache(path: str | Path) -> PositionsCache:
+    """Cache compartilhado para ``path`` (mesmo arquivo → mesma instância)."""
+    key = os.path.abspath(str(path))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = PositionsCache(path)
+            _caches[key] = cache
+        return cache
+
+
+def invalidate_positions(path: str | Path | None = None) -> None:
+    """Invalida o cache de ``path`` (ou de todos quando ``None``)."""
+    with _caches_lock:
+        if path is None:
+            caches = list(_caches.values())
+        else:
+            cache = _caches.get(os.path.abspath(str(path)))
+            caches = [cache] if cache else []
+    for cache in caches:
+        cache.invalidate()
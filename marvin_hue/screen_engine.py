@@ -0,0 +1,322 @@
+"""
+Motor de extração de cor da tela (NumPy).
+
+Análise pura (sem dependências Hue): envolve o buffer BGRA do mss como array
+sem cópia, toca apenas os pixels das regiões configuradas, amostra cada
+região numa grade fixa e calcula a média ponderada por saturação de todas as
+regiões num único passo vetorizado.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+import numpy as np
+from PIL import Image
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Grade de amostragem por região (32x32 = 1024 amostras, igual ao path PIL)
+SAMPLE_GRID = 32
+
+# Pixels por célula (por eixo) mantidos antes da média de área; o resto é
+# descartado por stride para não converter regiões enormes em float.
+_CELL_SUBSAMPLE = 4
+
+# Filtro de luminância (UI elements, bordas pretas, branco estourado)
+_DARK_CUTOFF = 15.0
+_BRIGHT_CUTOFF = 240.0
+
+# Acima desta fração da tela, um grab full é mais barato que vários grabs
+_FULL_CAPTURE_AREA_RATIO = 0.6
+
+# Region rect em pixels: (x, y, width, height)
+Rect = tuple[int, int, int, int]
+
+
+# ---------------------------------------------------------------------------
+# Frame / sampling
+# ---------------------------------------------------------------------------
+
+
+def bgra_frame(buffer: bytes | bytearray | memoryview, width: int, height: int) -> np.ndarray:
+    """
+    Wrap a raw BGRA screenshot buffer as an (H, W, 4) uint8 array.
+
+    Uses ``np.frombuffer`` — no pixel copy; the array is read-only when the
+    buffer is immutable (``bytes``).
+    """
+    arr = np.frombuffer(buffer, dtype=np.uint8)
+    return arr.reshape(int(height), int(width), 4)
+
+
+def screenshot_frame(screenshot: Any) -> np.ndarray:
+    """
+    Zero-copy (H, W, 4) BGRA view over an mss ``ScreenShot``.
+
+    Wraps ``screenshot.raw`` (the bytearray mss filled) through a memoryview
+    instead of ``screenshot.bgra``, which returns a full ``bytes`` copy.
+    """
+    return bgra_frame(memoryview(screenshot.raw), screenshot.width, screenshot.height)
+
+
+def crop_region(frame: np.ndarray, rect: Rect) -> np.ndarray:
+    """(h, w, 4) view of ``rect`` clamped to the frame bounds (no copy)."""
+    frame_h, frame_w = int(frame.shape[0]), int(frame.shape[1])
+    x, y, w, h = (int(v) for v in rect)
+    x0 = max(0, min(frame_w, x))
+    y0 = max(0, min(frame_h, y))
+    x1 = max(x0, min(frame_w, x + w))
+    y1 = max(y0, min(frame_h, y + h))
+    return frame[y0:y1, x0:x1]
+
+
+def region_image(frame: np.ndarray, rect: Rect) -> Image.Image:
+    """
+    PIL RGB image of a single region of a BGRA frame.
+
+    Only the region's pixels are copied (BGR → RGB), so the legacy PIL engine
+    no longer materializes a full-frame ``Image`` per capture.
+    """
+    crop = crop_region(frame, rect)
+    if crop.size == 0:
+        return Image.new("RGB", (1, 1))
+    h, w = int(crop.shape[0]), int(crop.shape[1])
+    if not frame.flags.c_contiguous:
+        return Image.fromarray(np.ascontiguousarray(crop[..., 2::-1]), mode="RGB")
+    # Strided raw decode straight from the frame buffer (C BGRX → RGB)
+    stride = int(frame.strides[0])
+    offset = int(crop.ctypes.data - frame.ctypes.data)
+    flat = frame.reshape(-1)[offset : offset + (h - 1) * stride + w * 4]
+    return Image.frombuffer("RGB", (w, h), flat, "raw", "BGRX", stride, 1)
+
+
+def sample_region(frame: np.ndarray, rect: Rect, grid: int = SAMPLE_GRID) -> np.ndarray:
+    """
+    Area-average a BGRA/BGR region onto a ``grid``×``grid`` RGB sample set.
+
+    Large regions are first strided down to ~``_CELL_SUBSAMPLE``² pixels per
+    cell, then box-averaged with ``np.add.reduceat``. Regions smaller than the
+    grid are nearest-sampled (pixels repeat). Returns (grid*grid, 3) float32.
+    """
+    grid = max(1, int(grid))
+    crop = crop_region(frame, rect)[..., :3]
+    crop_h, crop_w = int(crop.shape[0]), int(crop.shape[1])
+    if crop_h == 0 or crop_w == 0:
+        return np.zeros((grid * grid, 3), dtype=np.float32)
+
+    step_y = max(1, crop_h // (grid * _CELL_SUBSAMPLE))
+    step_x = max(1, crop_w // (grid * _CELL_SUBSAMPLE))
+    sub = crop[::step_y, ::step_x]
+    sub_h, sub_w = int(sub.shape[0]), int(sub.shape[1])
+
+    if sub_h >= grid and sub_w >= grid:
+        ry = np.linspace(0, sub_h, grid, endpoint=False).astype(np.intp)
+        rx = np.linspace(0, sub_w, grid, endpoint=False).astype(np.intp)
+        sums = np.add.reduceat(
+            np.add.reduceat(sub, ry, axis=0, dtype=np.float32), rx, axis=1
+        )
+        count_y = np.diff(np.append(ry, sub_h)).astype(np.float32)
+        count_x = np.diff(np.append(rx, sub_w)).astype(np.float32)
+        cells = sums / (count_y[:, None] * count_x[None, :])[..., None]
+    else:
+        iy = np.linspace(0, sub_h - 1, grid).round().astype(np.intp)
+        ix = np.linspace(0, sub_w - 1, grid).round().astype(np.intp)
+        cells = sub[np.ix_(iy, ix)].astype(np.float32)
+
+    # BGR → RGB
+    return np.ascontiguousarray(cells[..., ::-1]).reshape(-1, 3)
+
+
+# ---------------------------------------------------------------------------
+# Capture planning
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CapturePlan:
+    """
+    Screen rectangles to grab and where each region lives inside them.
+
+    ``grabs`` are monitor-relative rects; region ``i`` is read from
+    ``grabs[region_grab[i]]`` at the grab-relative ``local_rects[i]``.
+    """
+
+    grabs: list[Rect] = field(default_factory=list)
+    region_grab: list[int] = field(default_factory=list)
+    local_rects: list[Rect] = field(default_factory=list)
+    full_frame: bool = False
+
+
+def _touches(a: Rect, b: Rect) -> bool:
+    return (
+        a[0] <= b[0] + b[2]
+        and b[0] <= a[0] + a[2]
+        and a[1] <= b[1] + b[3]
+        and b[1] <= a[1] + a[3]
+    )
+
+
+def _union(a: Rect, b: Rect) -> Rect:
+    x0 = min(a[0], b[0])
+    y0 = min(a[1], b[1])
+    x1 = max(a[0] + a[2], b[0] + b[2])
+    y1 = max(a[1] + a[3], b[1] + b[3])
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+def _as_rect(rect: Sequence[int]) -> Rect:
+    return (int(rect[0]), int(rect[1]), int(rect[2]), int(rect[3]))
+
+
+def merge_rects(rects: Sequence[Rect]) -> list[Rect]:
+    """Merge overlapping/touching rects into their bounding boxes until stable."""
+    merged = [_as_rect(r) for r in rects if r[2] > 0 and r[3] > 0]
+    changed = True
+    while changed:
+        changed = False
+        out: list[Rect] = []
+        for rect in merged:
+            for i, other in enumerate(out):
+                if _touches(rect, other):
+                    out[i] = _union(rect, other)
+                    changed = True
+                    break
+            else:
+                out.append(rect)
+        merged = out
+    return merged
+
+
+def plan_capture(
+    rects: Sequence[Rect],
+    screen_width: int,
+    screen_height: int,
+    *,
+    full_frame: bool = False,
+) -> CapturePlan:
+    """
+    Minimal set of grabs covering ``rects``.
+
+    Falls back to one full-screen grab when ``full_frame`` is requested or
+    when the merged grabs would cover most of the screen anyway.
+    """
+    screen: Rect = (0, 0, int(screen_width), int(screen_height))
+    if not rects:
+        return CapturePlan()
+    grabs = merge_rects(rects)
+    area = sum(g[2] * g[3] for g in grabs)
+    if (
+        full_frame
+        or not grabs
+        or area >= _FULL_CAPTURE_AREA_RATIO * screen[2] * screen[3]
+    ):
+        return CapturePlan(
+            grabs=[screen],
+            region_grab=[0] * len(rects),
+            local_rects=[_as_rect(r) for r in rects],
+            full_frame=True,
+        )
+    region_grab: list[int] = []
+    local_rects: list[Rect] = []
+    for rect in rects:
+        idx = next((i for i, g in enumerate(grabs) if _touches(rect, g)), None)
+        if idx is None:
+            # Empty region (0 px): sampled as black from the first grab
+            region_grab.append(0)
+            local_rects.append((0, 0, 0, 0))
+            continue
+        g = grabs[idx]
+        region_grab.append(idx)
+        local_rects.append((rect[0] - g[0], rect[1] - g[1], rect[2], rect[3]))
+    return CapturePlan(
+        grabs=grabs, region_grab=region_grab, local_rects=local_rects
+    )
+
+
+# ---------------------------------------------------------------------------
+# Batched color math
+# ---------------------------------------------------------------------------
+
+
+def dominant_colors(samples: np.ndarray) -> np.ndarray:
+    """
+    Filtered, saturation-weighted mean for a batch of regions.
+
+    ``samples`` is (R, N, 3) RGB. Pixels with mean luminance outside
+    (15, 240) are dropped; survivors weigh ``1 + saturation/255``. A region
+    whose pixels were all filtered falls back to a plain mean. Returns (R, 3)
+    int32, truncated like the scalar ``int()`` path.
+    """
+    s = np.asarray(samples, dtype=np.float64)
+    if s.ndim != 3 or s.shape[0] == 0:
+        return np.zeros((0, 3), dtype=np.int32)
+    lum = s.sum(axis=2) / 3.0
+    keep = (lum > _DARK_CUTOFF) & (lum < _BRIGHT_CUTOFF)
+    sat = s.max(axis=2) - s.min(axis=2)
+    weight = np.where(keep, 1.0 + sat / 255.0, 0.0)
+    empty = ~keep.any(axis=1)
+    if np.any(empty):
+        weight[empty] = 1.0
+    totals = weight.sum(axis=1)
+    means = np.einsum("rn,rnc->rc", weight, s) / totals[:, None]
+    # Epsilon: flat regions must not truncate 99.999… down to 99
+    dominant: np.ndarray = np.clip(np.trunc(means + 1e-6), 0, 255).astype(np.int32)
+    return dominant
+
+
+def boost_saturation(colors: np.ndarray, factor: float) -> np.ndarray:
+    """
+    Vectorized twin of ``ScreenMirror._boost_saturation`` for (R, 3) colors.
+
+    Pushes each channel away from the (max+min)//2 midpoint; grays untouched.
+    """
+    c = np.asarray(colors, dtype=np.int32)
+    if c.size == 0:
+        return c.reshape(0, 3)
+    max_c = c.max(axis=1, keepdims=True)
+    min_c = c.min(axis=1, keepdims=True)
+    avg = (max_c + min_c) // 2
+    boosted: np.ndarray = np.trunc(avg + (c - avg) * float(factor))
+    boosted = np.clip(boosted, 0, 255).astype(np.int32)
+    gray = (max_c == min_c).reshape(-1)
+    boosted[gray] = c[gray]
+    return boosted
+
+
+def extract_colors(
+    frame: np.ndarray,
+    rects: Sequence[Rect],
+    *,
+    saturation_boost: float = 1.0,
+    grid: int = SAMPLE_GRID,
+) -> list[tuple[int, int, int]]:
+    """Dominant RGB per rect in one batched pass over the stacked samples."""
+    if not rects:
+        return []
+    samples = np.stack([sample_region(frame, r, grid) for r in rects])
+    colors = boost_saturation(dominant_colors(samples), saturation_boost)
+    return [(int(r), int(g), int(b)) for r, g, b in colors]
+
+
+def extract_planned_colors(
+    frames: Sequence[np.ndarray],
+    plan: CapturePlan,
+    *,
+    saturation_boost: float = 1.0,
+    grid: int = SAMPLE_GRID,
+) -> list[tuple[int, int, int]]:
+    """Like :func:`extract_colors`, reading each region from its planned grab."""
+    if not plan.local_rects:
+        return []
+    samples = np.stack(
+        [
+            sample_region(frames[g], rect, grid)
+            for g, rect in zip(plan.region_grab, plan.local_rects)
+        ]
+    )
+    colors = boost_saturation(dominant_colors(samples), saturation_boost)
+    return [(int(r), int(g), int(b)) for r, g, b in colors]
@@ -3,20 +3,23 @@ Módulo de espelhamento de tela para Philips Hue.
 Captura regiões da tela e aplica as cores dominantes às lâmpadas configuradas.
 """
 
-import json
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
 import mss
+import numpy as np
 from PIL import Image
 
+from marvin_hue import screen_engine
 from marvin_hue.controllers import HueController
-from marvin_hue.eye_safety import is_enabled_for_app
+from marvin_hue.eye_safety import is_enabled_for_app, runtime_policy_version
+from marvin_hue.frame_pipeline import FrameScheduler, LatestSlot, StageTimer
 from marvin_hue.logging_config import get_logger
 from marvin_hue.output.port import LightFrameColor, LightOutputPort
 from marvin_hue.output.rest_adapter import RestPhueAdapter
+from marvin_hue.positions_cache import get_positions_cache
 
 logger = get_logger("screen_mirror")
 
@@ -48,6 +51,11 @@ MIRROR_PROFILES: dict[str, dict[str, float | int]] = {
     },
 }
 
+# Motores de extração de cor dominante.
+# pil: crop + LANCZOS 32x32 + loop Python por região (legado)
+# numpy: buffer BGRA → array uma vez por frame, todas as regiões em um passo
+SCREEN_COLOR_ENGINES: tuple[str, ...] = ("pil", "numpy")
+
 
 @dataclass
 class ScreenRegion:
@@ -67,6 +75,47 @@ class ScreenRegion:
     height: int
 
 
+@dataclass
+class FramePlan:
+    """
+    Geometria e mapeamento de lâmpadas pré-compilados para o loop de captura.
+
+    Construído no start e quando posições, tamanho do monitor ou política de
+    lâmpadas mudam; o loop só faz operações de array sobre ele.
+
+    Attributes:
+        screen_size: (largura, altura) do monitor usado no cálculo
+        positions: Posições ativas, uma por região (ordem das regiões)
+        regions: Região em pixels de cada posição
+        capture: Plano de captura (grabs + retângulos locais)
+        light_names: Lâmpadas ativas, achatadas na ordem das regiões
+        light_region: Índice da região de cada lâmpada (L,)
+        enabled: Se cada lâmpada está habilitada para o app (L,)
+        smoothed: Última cor suavizada enviada por lâmpada (L, 3)
+        has_smoothed: Se ``smoothed`` já tem valor para a lâmpada (L,)
+    """
+
+    screen_size: tuple[int, int]
+    positions: tuple[str, ...]
+    regions: tuple[ScreenRegion, ...]
+    capture: screen_engine.CapturePlan
+    light_names: tuple[str, ...]
+    light_region: np.ndarray
+    enabled: np.ndarray
+    smoothed: np.ndarray
+    has_smoothed: np.ndarray
+    source: list[dict[str, Any]] = field(default_factory=list, repr=False)
+    policy_version: int = 0
+
+    def lights_for_region(self, index: int) -> list[str]:
+        """Lâmpadas mapeadas para a região ``index``."""
+        return [
+            name
+            for name, region in zip(self.light_names, self.light_region)
+            if region == index
+        ]
+
+
 class ScreenMirror:
     """
     Controlador de espelhamento de tela em tempo real.
@@ -109,6 +158,9 @@ class ScreenMirror:
         "ambient": (0.0, 0.0, 1.0, 1.0),  # Tela inteira
     }
 
+    # Posições que cobrem o miolo da tela: captura full em vez de recortes
+    FULL_CAPTURE_POSITIONS = frozenset({"center", "ambient"})
+
     def __init__(
         self,
         hue_controller: HueController,
@@ -122,6 +174,12 @@ class ScreenMirror:
         - Change detection: Só envia atualizações se cor mudou significativamente (threshold: 15 RGB units)
         - Temporal smoothing: Interpolação entre cores para transições suaves
         - Batch processing: Agrupa lâmpadas por posição para otimizar captura
+        - Vetorização: motor ``numpy`` extrai todas as regiões num único passo
+        - Zero-copy: frame é uma view sobre ``screenshot.raw``; só as regiões são lidas
+        - Region-only grab: captura só os retângulos usados pelas posições ativas
+        - Frame plan: regiões, lâmpadas por região e flags pré-compiladas (FramePlan)
+        - Positions cache: JSON de posições só é relido quando o arquivo muda
+        - Pipeline (opcional): captura/análise/envio em threads com slots "latest wins"
         """
         self.hue = hue_controller
         self.positions_file = positions_file
@@ -133,6 +191,7 @@ class ScreenMirror:
         self.saturation_boost = 1.2
         self.smoothing_factor = 0.5  # Fator de suavização (0.0-1.0, menor = mais suave) (OPTIMIZATION: temporal smoothing)
         self.transition_time = 1  # Tempo de transição em décimos de segundo (100ms)
+        self.color_engine = "numpy"  # pil | numpy (OPTIMIZATION: batched extraction)
         self.active_profile: str | None = None
         self.entertainment_area_id: str | None = None
         self.entertainment_enabled: bool = False
@@ -145,6 +204,18 @@ class ScreenMirror:
             str, tuple[int, int, int]
         ] = {}  # Cores suavizadas (OPTIMIZATION: change detection cache)
         self._session_started = False
+        self._frame_plan: FramePlan | None = None
+        # Último plano renderizado (só a thread de análise/render escreve)
+        self._rendered_plan: FramePlan | None = None
+        self._positions: list[dict[str, Any]] = []
+        self.pipelined = False  # capture/analyze/send em threads (OPTIMIZATION: pipeline)
+        self._stage_timers: dict[str, StageTimer] = {
+            stage: StageTimer() for stage in ("capture", "analyze", "send")
+        }
+        self._slots: dict[str, LatestSlot[Any]] = {}
+        self._scheduler: FrameScheduler | None = None
+        self._positions_raw: list[dict[str, Any]] | None = None
+        self._positions_key: tuple[int, int] | None = None
 
     def set_output_port(self, port: LightOutputPort) -> None:
         if self.running:
@@ -172,10 +243,27 @@ class ScreenMirror:
         self.active_profile = name
         logger.info(f"Applied mirror profile '{name}': {MIRROR_PROFILES[name]}")
 
+    def set_color_engine(self, name: str) -> None:
+        """
+        Seleciona o motor de extração de cor (pil | numpy).
+
+        Pode ser trocado com o loop rodando; vale a partir do próximo frame.
+
+        Raises:
+            ValueError: se o nome do motor for desconhecido
+        """
+        if name not in SCREEN_COLOR_ENGINES:
+            raise ValueError(f"Unknown color engine: {name}")
+        self.color_engine = name
+        logger.info(f"Screen mirror color engine: {name}")
+
     def load_light_positions(self) -> list[dict[str, Any]]:
         """
         Carrega a configuração de posicionamento das lâmpadas do arquivo JSON.
 
+        Lido via cache compartilhado (mtime): sem I/O de arquivo por frame; a
+        lista filtrada é reaproveitada enquanto arquivo e política não mudam.
+
         Returns:
             Lista de dicionários com configuração de cada lâmpada ativa.
             Cada dicionário contém: name, position, enabled.
@@ -187,24 +275,23 @@ class ScreenMirror:
                 {"name": "Hue Play 2", "position": "right", "enabled": True}
             ]
         """
-        try:
-            with open(self.positions_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                lights = [
-                    light
-                    for light in data.get("lights", [])
-                    if light.get("enabled")
-                    and light.get("position") != "none"
-                    and is_enabled_for_app(str(light.get("name", "")))
-                ]
-                logger.debug(f"Loaded {len(lights)} active lights from positions file")
-                return lights
-        except FileNotFoundError:
-            logger.warning(f"Positions file not found: {self.positions_file}")
-            return []
-        except json.JSONDecodeError as e:
-            logger.exception(f"Error parsing positions file: {str(e)}")
-            return []
+        cache = get_positions_cache(self.positions_file)
+        raw = cache.lights()
+        key = (cache.version, runtime_policy_version())
+        if self._positions_key == key and self._positions_raw is raw:
+            return self._positions
+        lights = [
+            light
+            for light in raw
+            if light.get("enabled")
+            and light.get("position") != "none"
+            and is_enabled_for_app(str(light.get("name", "")))
+        ]
+        logger.debug(f"Loaded {len(lights)} active lights from positions file")
+        self._positions = lights
+        self._positions_raw = raw
+        self._positions_key = key
+        return lights
 
     def get_screen_region(
         self, position: str, screen_width: int, screen_height: int
@@ -307,6 +394,224 @@ class ScreenMirror:
 
         return r, g, b
 
+    def get_dominant_colors(
+        self, frame: np.ndarray, regions: list[ScreenRegion]
+    ) -> list[tuple[int, int, int]]:
+        """
+        Extrai a cor dominante de várias regiões de um frame BGRA de uma vez.
+
+        Equivalente vetorizado de :meth:`get_dominant_color`: amostra cada
+        região numa grade 32x32 (média de área), filtra pixels escuros/claros,
+        pondera por saturação e aplica o boost — tudo em um passo NumPy.
+
+        Args:
+            frame: Array (H, W, 4) BGRA (ver ``screen_engine.bgra_frame``)
+            regions: Regiões a processar
+
+        Returns:
+            Lista de tuplas (r, g, b) na mesma ordem de ``regions``
+        """
+        return screen_engine.extract_colors(
+            frame,
+            [(r.x, r.y, r.width, r.height) for r in regions],
+            saturation_boost=self.saturation_boost,
+        )
+
+    def plan_capture(
+        self,
+        positions: list[str],
+        screen_width: int,
+        screen_height: int,
+    ) -> screen_engine.CapturePlan:
+        """
+        Planeja os retângulos a capturar para as posições ativas.
+
+        Une regiões sobrepostas em bounding boxes e captura só esses recortes;
+        ``center``/``ambient`` (ou posição desconhecida) forçam captura full.
+
+        Example:
+            >>> plan = mirror.plan_capture(["left", "right"], 1920, 1080)
+            >>> plan.grabs
+            [(0, 216, 288, 648), (1632, 216, 288, 648)]
+        """
+        regions = [
+            self.get_screen_region(position, screen_width, screen_height)
+            for position in positions
+        ]
+        full = any(
+            p in self.FULL_CAPTURE_POSITIONS or p not in self.POSITION_REGIONS
+            for p in positions
+        )
+        return screen_engine.plan_capture(
+            [(r.x, r.y, r.width, r.height) for r in regions],
+            screen_width,
+            screen_height,
+            full_frame=full,
+        )
+
+    def build_frame_plan(
+        self,
+        lights: list[dict[str, Any]],
+        screen_width: int,
+        screen_height: int,
+    ) -> FramePlan:
+        """
+        Compila posições e lâmpadas num FramePlan para o tamanho de tela dado.
+
+        Agrupa as lâmpadas por posição (uma região por posição, mesmo com várias
+        lâmpadas), calcula as regiões em pixels e o plano de captura uma única
+        vez. Cores suavizadas já conhecidas são preservadas.
+        """
+        position_lights: dict[str, list[str]] = {}
+        for light in lights:
+            position_lights.setdefault(light["position"], []).append(light["name"])
+        positions = tuple(position_lights)
+        names: list[str] = []
+        light_region: list[int] = []
+        for index, light_names in enumerate(position_lights.values()):
+            names.extend(light_names)
+            light_region.extend([index] * len(light_names))
+
+        plan = FramePlan(
+            screen_size=(int(screen_width), int(screen_height)),
+            positions=positions,
+            regions=tuple(
+                self.get_screen_region(p, screen_width, screen_height)
+                for p in positions
+            ),
+            capture=self.plan_capture(list(positions), screen_width, screen_height),
+            light_names=tuple(names),
+            light_region=np.asarray(light_region, dtype=np.intp),
+            enabled=np.array([is_enabled_for_app(n) for n in names], dtype=bool),
+            smoothed=np.zeros((len(names), 3), dtype=np.int64),
+            has_smoothed=np.zeros(len(names), dtype=bool),
+            source=lights,
+            policy_version=runtime_policy_version(),
+        )
+        self._seed_smoothing(plan)
+        return plan
+
+    def _seed_smoothing(self, plan: FramePlan) -> None:
+        """Copia para o plano as cores suavizadas já conhecidas por lâmpada."""
+        plan.has_smoothed.fill(False)
+        for i, name in enumerate(plan.light_names):
+            color = self._smoothed_colors.get(name)
+            if color is not None:
+                plan.smoothed[i] = color
+                plan.has_smoothed[i] = True
+
+    def _frame_plan_for(
+        self, lights: list[dict[str, Any]], screen_width: int, screen_height: int
+    ) -> FramePlan:
+        """FramePlan atual, recompilado só se posições/monitor/política mudaram."""
+        plan = self._frame_plan
+        if (
+            plan is None
+            or plan.screen_size != (screen_width, screen_height)
+            or plan.policy_version != runtime_policy_version()
+            or (plan.source is not lights and plan.source != lights)
+        ):
+            plan = self.build_frame_plan(lights, screen_width, screen_height)
+            self._frame_plan = plan
+            logger.debug(
+                f"Frame plan rebuilt: {len(plan.positions)} regions, "
+                f"{len(plan.light_names)} lights, {len(plan.capture.grabs)} grabs"
+            )
+        return plan
+
+    def invalidate_frame_plan(self) -> None:
+        """Força recompilação do FramePlan no próximo frame (ex.: troca de monitor)."""
+        self._frame_plan = None
+        self._rendered_plan = None
+
+    def _render_frame(
+        self,
+        plan: FramePlan,
+        region_colors: list[tuple[int, int, int]],
+        *,
+        batch_all: bool = False,
+    ) -> list[LightFrameColor]:
+        """
+        Suavização + change detection de todas as lâmpadas em operações de array.
+
+        Retorna as cores a enviar; ``batch_all`` (entertainment) envia todas as
+        lâmpadas habilitadas em todo frame.
+        """
+        if plan is not self._rendered_plan:
+            # Plano novo: no modo pipelined ele foi compilado na thread de
+            # captura enquanto esta thread ainda suavizava com o anterior —
+            # re-semeia aqui para não perder o estado dos frames em voo
+            self._seed_smoothing(plan)
+            self._rendered_plan = plan
+        if not plan.light_names:
+            return []
+        colors = np.asarray(region_colors, dtype=np.int64).reshape(-1, 3)
+        targets = colors[plan.light_region]
+        prev = plan.smoothed
+        has = plan.has_smoothed
+
+        interpolated = np.trunc(
+            prev + (targets - prev) * float(self.smoothing_factor)
+        ).astype(np.int64)
+        smoothed = np.where(has[:, None], interpolated, targets)
+        changed = ~has | (np.abs(smoothed - prev).sum(axis=1) > 15)
+        send = plan.enabled & (changed | batch_all)
+        prev[send] = smoothed[send]
+        has |= send
+        current = np.where(has[:, None], prev, targets)
+
+        names = plan.light_names
+        target_rows = targets.tolist()
+        current_rows = current.tolist()
+        brightness = int(self.brightness)
+        frame_colors: list[LightFrameColor] = []
+        for i in np.flatnonzero(plan.enabled).tolist():
+            self._current_colors[names[i]] = tuple(current_rows[i])
+        for i, name in enumerate(names):
+            self._target_colors[name] = tuple(target_rows[i])
+        for i in np.flatnonzero(send).tolist():
+            r, g, b = current_rows[i]
+            self._smoothed_colors[names[i]] = (r, g, b)
+            frame_colors.append(
+                LightFrameColor(
+                    light_name=names[i], r=r, g=g, b=b, brightness=brightness
+                )
+            )
+        return frame_colors
+
+    def _grab_frames(
+        self, sct: Any, monitor: dict[str, int], plan: screen_engine.CapturePlan
+    ) -> list[np.ndarray]:
+        """Captura cada retângulo do plano (coordenadas relativas ao monitor)."""
+        frames: list[np.ndarray] = []
+        for x, y, w, h in plan.grabs:
+            box = {
+                "left": monitor["left"] + x,
+                "top": monitor["top"] + y,
+                "width": w,
+                "height": h,
+            }
+            frames.append(screen_engine.screenshot_frame(sct.grab(box)))
+        return frames
+
+    def _extract_region_colors(
+        self, frames: list[np.ndarray], plan: screen_engine.CapturePlan
+    ) -> list[tuple[int, int, int]]:
+        """Cor dominante por região usando o motor selecionado (color_engine)."""
+        if self.color_engine == "numpy":
+            return screen_engine.extract_planned_colors(
+                frames, plan, saturation_boost=self.saturation_boost
+            )
+        colors: list[tuple[int, int, int]] = []
+        for grab, rect in zip(plan.region_grab, plan.local_rects):
+            image = screen_engine.region_image(frames[grab], rect)
+            colors.append(
+                self.get_dominant_color(
+                    image, ScreenRegion(0, 0, image.width, image.height)
+                )
+            )
+        return colors
+
     def _boost_saturation(self, r: int, g: int, b: int) -> tuple[int, int, int]:
         """Aumenta a saturação da cor para melhor efeito visual."""
         # Converte para HSL simplificado
@@ -403,103 +708,133 @@ class ScreenMirror:
         except Exception as e:
             logger.debug(f"Error applying color to light '{light_name}': {str(e)}")
 
+    def _capture_stage(
+        self, sct: Any, monitor: dict[str, int]
+    ) -> tuple[FramePlan, list[np.ndarray]]:
+        """Estágio 1: posições → FramePlan → grab dos recortes planejados."""
+        started = time.perf_counter()
+        # Carrega configuração de lâmpadas
+        lights = self.load_light_positions()
+
+        # OPTIMIZATION: Frame plan - regiões, grupos por posição e flags
+        # só são recompilados quando posições/monitor/política mudam
+        plan = self._frame_plan_for(lights, monitor["width"], monitor["height"])
+
+        # OPTIMIZATION: Region-only grab - captura só os recortes usados
+        # (full quando center/ambient); zero-copy sobre screenshot.raw
+        frames = self._grab_frames(sct, monitor, plan.capture)
+        self._stage_timers["capture"].record(time.perf_counter() - started)
+        return plan, frames
+
+    def _analyze_stage(
+        self, plan: FramePlan, frames: list[np.ndarray], *, batch_all: bool
+    ) -> list[LightFrameColor]:
+        """Estágio 2: cores por região + suavização/change detection."""
+        started = time.perf_counter()
+        region_colors = self._extract_region_colors(frames, plan.capture)
+        frame_colors = self._render_frame(plan, region_colors, batch_all=batch_all)
+        self._stage_timers["analyze"].record(time.perf_counter() - started)
+        return frame_colors
+
+    def _send_stage(self, frame_colors: list[LightFrameColor]) -> None:
+        """Estágio 3: envio ao output port + callback de status."""
+        started = time.perf_counter()
+        if frame_colors:
+            try:
+                if isinstance(self._output, RestPhueAdapter):
+                    self._output.transition_time = int(round(self.transition_time))
+                self._output.apply_frame(frame_colors)
+            except Exception as e:
+                logger.debug(f"screen apply_frame error: {e}")
+
+        # Notifica mudança de status se houver callback
+        if self._on_status_change:
+            self._on_status_change(
+                {
+                    "running": True,
+                    "fps": self.fps,
+                    "colors": self._current_colors.copy(),
+                    "transport": self._output.transport,
+                }
+            )
+        self._stage_timers["send"].record(time.perf_counter() - started)
+
+    @staticmethod
+    def _merge_frame_colors(
+        older: list[LightFrameColor], newer: list[LightFrameColor]
+    ) -> list[LightFrameColor]:
+        """Frame não enviado + frame novo: a cor mais recente de cada lâmpada vence."""
+        merged = {c.light_name: c for c in older}
+        merged.update((c.light_name, c) for c in newer)
+        return list(merged.values())
+
     def _mirror_loop(self) -> None:
         """Loop principal de captura e aplicação de cores."""
         with mss.mss() as sct:
             # Obtém informações do monitor principal
             monitor = sct.monitors[1]  # Monitor principal
-            screen_width: int = monitor["width"]
-            screen_height: int = monitor["height"]
 
-            frame_time = 1.0 / self.fps
+            if self.pipelined:
+                self._pipelined_loop(sct, monitor)
+                return
+
             batch_all = self._output.transport == "entertainment"
+            scheduler = self._scheduler = FrameScheduler(self.fps)
 
             while self.running:
-                start_time = time.time()
+                plan, frames = self._capture_stage(sct, monitor)
+                frame_colors = self._analyze_stage(plan, frames, batch_all=batch_all)
+                self._send_stage(frame_colors)
 
-                # Captura a tela
-                screenshot = sct.grab(monitor)
-                image = Image.frombytes(
-                    "RGB", screenshot.size, screenshot.bgra, "raw", "BGRX"
-                )
+                # OPTIMIZATION: Throttling - deadlines monotônicos mantêm o FPS
+                # sem drift e sem sobrecarregar a bridge
+                scheduler.set_fps(self.fps)
+                scheduler.wait()
 
-                # Carrega configuração de lâmpadas
-                lights = self.load_light_positions()
-
-                # OPTIMIZATION: Batch processing - agrupa lâmpadas por posição para otimizar
-                # Captura cada região da tela apenas uma vez, mesmo que múltiplas lâmpadas a usem
-                position_lights: dict[str, list[str]] = {}
-                for light in lights:
-                    pos = light["position"]
-                    if pos not in position_lights:
-                        position_lights[pos] = []
-                    position_lights[pos].append(light["name"])
+    def _pipelined_loop(self, sct: Any, monitor: dict[str, int]) -> None:
+        """
+        Modo pipelined: captura (esta thread), análise e envio em threads próprias.
 
-                frame_colors: list[LightFrameColor] = []
+        Estágios ligados por slots "latest wins": a captura nunca espera a
+        bridge; frames que a análise não alcançou são descartados e cores não
+        enviadas são mescladas com as do frame seguinte (por lâmpada).
+        """
+        batch_all = self._output.transport == "entertainment"
+        scheduler = self._scheduler = FrameScheduler(self.fps)
+        to_analyze: LatestSlot[tuple[FramePlan, list[np.ndarray]]] = LatestSlot()
+        to_send: LatestSlot[list[LightFrameColor]] = LatestSlot(
+            merge=self._merge_frame_colors
+        )
+        self._slots = {"analyze": to_analyze, "send": to_send}
 
-                # Processa cada posição
-                for position, light_names in position_lights.items():
-                    region = self.get_screen_region(
-                        position, screen_width, screen_height
-                    )
-                    r, g, b = self.get_dominant_color(image, region)
-
-                    for light_name in light_names:
-                        self._target_colors[light_name] = (r, g, b)
-                        if not is_enabled_for_app(light_name):
-                            continue
-                        target = (r, g, b)
-                        if light_name in self._smoothed_colors:
-                            smoothed = self._interpolate_color(
-                                self._smoothed_colors[light_name], target
-                            )
-                        else:
-                            smoothed = target
-                        if batch_all or self._color_changed_significantly(
-                            light_name, smoothed
-                        ):
-                            self._smoothed_colors[light_name] = smoothed
-                            frame_colors.append(
-                                LightFrameColor(
-                                    light_name=light_name,
-                                    r=smoothed[0],
-                                    g=smoothed[1],
-                                    b=smoothed[2],
-                                    brightness=int(self.brightness),
-                                )
-                            )
-                        if light_name in self._smoothed_colors:
-                            self._current_colors[light_name] = self._smoothed_colors[
-                                light_name
-                            ]
-                        else:
-                            self._current_colors[light_name] = (r, g, b)
-
-                if frame_colors:
-                    try:
-                        if isinstance(self._output, RestPhueAdapter):
-                            self._output.transition_time = int(
-                                round(self.transition_time)
-                            )
-                        self._output.apply_frame(frame_colors)
-                    except Exception as e:
-                        logger.debug(f"screen apply_frame error: {e}")
-
-                # Notifica mudança de status se houver callback
-                if self._on_status_change:
-                    self._on_status_change(
-                        {
-                            "running": True,
-                            "fps": self.fps,
-                            "colors": self._current_colors.copy(),
-                            "transport": self._output.transport,
-                        }
-                    )
+        def _analyze_worker() -> None:
+            while self.running:
+                item = to_analyze.get(timeout=0.5)
+                if item is not None:
+                    to_send.put(self._analyze_stage(*item, batch_all=batch_all))
 
-                # OPTIMIZATION: Throttling - aguarda para manter o FPS e não sobrecarregar a bridge
-                elapsed = time.time() - start_time
-                if elapsed < frame_time:
-                    time.sleep(frame_time - elapsed)
+        def _send_worker() -> None:
+            while self.running:
+                frame_colors = to_send.get(timeout=0.5)
+                if frame_colors is not None:
+                    self._send_stage(frame_colors)
+
+        workers = [
+            threading.Thread(target=_analyze_worker, name="screen-analyze", daemon=True),
+            threading.Thread(target=_send_worker, name="screen-send", daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            while self.running:
+                to_analyze.put(self._capture_stage(sct, monitor))
+                scheduler.set_fps(self.fps)
+                scheduler.wait()
+        finally:
+            to_analyze.close()
+            to_send.close()
+            for worker in workers:
+                worker.join(timeout=2.0)
 
     def start(
         self,
@@ -554,6 +889,11 @@ class ScreenMirror:
         except Exception as e:
             raise RuntimeError(f"Falha ao iniciar transporte de saída: {e}") from e
 
+        self._stage_timers = {
+            stage: StageTimer() for stage in ("capture", "analyze", "send")
+        }
+        self._slots = {}
+        self._scheduler = None
         self.running = True
         self.thread = threading.Thread(target=self._mirror_loop, daemon=True)
         self.thread.start()
@@ -590,6 +930,8 @@ class ScreenMirror:
         self._current_colors.clear()
         self._target_colors.clear()
         self._smoothed_colors.clear()
+        self._frame_plan = None
+        self._rendered_plan = None
         logger.info("Screen mirroring stopped successfully")
         return True
 
@@ -610,6 +952,10 @@ class ScreenMirror:
             - smoothing_factor (float): Fator de suavização temporal
             - transition_time (float): Transição Hue em décimos de segundo
             - active_profile (str|None): Último perfil aplicado
+            - color_engine (str): Motor de extração de cor (pil|numpy)
+            - capture (dict): Último plano de captura (full_frame, grabs)
+            - pipeline (dict): Modo pipelined, tempos por estágio e frames descartados
+            - timing (dict|None): FPS atingido, p50/p99 de frame e deadlines perdidos
             - colors (dict): Mapa nome_lampada -> (r, g, b)
 
         Example:
@@ -625,6 +971,7 @@ class ScreenMirror:
                 }
             }
         """
+        plan = self._frame_plan.capture if self._frame_plan else None
         return {
             "running": self.running,
             "fps": self.fps,
@@ -633,6 +980,21 @@ class ScreenMirror:
             "smoothing_factor": self.smoothing_factor,
             "transition_time": self.transition_time,
             "active_profile": self.active_profile,
+            "color_engine": self.color_engine,
+            "capture": {
+                "full_frame": plan.full_frame if plan else None,
+                "grabs": len(plan.grabs) if plan else 0,
+            },
+            "pipeline": {
+                "enabled": self.pipelined,
+                "stages": {
+                    name: timer.as_dict() for name, timer in self._stage_timers.items()
+                },
+                "dropped": {
+                    name: slot.dropped for name, slot in self._slots.items()
+                },
+            },
+            "timing": self._scheduler.stats() if self._scheduler else None,
             "colors": self._current_colors.copy(),
             "transport": self._output.transport,
             "entertainment_area_id": self.entertainment_area_id,
@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from typing import Optional, Protocol
 from uuid import uuid4
 
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.basics import LightConfig
 from marvin_hue.domain.groups import (
     GroupConflictError,
@@ -143,7 +144,7 @@ class GroupService:
         self,
         group_id: str,
         on: bool,
-        hue: HueGroupController,
+        hue: HueGroupController | AsyncHueController,
     ) -> dict[str, object]:
         """Turn on/off each active member light by registry name."""
         # Ensure group exists
@@ -158,7 +159,13 @@ class GroupService:
                     affected.append(name)
             return affected
 
-        affected = await asyncio.to_thread(_apply)
+        if isinstance(hue, AsyncHueController):
+            results = await asyncio.gather(
+                *(hue.turn_on(name) if on else hue.turn_off(name) for name in names)
+            )
+            affected = [name for name, ok in zip(names, results) if ok]
+        else:
+            affected = await asyncio.to_thread(_apply)
         logger.info(
             f"Group power group_id={group.id} name={group.name!r} on={on} "
             f"members={len(names)} affected={len(affected)}"
@@ -175,7 +182,7 @@ class GroupService:
         self,
         group_id: str,
         config: LightConfig,
-        hue: HueGroupController,
+        hue: HueGroupController | AsyncHueController,
         *,
         transition_time_secs: float = 0,
     ) -> dict[str, object]:
@@ -192,7 +199,10 @@ class GroupService:
         def _apply() -> None:
             hue.apply_light_config(filtered, transition_time_secs)
 
-        await asyncio.to_thread(_apply)
+        if isinstance(hue, AsyncHueController):
+            await hue.apply_light_config(filtered, transition_time_secs)
+        else:
+            await asyncio.to_thread(_apply)
         applied_names = [s.light_name for s in filtered_settings]
         logger.info(
             f"Group apply_config group_id={group.id} config={config.name!r} "
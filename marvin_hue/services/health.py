@@ -1,6 +1,7 @@
 """Health aggregation for dashboard and GET /api/health.
 
-Collects bridge connectivity, light reachability, mirror state, chat
+Collects bridge connectivity, light reachability, mirror state, REST rate
+limiter counters, light-state cache / event stream counters, chat
 availability, and lights-registry stats into a single JSON payload.
 """
 
@@ -10,9 +11,13 @@ import asyncio
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from marvin_hue.async_controller import AsyncHueController
+from marvin_hue.bridge_limiter import RestWriteLimiter
 from marvin_hue.chat import HueLightAgent
 from marvin_hue.config import settings
 from marvin_hue.controllers import HueController
+from marvin_hue.light_events import LightEventStream
+from marvin_hue.light_state import LightStateCache
 from marvin_hue.logging_config import get_logger
 from marvin_hue.screen_mirror import ScreenMirror
 from marvin_hue.services.light_registry import LightRegistryService
@@ -27,17 +32,21 @@ async def collect_health(
     chat_agent: HueLightAgent | None,
     chat_reason: str | None,
     registry: LightRegistryService | None,
+    hue_async: AsyncHueController | None = None,
 ) -> dict[str, Any]:
     """Build the health snapshot for API and dashboard.
 
-    Bridge and light status use thread offload (sync phue I/O). Registry and
-    chat are async/local. Failures degrade to connected=false / zero counts
+    Bridge and light status use thread offload (sync phue I/O), or the pooled
+    async client when ``hue_async`` is given. Registry and chat are
+    async/local. Failures degrade to connected=false / zero counts
     rather than raising, so the dashboard always returns 200.
     """
     now = datetime.now(timezone.utc)
     bridge_block = await _bridge_block(hue)
-    lights_block = await _lights_block(hue, registry)
+    lights_block = await _lights_block(hue_async or hue, registry)
     mirror_block = _mirror_block(screen_mirror)
+    rest_block = _rest_block(hue)
+    light_state_block = _light_state_block(hue)
     chat_block = {
         "available": chat_agent is not None,
         "reason": None if chat_agent is not None else chat_reason,
@@ -49,6 +58,8 @@ async def collect_health(
         "bridge": bridge_block,
         "lights": lights_block,
         "mirror": mirror_block,
+        "rest": rest_block,
+        "light_state": light_state_block,
         "chat": chat_block,
         "registry": registry_block,
         "schedules": schedules_block,
@@ -76,13 +87,16 @@ async def _bridge_block(hue: HueController) -> dict[str, Any]:
 
 
 async def _lights_block(
-    hue: HueController,
+    hue: HueController | AsyncHueController,
     registry: LightRegistryService | None,
 ) -> dict[str, Any]:
     total = 0
     unreachable = 0
     try:
-        status_rows = await asyncio.to_thread(hue.get_lights_status)
+        if isinstance(hue, AsyncHueController):
+            status_rows = await hue.get_lights_status()
+        else:
+            status_rows = await asyncio.to_thread(hue.get_lights_status)
         total = len(status_rows)
         unreachable = sum(1 for row in status_rows if not row.get("reachable", True))
     except Exception as exc:
@@ -116,6 +130,25 @@ def _mirror_block(screen_mirror: ScreenMirror) -> dict[str, Any]:
         return {"running": False, "fps": None, "profile": None}
 
 
+def _rest_block(hue: HueController) -> dict[str, Any]:
+    """Token-bucket counters (coalesced/dropped/throttled) of REST writes."""
+    limiter = getattr(hue, "rest_limiter", None)
+    if not isinstance(limiter, RestWriteLimiter):
+        return {"enabled": False}
+    return limiter.stats()
+
+
+def _light_state_block(hue: HueController) -> dict[str, Any]:
+    """Status cache hits/fetches and, when subscribed, the v2 event stream."""
+    cache = getattr(hue, "state_cache", None)
+    if not isinstance(cache, LightStateCache):
+        return {"enabled": False}
+    block: dict[str, Any] = {"enabled": True, **cache.stats()}
+    events = getattr(hue, "light_events", None)
+    block["events"] = events.stats() if isinstance(events, LightEventStream) else None
+    return block
+
+
 async def _registry_block(
     registry: LightRegistryService | None,
 ) -> dict[str, Any]:
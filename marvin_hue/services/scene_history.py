@@ -5,12 +5,14 @@ from __future__ import annotations
 import asyncio
 from typing import Any, Optional, Protocol
 
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.colors import Color
 from marvin_hue.domain.scene_history import (
     SceneHistoryNotFoundError,
     SceneHistoryValidationError,
     SceneSnapshot,
 )
+from marvin_hue.eye_safety import is_enabled_for_app
 from marvin_hue.logging_config import get_logger
 from marvin_hue.persistence.scene_history_repository import SceneHistoryRepository
 
@@ -31,6 +33,15 @@ class HueSceneController(Protocol):
 
     def set_light_color(self, light_name: str, color: Color) -> object: ...
 
+    def set_light_state(
+        self,
+        light_name: str,
+        color: Color | None = None,
+        *,
+        on: bool | None = None,
+        transition_time: int | None = None,
+    ) -> object: ...
+
 
 class SceneHistoryService:
     """Capture and restore full light scenes via HueController public API."""
@@ -51,17 +62,22 @@ class SceneHistoryService:
 
     async def snapshot(
         self,
-        hue: HueSceneController,
+        hue: HueSceneController | AsyncHueController,
         *,
         source: str,
         label: Optional[str] = None,
     ) -> SceneSnapshot:
         """Capture current lights status and store; prune old rows."""
 
-        def _capture() -> list[dict[str, Any]]:
-            return list(hue.get_lights_status())
+        if isinstance(hue, AsyncHueController):
+            payload = await hue.get_lights_status()
+        else:
+            sync_hue = hue
 
-        payload = await asyncio.to_thread(_capture)
+            def _capture() -> list[dict[str, Any]]:
+                return list(sync_hue.get_lights_status())
+
+            payload = await asyncio.to_thread(_capture)
         snap = SceneSnapshot(source=source, payload=payload, label=label)
         created = await self._repo.create(snap)
         deleted = await self._repo.prune_keep_latest(self._keep_latest)
@@ -79,44 +95,29 @@ class SceneHistoryService:
     async def get_latest(self) -> Optional[SceneSnapshot]:
         return await self._repo.get_latest()
 
-    async def restore_last(self, hue: HueSceneController) -> dict[str, Any]:
+    async def restore_last(
+        self, hue: HueSceneController | AsyncHueController
+    ) -> dict[str, Any]:
         """Restore the most recent snapshot onto the bridge."""
         snap = await self._repo.get_latest()
         if snap is None:
             raise SceneHistoryNotFoundError("No scene snapshot available to restore")
 
-        payload = snap.payload
-
-        def _restore() -> list[str]:
-            restored: list[str] = []
-            for item in payload:
-                if not isinstance(item, dict):
-                    continue
-                name = str(item.get("name") or "").strip()
-                if not name:
-                    continue
-                if not item.get("on"):
-                    hue.turn_off(name)
-                    restored.append(name)
-                    continue
-                hue.turn_on(name)
-                color = item.get("color") or {}
-                if not isinstance(color, dict):
-                    color = {}
-                bri = int(item.get("brightness") or 0)
-                # Color validates 0-255 RGB and 0-254 brightness
-                r = max(0, min(255, int(color.get("r", 0))))
-                g = max(0, min(255, int(color.get("g", 0))))
-                b = max(0, min(255, int(color.get("b", 0))))
-                bri_clamped = max(0, min(254, bri))
-                try:
-                    hue.set_light_color(name, Color(r, g, b, bri_clamped))
-                except (ValueError, TypeError) as exc:
-                    logger.warning(f"restore color failed for {name!r}: {exc}")
-                restored.append(name)
-            return restored
-
-        restored_names = await asyncio.to_thread(_restore)
+        targets = _restore_targets(snap.payload)
+
+        if isinstance(hue, AsyncHueController):
+            written = await asyncio.gather(
+                *(_restore_one_async(hue, name, rgbb) for name, rgbb in targets)
+            )
+        else:
+            sync_hue = hue
+
+            def _restore() -> list[bool]:
+                return [_restore_one(sync_hue, name, rgbb) for name, rgbb in targets]
+
+            written = await asyncio.to_thread(_restore)
+        # Only lights actually written count as restored
+        restored_names = [name for (name, _), ok in zip(targets, written) if ok]
         logger.info(
             f"Restored scene snapshot id={snap.id} source={snap.source!r} "
             f"lights={len(restored_names)}"
@@ -129,3 +130,63 @@ class SceneHistoryService:
             "restored_lights": restored_names,
             "restored_count": len(restored_names),
         }
+
+
+def _restore_targets(payload: Any) -> list[tuple[str, tuple[int, int, int, int] | None]]:
+    """``(name, (r, g, b, bri))`` por lâmpada do snapshot; ``None`` = desligar."""
+    targets: list[tuple[str, tuple[int, int, int, int] | None]] = []
+    for item in payload:
+        if not isinstance(item, dict):
+            continue
+        name = str(item.get("name") or "").strip()
+        if not name:
+            continue
+        if not item.get("on"):
+            targets.append((name, None))
+            continue
+        color = item.get("color") or {}
+        if not isinstance(color, dict):
+            color = {}
+        bri = int(item.get("brightness") or 0)
+        # Color validates 0-255 RGB and 0-254 brightness
+        r = max(0, min(255, int(color.get("r", 0))))
+        g = max(0, min(255, int(color.get("g", 0))))
+        b = max(0, min(255, int(color.get("b", 0))))
+        targets.append((name, (r, g, b, max(0, min(254, bri)))))
+    return targets
+
+
+def _restore_one(
+    hue: HueSceneController, name: str, rgbb: tuple[int, int, int, int] | None
+) -> bool:
+    """One coalesced PUT (on + xy + bri). False = skipped; bridge errors propagate."""
+    if not is_enabled_for_app(name):
+        logger.debug(f"restore skipped: {name!r} desabilitada no app")
+        return False
+    try:
+        if rgbb is None:
+            hue.set_light_state(name, on=False)
+        else:
+            hue.set_light_state(name, Color(*rgbb), on=True)
+    except (ValueError, TypeError) as exc:
+        # Unknown light / invalid color — not a bridge failure
+        logger.warning(f"restore failed for {name!r}: {exc}")
+        return False
+    return True
+
+
+async def _restore_one_async(
+    hue: AsyncHueController, name: str, rgbb: tuple[int, int, int, int] | None
+) -> bool:
+    if not is_enabled_for_app(name):
+        logger.debug(f"restore skipped: {name!r} desabilitada no app")
+        return False
+    try:
+        if rgbb is None:
+            await hue.set_light_state(name, on=False)
+        else:
+            await hue.set_light_state(name, Color(*rgbb), on=True)
+    except (ValueError, TypeError) as exc:
+        logger.warning(f"restore failed for {name!r}: {exc}")
+        return False
+    return True
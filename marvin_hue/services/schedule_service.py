@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional, Protocol
 from uuid import uuid4
 
+from marvin_hue.async_controller import AsyncHueController
 from marvin_hue.basics import LightConfig, LightSetupsManager
 from marvin_hue.domain.schedules import (
     Schedule,
@@ -41,7 +42,7 @@ class ScheduleService:
         self,
         repo: ScheduleRepository,
         *,
-        hue: Optional[HueScheduleController] = None,
+        hue: Optional[HueScheduleController | AsyncHueController] = None,
         manager: Optional[LightSetupsManager] = None,
         group_service: Optional[GroupService] = None,
     ) -> None:
@@ -53,7 +54,7 @@ class ScheduleService:
     def bind(
         self,
         *,
-        hue: Optional[HueScheduleController] = None,
+        hue: Optional[HueScheduleController | AsyncHueController] = None,
         manager: Optional[LightSetupsManager] = None,
         group_service: Optional[GroupService] = None,
     ) -> None:
@@ -264,7 +265,10 @@ class ScheduleService:
         def _apply() -> None:
             hue.apply_light_config(config, transition)
 
-        await asyncio.to_thread(_apply)
+        if isinstance(hue, AsyncHueController):
+            await hue.apply_light_config(config, transition)
+        else:
+            await asyncio.to_thread(_apply)
         return {"action": "apply_config", "config_name": config_name}
 
     async def _exec_power(self, *, on: bool, payload: dict[str, Any]) -> dict[str, Any]:
@@ -280,19 +284,32 @@ class ScheduleService:
         hue = self._hue
         assert hue is not None
 
-        def _all_power() -> list[str]:
-            status = hue.get_lights_status()
-            affected: list[str] = []
-            for item in status:
-                name = str(item.get("name") or "").strip()
-                if not name:
-                    continue
-                ok = hue.turn_on(name) if on else hue.turn_off(name)
-                if ok:
-                    affected.append(name)
-            return affected
-
-        affected = await asyncio.to_thread(_all_power)
+        if isinstance(hue, AsyncHueController):
+            names = [
+                name
+                for item in await hue.get_lights_status()
+                if (name := str(item.get("name") or "").strip())
+            ]
+            results = await asyncio.gather(
+                *(hue.turn_on(name) if on else hue.turn_off(name) for name in names)
+            )
+            affected = [name for name, ok in zip(names, results) if ok]
+        else:
+            sync_hue = hue
+
+            def _all_power() -> list[str]:
+                status = sync_hue.get_lights_status()
+                affected: list[str] = []
+                for item in status:
+                    name = str(item.get("name") or "").strip()
+                    if not name:
+                        continue
+                    ok = sync_hue.turn_on(name) if on else sync_hue.turn_off(name)
+                    if ok:
+                        affected.append(name)
+                return affected
+
+            affected = await asyncio.to_thread(_all_power)
         return {
             "action": "power_on" if on else "power_off",
             "affected": affected,
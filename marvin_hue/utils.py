@@ -1,5 +1,31 @@
+from collections.abc import Sequence
 from functools import lru_cache
 
+import numpy as np
+
+# Branco D65 (retorno para RGB preto, onde xy é indefinido)
+_WHITE_XY = (0.3127, 0.3290)
+
+# Matriz Wide RGB D65: RGB linear -> CIE XYZ (linhas X, Y, Z)
+_RGB_TO_XYZ = np.array(
+    [
+        [0.664511, 0.154324, 0.162028],
+        [0.283881, 0.668433, 0.047685],
+        [0.000088, 0.072310, 0.986039],
+    ]
+)
+
+
+def _srgb_to_linear(norm: np.ndarray) -> np.ndarray:
+    """Correção gamma reversa (sRGB 0-1 -> RGB linear), vetorizada."""
+    return np.where(
+        norm > 0.04045, ((norm + 0.055) / (1.0 + 0.055)) ** 2.4, norm / 12.92
+    )
+
+
+# LUT gamma: os 256 níveis sRGB de 8 bits já linearizados
+_GAMMA_LUT = _srgb_to_linear(np.arange(256, dtype=np.float64) / 255.0)
+
 
 class ColorConverter:
     """
@@ -84,6 +110,52 @@ class ColorConverter:
         y = Y / xyz_sum
         return (x, y)
 
+    @staticmethod
+    def rgb_to_xy_array(
+        rgb: np.ndarray | Sequence[tuple[int, int, int]], *, use_lut: bool = True
+    ) -> np.ndarray:
+        """
+        Converte um lote de cores RGB para XY numa única chamada.
+
+        Mesma conversão de :meth:`rgb_to_xy` (gamma sRGB, matriz Wide RGB D65,
+        preto -> branco D65), sem cache e sem loop Python: um frame inteiro
+        de lâmpadas converte de uma vez.
+
+        Args:
+            rgb: Array ``(..., 3)`` de inteiros 0-255 (ex.: ``(N, 3)`` do frame)
+            use_lut: Lineariza via LUT de 256 níveis (default) em vez de ``**2.4``
+
+        Returns:
+            np.ndarray: Array float64 ``(..., 2)`` com as coordenadas (x, y)
+
+        Raises:
+            ValueError: Se o shape não terminar em 3 ou houver valores fora de 0-255
+        """
+        arr = np.asarray(rgb)
+        if arr.ndim == 0 or arr.shape[-1] != 3:
+            raise ValueError(f"Esperado array (..., 3) de RGB, recebido shape {arr.shape}")
+        # uint8 (ex.: pixels de frame) já garante o intervalo
+        if arr.dtype != np.uint8 and arr.size and (arr.min() < 0 or arr.max() > 255):
+            raise ValueError("Valores RGB devem estar entre 0-255")
+
+        if use_lut and np.issubdtype(arr.dtype, np.integer):
+            # OPTIMIZATION: LUT gamma - indexação em vez de pow por canal
+            linear = _GAMMA_LUT[arr]
+        else:
+            linear = _srgb_to_linear(arr.astype(np.float64) / 255.0)
+
+        xyz = linear @ _RGB_TO_XYZ.T
+        xyz_sum = xyz.sum(axis=-1)
+        dark = xyz_sum < 0.00001
+        has_dark = bool(dark.any())
+        if has_dark:
+            xyz_sum = np.where(dark, 1.0, xyz_sum)
+        xy = xyz[..., :2] / xyz_sum[..., None]
+        if has_dark:
+            # Retorna branco se a soma for zero (como rgb_to_xy)
+            xy[dark] = _WHITE_XY
+        return np.asarray(xy, dtype=np.float64)
+
     @staticmethod
     def xy_to_rgb(
         xy: tuple[float, float], brightness: int = 254
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark: RGB→XY escalar (lru_cache) vs vetorizado (NumPy, LUT gamma).
+
+Simula frames de mirror com cores que variam continuamente (o cache de 256
+entradas do caminho escalar quase nunca acerta) e mede o tempo por frame de:
+
+* escalar com cache frio (``cache_clear`` a cada frame);
+* escalar com cache quente (mesmo frame repetido, melhor caso do lru_cache);
+* ``rgb_to_xy_array`` com LUT gamma de 256 níveis;
+* ``rgb_to_xy_array`` com a fórmula ``**2.4`` direta.
+
+Não usa bridge — roda em qualquer máquina.
+
+Uso:
+  uv run python scripts/bench_color_convert.py
+  uv run python scripts/bench_color_convert.py --lights 10 --frames 2000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Repo root on path for `marvin_hue` when run as script
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from marvin_hue.utils import ColorConverter  # noqa: E402
+
+
+def _time(fn, frames: list) -> float:
+    fn(frames[0])  # warm-up
+    start = time.perf_counter()
+    for frame in frames:
+        fn(frame)
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def _scalar_cold(frame: np.ndarray) -> None:
+    ColorConverter.rgb_to_xy.cache_clear()
+    for r, g, b in frame.tolist():
+        ColorConverter.rgb_to_xy(r, g, b)
+
+
+def _scalar_warm(frame: np.ndarray) -> None:
+    for r, g, b in frame.tolist():
+        ColorConverter.rgb_to_xy(r, g, b)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lights", type=int, default=10, help="cores por frame")
+    parser.add_argument("--frames", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    frames = list(rng.integers(0, 256, size=(args.frames, args.lights, 3)))
+
+    # Sanidade: os dois caminhos concordam
+    ref = np.array([ColorConverter.rgb_to_xy(*map(int, c)) for c in frames[0]])
+    err = float(np.abs(ColorConverter.rgb_to_xy_array(frames[0]) - ref).max())
+
+    warm_frame = [frames[0]] * args.frames
+    results = {
+        "scalar (cold cache)": _time(_scalar_cold, frames),
+        "scalar (warm cache)": _time(_scalar_warm, warm_frame),
+        "vectorized + LUT": _time(ColorConverter.rgb_to_xy_array, frames),
+        "vectorized (pow)": _time(
+            lambda f: ColorConverter.rgb_to_xy_array(f, use_lut=False), frames
+        ),
+    }
+
+    print(f"{args.lights} colors/frame, {args.frames} frames, max |Δxy| = {err:.2e}")
+    base = results["scalar (cold cache)"]
+    for name, us in results.items():
+        print(f"  {name:<22} {us:9.1f} µs/frame   x{base / us:5.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark: extração de cor dominante PIL (legado) vs NumPy (batched).
+
+Também mede o path PIL sobre o frame zero-copy (Image só por região).
+
+Gera um frame BGRA sintético (ruído + gradiente) do tamanho pedido e mede o
+tempo por frame de cada motor para as posições informadas. Não usa mss nem
+bridge — roda em qualquer máquina.
+
+Uso:
+  uv run python scripts/bench_screen_engine.py
+  uv run python scripts/bench_screen_engine.py --width 3840 --height 2160 \\
+      --positions left,right,top,bottom,ambient --frames 30
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+from PIL import Image
+
+# Repo root on path for `marvin_hue` when run as script
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from marvin_hue import screen_engine  # noqa: E402
+from marvin_hue.screen_mirror import ScreenMirror  # noqa: E402
+
+
+def _synthetic_bgra(width: int, height: int, seed: int = 3) -> bytes:
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    frame[..., 2] = np.linspace(0, 255, width, dtype=np.uint8)[None, :]
+    return frame.tobytes()
+
+
+def _time(fn, frames: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=2560)
+    parser.add_argument("--height", type=int, default=1440)
+    parser.add_argument(
+        "--positions",
+        default="left,right,top,bottom,top-left,top-right,"
+        "bottom-left,bottom-right,center,ambient",
+    )
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    positions = [p.strip() for p in args.positions.split(",") if p.strip()]
+    regions = [
+        mirror.get_screen_region(p, args.width, args.height) for p in positions
+    ]
+    bgra = _synthetic_bgra(args.width, args.height)
+    size = (args.width, args.height)
+
+    def _pil() -> None:
+        image = Image.frombytes("RGB", size, bgra, "raw", "BGRX")
+        for region in regions:
+            mirror.get_dominant_color(image, region)
+
+    raw = bytearray(bgra)
+
+    full_plan = screen_engine.plan_capture(
+        [(r.x, r.y, r.width, r.height) for r in regions],
+        args.width,
+        args.height,
+        full_frame=True,
+    )
+
+    def _pil_regions() -> None:
+        frame = screen_engine.bgra_frame(memoryview(raw), args.width, args.height)
+        mirror.set_color_engine("pil")
+        mirror._extract_region_colors([frame], full_plan)
+
+    def _numpy() -> None:
+        frame = screen_engine.bgra_frame(memoryview(raw), args.width, args.height)
+        mirror.get_dominant_colors(frame, regions)
+
+    pil_ms = _time(_pil, args.frames)
+    pil_reg_ms = _time(_pil_regions, args.frames)
+    np_ms = _time(_numpy, args.frames)
+    print(
+        f"frame {args.width}x{args.height}, {len(regions)} regions, "
+        f"{args.frames} frames"
+    )
+    print(f"pil    {pil_ms:8.2f} ms/frame  (full-frame Image)")
+    print(f"pil/rg {pil_reg_ms:8.2f} ms/frame  (zero-copy, region-only Image)")
+    print(f"numpy  {np_ms:8.2f} ms/frame  ({pil_ms / max(np_ms, 1e-9):.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
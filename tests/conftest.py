@@ -8,8 +8,8 @@ including mocks for hardware interactions and test clients for the API.
 import json
 import tempfile
 from pathlib import Path
-from typing import Generator
-from unittest.mock import Mock
+from typing import Any, Callable, Generator, Iterable
+from unittest.mock import MagicMock, Mock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -181,6 +181,41 @@ def mock_hue_controller(mock_phue_bridge: Mock, monkeypatch):
     return controller
 
 
+@pytest.fixture
+def offline_hue() -> Callable[..., Any]:
+    """Factory for a HueController built without connecting to a bridge.
+
+    ``offline_hue(names, **attrs)`` creates one MagicMock light per name
+    (``light_id`` 1..N, ``bridge.set_light`` answering success) and sets every
+    attribute ``__init__`` would, with the optional features (groups, scenes,
+    state cache, gamuts, limiter) off. ``attrs`` overrides any of them.
+    """
+    from marvin_hue.controllers import HueController
+
+    def _make(names: Iterable[str] = (), **attrs: Any) -> HueController:
+        controller = HueController.__new__(HueController)
+        controller.bridge = MagicMock()
+        controller.lights = []
+        for light_id, name in enumerate(names, start=1):
+            light = MagicMock()
+            light.name = name
+            light.light_id = light_id
+            light.bridge.set_light.return_value = [[{"success": {}}]]
+            controller.lights.append(light)
+        controller._light_cache = {light.name: light for light in controller.lights}
+        controller.rest_limiter = None
+        controller._groups = None
+        controller._scenes = None
+        controller.state_cache = None
+        controller.light_events = None
+        controller.gamuts = None
+        for key, value in attrs.items():
+            setattr(controller, key, value)
+        return controller
+
+    return _make
+
+
 @pytest.fixture
 def mock_light_setups_manager(sample_setups_json: Path, monkeypatch):
     """Provides a LightSetupsManager with test data."""
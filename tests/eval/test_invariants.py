@@ -129,16 +129,11 @@ def test_eval_turn_off_all_calls_set_all_false():
     controller.set_all.assert_called_once_with(False)
 
 
-def test_eval_eye_safety_all_max_via_chokepoint():
+def test_eval_eye_safety_all_max_via_chokepoint(offline_hue):
     """Caso `eye-safety-all-max` (level=code), contra o chokepoint REAL:
     set_all_brightness clampa POR LÂMPADA (Tarefa 2.3)."""
-    from unittest.mock import MagicMock
-    from marvin_hue.controllers import HueController
-    c = HueController.__new__(HueController)  # sem conectar à bridge
-    fita = MagicMock(); fita.name = "Fita Led"
-    teto = MagicMock(); teto.name = "Lâmpada 1"
-    c.lights = [fita, teto]
-    c._light_cache = {fita.name: fita, teto.name: teto}
+    c = offline_hue(["Fita Led", "Lâmpada 1"])  # sem conectar à bridge
+    fita, teto = c.lights
     c.set_all_brightness(254)
     assert fita.brightness == 63   # 25% de 254 floored (nunca 64)
     assert teto.brightness == 254  # sem restrição
@@ -0,0 +1,99 @@
+"""Local stand-in for the Hue bridge v2 event stream (``/eventstream/clip/v2``).
+
+Plain HTTP on 127.0.0.1 with an ephemeral port; ``push`` sends one SSE
+``update`` event to every connected client, ``drop_clients`` closes them to
+exercise reconnects. Requests with the wrong ``hue-application-key`` get 403.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+_CLOSE = object()
+
+
+class FakeHueEventServer:
+    def __init__(self, app_key: str = "test-key") -> None:
+        self.app_key = app_key
+        self.connections = 0
+        self._clients: list[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._connected = threading.Condition(self._lock)
+        self._event_id = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def __enter__(self) -> "FakeHueEventServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.drop_clients()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def wait_for_clients(self, count: int = 1, timeout: float = 5.0) -> bool:
+        with self._connected:
+            return self._connected.wait_for(lambda: self.connections >= count, timeout)
+
+    def push(self, *resources: dict[str, Any]) -> None:
+        self._event_id += 1
+        event = [{"id": f"evt-{self._event_id}", "type": "update", "data": list(resources)}]
+        message = f"id: {self._event_id}:0\ndata: {json.dumps(event)}\n\n".encode()
+        with self._lock:
+            for client in self._clients:
+                client.put(message)
+
+    def drop_clients(self) -> None:
+        with self._lock:
+            for client in self._clients:
+                client.put(_CLOSE)
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if self.path != "/eventstream/clip/v2":
+                    self.send_error(404)
+                    return
+                if self.headers.get("hue-application-key") != server.app_key:
+                    self.send_error(403)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                self.wfile.write(b": hi\n\n")
+                self.wfile.flush()
+                inbox: queue.Queue = queue.Queue()
+                with server._connected:
+                    server._clients.append(inbox)
+                    server.connections += 1
+                    server._connected.notify_all()
+                try:
+                    while True:
+                        message = inbox.get()
+                        if message is _CLOSE:
+                            break
+                        self.wfile.write(message)
+                        self.wfile.flush()
+                except OSError:
+                    pass
+                finally:
+                    with server._lock:
+                        server._clients.remove(inbox)
+
+        return Handler
@@ -0,0 +1,190 @@
+"""AsyncHueController: same commands as the sync controller over a pooled async client."""
+
+from __future__ import annotations
+
+import json
+from typing import Callable
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from marvin_hue import eye_safety as es
+from marvin_hue.async_controller import AsyncHueController
+from marvin_hue.basics import LightConfig, LightSetting
+from marvin_hue.bridge_groups import BridgeGroups
+from marvin_hue.colors import Color
+from marvin_hue.controllers import HueController
+from marvin_hue.light_state import LightStateCache
+from marvin_hue.services.scene_history import _restore_targets
+
+NAMES = ["Lâmpada 1", "Lâmpada 2", "Fita Led"]
+
+
+class _FakeBridgeHTTP:
+    """REST v1 subset answered by an httpx.MockTransport."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str, dict | None]] = []
+        self.lights = {
+            str(i): {
+                "name": name,
+                "uniqueid": f"00:17:88:01:00:00:00:0{i}-0b",
+                "state": {"on": False, "bri": 100, "xy": [0.3, 0.3], "reachable": True},
+            }
+            for i, name in enumerate(NAMES, start=1)
+        }
+        self.fail_bulk = False
+        self.down: set[str] = set()
+        self.reject: set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/user")
+        body = json.loads(request.content) if request.content else None
+        self.requests.append((request.method, path, body))
+        if request.method == "GET" and path == "/lights":
+            if self.fail_bulk:
+                return httpx.Response(503, json=[])
+            return httpx.Response(200, json=self.lights)
+        if request.method == "GET" and path.startswith("/lights/"):
+            light_id = path.rsplit("/", 1)[1]
+            if light_id in self.down:
+                raise httpx.ConnectTimeout("timed out", request=request)
+            return httpx.Response(200, json=self.lights[light_id])
+        if request.method == "PUT" and path.startswith("/lights/"):
+            if path.split("/")[2] in self.reject:
+                return httpx.Response(
+                    200, json=[{"error": {"type": 201, "description": "Device is set to off."}}]
+                )
+        if request.method == "PUT":
+            return httpx.Response(
+                200, json=[{"success": {f"{path}/{k}": v}} for k, v in body.items()]
+            )
+        return httpx.Response(404, json=[{"error": {"type": 3}}])
+
+    def writes(self) -> list[tuple[str, str, dict | None]]:
+        return [r for r in self.requests if r[0] != "GET"]
+
+
+@pytest.fixture
+def bridge() -> _FakeBridgeHTTP:
+    return _FakeBridgeHTTP()
+
+
+@pytest.fixture
+async def hue_async(
+    bridge: _FakeBridgeHTTP, offline_hue: Callable[..., HueController]
+):
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(bridge), base_url="http://bridge/api/user"
+    )
+    controller = AsyncHueController(offline_hue(NAMES), client=client)
+    yield controller
+    await controller.aclose()
+
+
+def setup_function() -> None:
+    es.clear_runtime_policy()
+
+
+def teardown_function() -> None:
+    es.clear_runtime_policy()
+
+
+async def test_set_light_state_sends_same_body_as_sync(
+    hue_async: AsyncHueController, bridge: _FakeBridgeHTTP
+) -> None:
+    color = Color(255, 80, 20, 200)
+    await hue_async.set_light_color("Fita Led", color)
+    expected = hue_async.hue.light_state_body("Fita Led", color)
+    assert bridge.writes() == [("PUT", "/lights/3/state", expected)]
+
+
+async def test_rejected_write_raises(
+    hue_async: AsyncHueController, bridge: _FakeBridgeHTTP
+) -> None:
+    bridge.reject.add("2")
+    with pytest.raises(RuntimeError, match="rejeitou"):
+        await hue_async.set_light_color("Lâmpada 2", Color(255, 0, 0, 200))
+
+
+async def test_unknown_and_disabled_lights(
+    hue_async: AsyncHueController, bridge: _FakeBridgeHTTP
+) -> None:
+    with pytest.raises(ValueError, match="não encontrada"):
+        await hue_async.set_light_color("Nope", Color(1, 2, 3, 4))
+    es.set_runtime_policy(limits_pct={}, disabled_names={"Lâmpada 2"})
+    assert await hue_async.turn_on("Lâmpada 2") is False
+    assert await hue_async.turn_on("Lâmpada 1") is True
+    assert bridge.writes() == [("PUT", "/lights/1/state", {"on": True})]
+
+
+async def test_apply_uses_group_zero_for_identical_bodies(
+    hue_async: AsyncHueController, bridge: _FakeBridgeHTTP
+) -> None:
+    hue_async.hue._groups = BridgeGroups(MagicMock())
+    same = Color(255, 140, 60, 60)  # abaixo do clamp ocular de todas
+    config = LightConfig("relax", [LightSetting(name, same) for name in NAMES], "d")
+    await hue_async.apply_light_config(config, transition_time_secs=1)
+    (method, path, body), = bridge.writes()
+    assert (method, path) == ("PUT", "/groups/0/action")
+    assert body["on"] is True and body["transitiontime"] == 10
+    # Group 0 needs no group lookup on the bridge
+    hue_async.hue._groups.bridge.get_group.assert_not_called()
+
+
+async def test_apply_falls_back_to_parallel_per_light_puts(
+    hue_async: AsyncHueController, bridge: _FakeBridgeHTTP
+) -> None:
+    hue_async.hue._groups = None
+    config = LightConfig(
+        "mix",
+        [LightSetting(name, Color(10 * i, 20, 30, 100)) for i, name in enumerate(NAMES)],
+        "d",
+    )
+    await hue_async.apply_light_config(config)
+    assert sorted(path for _, path, _ in bridge.writes()) == [
+        "/lights/1/state",
+        "/lights/2/state",
+        "/lights/3/state",
+    ]
+
+
+async def test_status_uses_one_get_and_the_shared_cache(
+    hue_async: AsyncHueController, bridge: _FakeBridgeHTTP
+) -> None:
+    hue_async.hue.state_cache = LightStateCache(lambda: pytest.fail("sync fetch"), ttl=60)
+    status = await hue_async.get_lights_status()
+    assert [s["name"] for s in status] == NAMES
+    await hue_async.turn_on("Lâmpada 2")
+    status = await hue_async.get_lights_status()
+    assert status[1]["on"] is True
+    assert [r[:2] for r in bridge.requests if r[0] == "GET"] == [("GET", "/lights")]
+
+
+async def test_list_bridge_lights(hue_async: AsyncHueController) -> None:
+    inventory = await hue_async.list_bridge_lights()
+    assert inventory[0] == {"name": "Lâmpada 1", "bridge_light_id": "00:17:88:01:00:00:00:01-0b"}
+
+
+def test_restore_targets_from_snapshot_rows() -> None:
+    rows = [
+        {"name": "A", "on": False},
+        {"name": "B", "on": True, "brightness": 300, "color": {"r": 300, "g": 1, "b": 2}},
+        {"name": "", "on": True},
+        "junk",
+    ]
+    assert _restore_targets(rows) == [("A", None), ("B", (255, 1, 2, 254))]
+
+
+async def test_status_degrades_per_light_when_bulk_read_fails(
+    hue_async: AsyncHueController, bridge: _FakeBridgeHTTP
+) -> None:
+    bridge.fail_bulk = True
+    bridge.down = {"2"}
+    bridge.lights["1"]["state"]["on"] = True
+    status = await hue_async.get_lights_status()
+    assert [s["name"] for s in status] == NAMES
+    assert status[0]["on"] is True and "error" not in status[0]
+    assert status[1]["reachable"] is False and "timed out" in status[1]["error"]
+    assert "error" not in status[2]
@@ -6,12 +6,16 @@ import numpy as np
 import pytest
 
 from marvin_hue.audio_engine import (
+    BAND_EDGES,
+    DEFAULT_HOP_SIZE,
     DEFAULT_SPECTRUM_BINS,
+    SPECTRUM_WEIGHTINGS,
     AnalysisFrame,
     AnalyzerConfig,
     AudioAnalyzer,
     AutoScaler,
     EnvelopeFollower,
+    LogSpectrumBank,
     density_to_level,
     entertainment_color,
     hsv_to_rgb,
@@ -265,3 +269,208 @@ def test_entertainment_color_all_positions(pos: str) -> None:
         position=pos,
     )
     assert all(0 <= c <= 255 for c in rgb)
+
+
+def test_analyzer_rejects_unknown_dtype() -> None:
+    with pytest.raises(ValueError, match="dtype"):
+        AudioAnalyzer(config=AnalyzerConfig(dtype="float16"))
+
+
+def test_analyzer_float32_matches_float64() -> None:
+    sr = 44100
+    frames = {}
+    for dtype in ("float64", "float32"):
+        az = AudioAnalyzer(sample_rate=sr, config=AnalyzerConfig(dtype=dtype))
+        block = _sine(80.0, sr, 1024, amp=0.35) + _sine(3000.0, sr, 1024, amp=0.1)
+        for _ in range(12):
+            frames[dtype] = az.process(block)
+    a, b = frames["float64"], frames["float32"]
+    assert b.bass == pytest.approx(a.bass, abs=1e-3)
+    assert b.centroid == pytest.approx(a.centroid, abs=1e-3)
+    assert b.spectrum == pytest.approx(a.spectrum, abs=1e-3)
+
+
+def test_analyzer_steady_state_allocates_no_arrays() -> None:
+    import tracemalloc
+
+    sr = 44100
+    az = AudioAnalyzer(sample_rate=sr)
+    block = _sine(220.0, sr, 1024, amp=0.3)
+    for _ in range(8):  # fill ring, warm caches
+        az.process(block)
+    tracemalloc.start()
+    try:
+        worst = 0
+        for _ in range(10):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            az.process(block)
+            worst = max(worst, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    # A single 4096-sample float64 copy would already be 32 KiB
+    assert worst < 16 * 1024
+
+
+@pytest.mark.parametrize("sr", [8000, 16000, 44100, 48000])
+def test_band_densities_match_masked_means(sr: int) -> None:
+    az = AudioAnalyzer(sample_rate=sr)
+    rng = np.random.default_rng(3)
+    ws = az._ws
+    ws.powers[:] = rng.random(ws.powers.shape)
+    dens, dens_ui = az._band_densities()
+    nyq = sr / 2.0
+    for name, (lo, hi) in BAND_EDGES.items():
+        mask = (ws.freqs >= lo) & (ws.freqs < min(hi, nyq))
+        for got, row in ((dens, ws.power), (dens_ui, ws.power_ui)):
+            want = float(np.mean(row[mask])) if mask.any() else 0.0
+            assert got[name] == pytest.approx(want, rel=1e-9)
+
+
+def test_spectrum_envelope_matches_envelope_follower() -> None:
+    az = AudioAnalyzer(config=AnalyzerConfig(spectrum_bins=128))
+    refs = [EnvelopeFollower(attack=0.55, release=0.14) for _ in range(128)]
+    rng = np.random.default_rng(11)
+    for _ in range(20):
+        target = rng.random(128) * 1.2 - 0.1
+        want = [env.process(float(x)) for env, x in zip(refs, target)]
+        got = az._follow_spectrum(target.copy())
+        assert got == pytest.approx(want, abs=1e-12)
+
+
+def test_wide_spectrum_stays_in_range_and_resets() -> None:
+    sr = 44100
+    az = AudioAnalyzer(sample_rate=sr, config=AnalyzerConfig(spectrum_bins=128))
+    block = _sine(120.0, sr, 1024, amp=0.3) + _sine(5000.0, sr, 1024, amp=0.1)
+    for _ in range(10):
+        frame = az.process(block)
+    assert len(frame.spectrum) == 128
+    assert all(0.0 <= v <= 1.0 for v in frame.spectrum)
+    assert max(frame.spectrum) > 0.1
+    for _ in range(6):  # flush the 4096-sample ring, then decay
+        silent = az.process(np.zeros(1024, dtype=np.float32))
+    assert max(silent.spectrum) < max(frame.spectrum)
+    az.reset()
+    assert az._spectrum.tolist() == [0.0] * 128
+    assert az._spec_hold.tolist() == [0.0] * 128
+
+
+def test_log_bank_rect_sums_log_ranges() -> None:
+    bank = LogSpectrumBank(44100, 4096, n_bins=32)
+    power = np.random.default_rng(2).random(2049)
+    freqs = np.fft.rfftfreq(4096, d=1.0 / 44100)
+    edges = np.geomspace(30.0, 16000.0, 33)
+    got = bank.map_power(power)
+    for i in range(32):
+        start = int(np.searchsorted(freqs, edges[i]))
+        end = max(start + 1, int(np.searchsorted(freqs, edges[i + 1])))
+        assert got[i] == pytest.approx(float(np.sum(power[start:end])))
+
+
+@pytest.mark.parametrize("weighting", SPECTRUM_WEIGHTINGS)
+def test_log_bank_weightings_place_tone_in_order(weighting: str) -> None:
+    bank = LogSpectrumBank(48000, 4096, n_bins=64, weighting=weighting)
+    assert np.all(np.diff(bank.indptr) > 0)  # no empty bars
+    assert np.all((bank.weights > 0.0) & (bank.weights <= 1.0))
+    freqs = np.fft.rfftfreq(4096, d=1.0 / 48000)
+    peaks = []
+    for hz in (100.0, 1000.0, 8000.0):
+        power = np.zeros(2049)
+        power[int(np.argmin(np.abs(freqs - hz)))] = 1.0
+        peaks.append(int(np.argmax(bank.map_power(power))))
+    assert peaks == sorted(peaks) and len(set(peaks)) == 3
+
+
+def test_log_bank_rejects_bad_input() -> None:
+    with pytest.raises(ValueError, match="weighting"):
+        LogSpectrumBank(44100, 4096, weighting="bark")
+    bank = LogSpectrumBank(44100, 4096)
+    with pytest.raises(ValueError, match="bins"):
+        bank.map_power(np.zeros(1025))
+
+
+def test_configure_switches_spectrum_weighting() -> None:
+    sr = 44100
+    az = AudioAnalyzer(sample_rate=sr)
+    az.configure(spectrum_weighting="mel", spectrum_bins=64)
+    assert az._log_bank.weighting == "mel"
+    block = _sine(440.0, sr, 1024)
+    for _ in range(6):
+        frame = az.process(block)
+    assert len(frame.spectrum) == 64
+    assert max(frame.spectrum) > 0.1
+    with pytest.raises(ValueError, match="weighting"):
+        az.configure(spectrum_weighting="bark")
+
+
+def test_process_hops_emits_one_frame_per_hop() -> None:
+    sr = 44100
+    az = AudioAnalyzer(sample_rate=sr, config=AnalyzerConfig(hop_size=512))
+    assert az.hop_rate == pytest.approx(sr / 512)
+    signal = _sine(200.0, sr, 512 * 20)
+    counts = []
+    pos = 0
+    for size in (100, 300, 112, 2048, 1, 511, 4096, 3072):
+        counts.append(len(az.process_hops(signal[pos : pos + size])))
+        pos += size
+    assert counts == [0, 0, 1, 4, 0, 1, 8, 6]
+    assert sum(counts) == pos // 512
+
+
+def test_process_hops_independent_of_block_size() -> None:
+    sr = 44100
+    t = np.arange(512 * 24) / sr
+    wobble = 1 + np.sin(2 * np.pi * 3 * t)
+    signal = (0.3 * np.sin(2 * np.pi * 90 * t) * wobble).astype(np.float32)
+    runs = []
+    for block in (160, 512, 1999):
+        az = AudioAnalyzer(sample_rate=sr, config=AnalyzerConfig(hop_size=512))
+        frames = []
+        for i in range(0, signal.size, block):
+            frames.extend(az.process_hops(signal[i : i + block]))
+        runs.append(frames)
+    assert [len(r) for r in runs] == [24, 24, 24]
+    for other in runs[1:]:
+        for a, b in zip(runs[0], other):
+            assert b.bass == pytest.approx(a.bass, abs=1e-9)
+            assert b.beat == pytest.approx(a.beat, abs=1e-9)
+            assert b.spectrum == pytest.approx(a.spectrum, abs=1e-9)
+
+
+def test_analyzer_rejects_bad_hop_size() -> None:
+    with pytest.raises(ValueError, match="hop_size"):
+        AudioAnalyzer(config=AnalyzerConfig(hop_size=0))
+
+
+def test_configure_dtype_rebuilds_workspace() -> None:
+    sr = 44100
+    az = AudioAnalyzer(sample_rate=sr)
+    block = _sine(150.0, sr, 1024, amp=0.3)
+    for _ in range(6):
+        az.process(block)
+    with pytest.raises(ValueError, match="dtype"):
+        az.configure(dtype="float16")
+    assert az.config.dtype == "float64"
+    az.configure(dtype="float32")
+    assert az.config.dtype == "float32"
+    assert az._ws.dtype == np.float32
+    assert az._ring.dtype == np.float32
+    frame = az.process(block)
+    assert frame.bass > 0.0
+
+
+def test_configure_hop_and_buffer_size_take_effect() -> None:
+    sr = 44100
+    az = AudioAnalyzer(sample_rate=sr)
+    with pytest.raises(ValueError, match="hop_size"):
+        az.configure(hop_size=0)
+    assert az.config.hop_size == DEFAULT_HOP_SIZE
+    az.configure(hop_size=256)
+    assert az.hop_size == 256
+    assert len(az.process_hops(_sine(200.0, sr, 1024))) == 4
+    az.configure(buffer_size=1024)
+    assert az._ws.size == 1024
+    assert az._log_bank.fft_size == 1024
+    frames = az.process_hops(_sine(200.0, sr, 2048, amp=0.3))
+    assert len(frames) == 8
+    assert frames[-1].bass > 0.0
@@ -305,6 +305,31 @@ def test_apply_profile_party(mirror: AudioMirror) -> None:
     assert mirror.energy_gain == expected["energy_gain"]
 
 
+def test_apply_profile_enables_streaming_analysis(mirror: AudioMirror) -> None:
+    mirror.apply_profile("pulse")
+    expected = AUDIO_MIRROR_PROFILES["pulse"]
+    config = mirror._analyzer.config
+    assert config.streaming is True
+    assert mirror._analyzer.hop_size == expected["hop_size"]
+    assert mirror._analyzer._ws.size == expected["buffer_size"]
+    with (
+        patch("marvin_hue.audio_mirror.is_enabled_for_app", return_value=True),
+        patch.object(
+            mirror._analyzer, "process_hops", wraps=mirror._analyzer.process_hops
+        ) as hops,
+    ):
+        sr = mirror._analyzer.sample_rate
+        t = np.arange(1024) / sr
+        samples = (0.9 * np.sin(2 * np.pi * 100 * t)).astype(np.float32)
+        mirror._process_frame(samples, sr)
+    assert hops.call_count == 1
+    assert mirror._levels["bass"] > 0.0
+
+    mirror.apply_profile("chill")
+    assert mirror._analyzer.config.streaming is False
+    assert mirror._analyzer.hop_size == AUDIO_MIRROR_PROFILES["chill"]["hop_size"]
+
+
 def test_apply_profile_unknown_raises(mirror: AudioMirror) -> None:
     with pytest.raises(ValueError, match="Unknown audio profile"):
         mirror.apply_profile("cinema")
@@ -443,7 +468,7 @@ def test_process_frame_applies_colors(mirror: AudioMirror) -> None:
         samples = (0.9 * np.sin(2 * np.pi * 100 * t)).astype(np.float32)
         mirror._process_frame(samples, sr)
     # Hue controller should have been called for enabled lights (via RestPhueAdapter)
-    assert mirror.hue.set_light_color.called
+    assert mirror.hue.set_light_state.called
     assert mirror._levels["bass"] >= 0.0
 
 
@@ -597,3 +622,19 @@ def test_process_frame_base_silence_dims(mirror: AudioMirror) -> None:
     assert color is not None
     # Dimmed floor — well below full base
     assert sum(color) < sum((255, 180, 80)) * 0.4
+
+
+def test_process_frame_streaming_updates_once_per_hop(mirror: AudioMirror) -> None:
+    from marvin_hue.audio_engine import AnalyzerConfig, AudioAnalyzer
+
+    sr = 22050
+    mirror._analyzer = AudioAnalyzer(
+        sample_rate=sr, config=AnalyzerConfig(streaming=True, hop_size=512)
+    )
+    t = np.arange(256) / sr
+    samples = (0.9 * np.sin(2 * np.pi * 100 * t)).astype(np.float32)
+    with patch("marvin_hue.audio_mirror.is_enabled_for_app", return_value=True):
+        mirror._process_frame(samples, sr)  # half a hop: nothing to show yet
+        assert not mirror.hue.set_light_state.called
+        mirror._process_frame(samples, sr)
+    assert mirror.hue.set_light_state.called
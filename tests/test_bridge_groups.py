@@ -0,0 +1,217 @@
+"""Group-action fast path for presets and "all lights" commands."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from marvin_hue import eye_safety as es
+from marvin_hue.basics import LightConfig, LightSetting
+from marvin_hue.bridge_groups import DEFAULT_MAX_CREATED, BridgeGroups, group_name
+from marvin_hue.colors import Color
+from marvin_hue.controllers import HueController
+
+OfflineHue = Callable[..., HueController]
+
+
+class _FakeBridge:
+    def __init__(self, groups: dict | None = None) -> None:
+        self.groups = groups or {}
+        self.actions: list[tuple[int, dict]] = []
+        self.created: list[tuple[str, list[str]]] = []
+        self.fail_actions = False
+
+    def get_group(self) -> dict:
+        return self.groups
+
+    def create_group(self, name: str, lights: list[str]) -> list:
+        gid = str(100 + len(self.created))
+        self.created.append((name, lights))
+        self.groups[gid] = {"name": name, "lights": lights}
+        return [{"success": {"id": gid}}]
+
+    def delete_group(self, group_id: int) -> list:
+        del self.groups[str(group_id)]
+        return [{"success": f"/groups/{group_id} deleted"}]
+
+    def set_group(self, group_id: int, body: dict) -> list:
+        self.actions.append((group_id, body))
+        if self.fail_actions:
+            return [[{"error": {"description": "resource not available"}}]]
+        return [[{"success": {k: v}} for k, v in body.items()]]
+
+
+def _groups(
+    bridge: _FakeBridge, max_created: int = DEFAULT_MAX_CREATED
+) -> BridgeGroups:
+    return BridgeGroups(bridge, max_created=max_created)
+
+
+def _config(*settings: tuple[str, Color]) -> LightConfig:
+    return LightConfig("preset", [LightSetting(n, col) for n, col in settings], "d")
+
+
+def setup_function() -> None:
+    es.clear_runtime_policy()
+
+
+def teardown_function() -> None:
+    es.clear_runtime_policy()
+
+
+WARM = Color(255, 180, 100, 200)
+
+
+def test_identical_states_share_one_group_action(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(
+        ["Lâmpada 1", "Lâmpada 2", "Lâmpada 3", "Hue Iris"], _groups=_groups(bridge)
+    )
+    c.apply_light_config(
+        _config(
+            ("Lâmpada 1", WARM),
+            ("Lâmpada 2", WARM),
+            ("Lâmpada 3", WARM),
+            ("Hue Iris", Color(0, 0, 255, 120)),
+        ),
+        transition_time_secs=1,
+    )
+    assert len(bridge.created) == 1
+    assert sorted(bridge.created[0][1]) == ["1", "2", "3"]
+    assert len(bridge.actions) == 1
+    group_id, body = bridge.actions[0]
+    assert group_id == 100
+    assert body["on"] is True and body["bri"] == 200 and body["transitiontime"] == 10
+    # The odd one out still gets its own PUT; grouped lights get none
+    c._light_cache["Hue Iris"].bridge.set_light.assert_called_once()
+    c._light_cache["Lâmpada 1"].bridge.set_light.assert_not_called()
+
+
+def test_group_reused_and_existing_room_preferred(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge({"7": {"name": "Sala", "lights": ["1", "2"]}})
+    c = offline_hue(["Lâmpada 1", "Lâmpada 2", "Hue Iris"], _groups=_groups(bridge))
+    cfg = _config(("Lâmpada 1", WARM), ("Lâmpada 2", WARM))
+    c.apply_light_config(cfg)
+    c.apply_light_config(cfg)
+    assert bridge.created == []
+    assert [gid for gid, _ in bridge.actions] == [7, 7]
+
+
+def test_all_lights_use_group_zero(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(["Lâmpada 1", "Lâmpada 2"], _groups=_groups(bridge))
+    c.set_all(False)
+    assert bridge.actions == [(0, {"on": False})]
+    assert bridge.created == []
+
+
+def test_set_all_brightness_groups_by_clamped_value(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(["Fita Led", "Led cima", "Lâmpada 1"], _groups=_groups(bridge))
+    c.set_all_brightness(254)
+    # Both restricted lamps clamp to 63 and share a group; the ceiling stays 254
+    assert bridge.actions == [(100, {"bri": 63})]
+    assert c._light_cache["Lâmpada 1"].brightness == 254
+
+
+def test_eye_safety_splits_groups_for_same_requested_color(
+    offline_hue: OfflineHue,
+) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(["Fita Led", "Lâmpada 1", "Lâmpada 2"], _groups=_groups(bridge))
+    bright = Color(255, 255, 255, 254)
+    c.apply_light_config(
+        _config(("Fita Led", bright), ("Lâmpada 1", bright), ("Lâmpada 2", bright))
+    )
+    assert [body["bri"] for _, body in bridge.actions] == [254]
+    fita_body = c._light_cache["Fita Led"].bridge.set_light.call_args[0][1]
+    assert fita_body["bri"] == 63
+
+
+def test_disabled_lights_never_join_a_group(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(["Lâmpada 1", "Lâmpada 2", "Lâmpada 3"], _groups=_groups(bridge))
+    es.set_runtime_policy(limits_pct={}, disabled_names={"Lâmpada 3"})
+    c.set_all(True)
+    assert bridge.actions == [(100, {"on": True})]
+    assert sorted(bridge.created[0][1]) == ["1", "2"]
+
+
+def test_failed_action_falls_back_to_per_light(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    bridge.fail_actions = True
+    c = offline_hue(["Lâmpada 1", "Lâmpada 2"], _groups=_groups(bridge))
+    c.apply_light_config(_config(("Lâmpada 1", WARM), ("Lâmpada 2", WARM)))
+    assert len(bridge.actions) == 1
+    for light in c.lights:
+        light.bridge.set_light.assert_called_once()
+
+
+def test_group_cap_falls_back_to_per_light(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(
+        ["Lâmpada 1", "Lâmpada 2", "Lâmpada 3"],
+        _groups=_groups(bridge, max_created=0),
+    )
+    c.apply_light_config(_config(("Lâmpada 1", WARM), ("Lâmpada 2", WARM)))
+    assert bridge.actions == []
+    assert c._light_cache["Lâmpada 1"].bridge.set_light.call_count == 1
+
+
+def test_group_name_is_stable_and_short() -> None:
+    assert group_name(["2", "10", "1"]) == group_name(["1", "2", "10"])
+    assert len(group_name([str(i) for i in range(50)])) <= 32
+
+
+@pytest.mark.parametrize("single", [["Lâmpada 1"], []])
+def test_single_light_never_uses_groups(
+    single: list[str],
+    offline_hue: OfflineHue,
+) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(["Lâmpada 1", "Lâmpada 2"], _groups=_groups(bridge))
+    c.apply_light_config(_config(*[(n, WARM) for n in single]))
+    assert bridge.actions == []
+
+
+def test_groups_are_not_created_unless_enabled(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge({"7": {"name": "Sala", "lights": ["1", "2"]}})
+    # BridgeGroups default: no creation
+    c = offline_hue(["Lâmpada 1", "Lâmpada 2", "Lâmpada 3"], _groups=BridgeGroups(bridge))
+    es.set_runtime_policy(limits_pct={}, disabled_names={"Lâmpada 2"})
+    c.set_all(True)
+    assert bridge.created == []
+    assert bridge.actions == []
+    for name in ("Lâmpada 1", "Lâmpada 3"):
+        assert c._light_cache[name].on is True
+    es.clear_runtime_policy()
+    c.apply_light_config(_config(("Lâmpada 1", WARM), ("Lâmpada 2", WARM)))
+    assert bridge.actions == [(7, bridge.actions[0][1])]  # existing room still used
+
+
+def test_delete_app_groups_removes_only_marvin_groups(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge({"7": {"name": "Sala", "lights": ["1", "2"]}})
+    c = offline_hue(["Lâmpada 1", "Lâmpada 2", "Lâmpada 3"], _groups=_groups(bridge))
+    c.apply_light_config(_config(("Lâmpada 1", WARM), ("Lâmpada 3", WARM)))
+    assert len(bridge.created) == 1
+    assert c.delete_app_groups() == 1
+    assert list(bridge.groups) == ["7"]
+    # Cache dropped: next resolve re-reads the bridge and recreates on demand
+    c.apply_light_config(_config(("Lâmpada 1", WARM), ("Lâmpada 3", WARM)))
+    assert len(bridge.created) == 2
+
+
+def test_api_cleanup_deletes_marvin_groups(
+    fastapi_test_client,
+    mock_hue_controller,
+) -> None:
+    mock_hue_controller.bridge.get_group.return_value = {
+        "1": {"name": "Sala", "lights": ["1", "2"]},
+        "9": {"name": "marvin-abc", "lights": ["1", "3"]},
+    }
+    mock_hue_controller.bridge.delete_group.return_value = [{"success": "/groups/9 deleted"}]
+    response = fastapi_test_client.post("/configurations/groups/cleanup")
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 1}
+    mock_hue_controller.bridge.delete_group.assert_called_once_with(9)
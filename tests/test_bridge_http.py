@@ -0,0 +1,102 @@
+"""Keep-alive bridge HTTP transport (local HTTP/1.1 server, no bridge)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from marvin_hue.bridge_http import KeepAliveTransport, install_keepalive
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+    close_next = False
+
+    def _reply(self, payload: object) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if _Handler.close_next:
+            _Handler.close_next = False
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        _Handler.connections.add(self.client_address[1])
+        self._reply({"path": self.path})
+
+    def do_PUT(self) -> None:  # noqa: N802
+        _Handler.connections.add(self.client_address[1])
+        length = int(self.headers["Content-Length"])
+        data = json.loads(self.rfile.read(length))
+        self._reply([{"success": data}])
+
+    def log_message(self, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = set()
+    _Handler.close_next = False
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _transport(srv: ThreadingHTTPServer) -> KeepAliveTransport:
+    host, port = srv.server_address[:2]
+    return KeepAliveTransport(f"{host}:{port}", timeout=5)
+
+
+def test_requests_reuse_one_connection(server) -> None:
+    transport = _transport(server)
+    for i in range(5):
+        out = transport.request("PUT", "/api/u/lights/1/state", {"bri": i})
+        assert out == [{"success": {"bri": i}}]
+    assert transport.request("GET", "/api/u/lights") == {"path": "/api/u/lights"}
+    assert len(_Handler.connections) == 1
+    transport.close()
+
+
+def test_reconnects_after_server_closes_connection(server) -> None:
+    transport = _transport(server)
+    _Handler.close_next = True
+    transport.request("GET", "/a")
+    transport.request("GET", "/b")
+    assert len(_Handler.connections) == 2
+    transport.close()
+
+
+def test_one_connection_per_thread(server) -> None:
+    transport = _transport(server)
+    threads = [
+        threading.Thread(target=transport.request, args=("GET", f"/t{i}"))
+        for i in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(_Handler.connections) == 3
+    transport.close()
+
+
+def test_install_keepalive_replaces_request_only_for_real_bridges() -> None:
+    bridge = MagicMock()
+    assert install_keepalive(bridge) is None
+    bridge.ip = "192.168.1.100"
+    transport = install_keepalive(bridge)
+    assert transport is not None
+    assert bridge.request == transport.request
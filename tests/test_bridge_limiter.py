@@ -0,0 +1,180 @@
+"""REST write limiter: token bucket, per-light coalescing, health counters."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from marvin_hue.bridge_http import KeepAliveTransport
+from marvin_hue.bridge_limiter import RestWriteLimiter, TokenBucket, build_rest_limiter
+from marvin_hue.output.port import LightFrameColor
+from marvin_hue.output.rest_adapter import RestPhueAdapter
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 50.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket_burst_then_rate() -> None:
+    clock = _FakeClock()
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # Third and fourth callers queue behind each other
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    clock.now += 1.0
+    assert bucket.tokens == pytest.approx(2.0)
+
+
+def test_token_bucket_rejects_zero_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+
+
+def test_acquire_sleeps_once_bucket_is_empty() -> None:
+    clock = _FakeClock()
+    limiter = RestWriteLimiter(rate=5, burst=1, clock=clock, sleep=clock.sleep)
+    start = clock.now
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.now - start == pytest.approx(0.4)
+    assert limiter.stats()["throttled"] == 2
+
+
+def test_submit_coalesces_pending_commands_per_light() -> None:
+    gate = threading.Event()
+    started = threading.Event()
+    sent: list[tuple[str, int]] = []
+    limiter = RestWriteLimiter(rate=1000, burst=1000, max_in_flight=1)
+
+    def command(name: str, value: int):
+        def run() -> None:
+            started.set()
+            gate.wait(2.0)
+            sent.append((name, value))
+
+        return run
+
+    # First command occupies the single worker; the rest stay pending
+    limiter.submit("A", command("A", 0))
+    assert started.wait(2.0)
+    for value in range(1, 6):
+        limiter.submit("A", command("A", value))
+        limiter.submit("B", command("B", value))
+    gate.set()
+    assert limiter.flush(timeout=2.0)
+    limiter.close()
+
+    assert sent[0] == ("A", 0)
+    # Only the newest pending command per light reaches the bridge
+    assert sorted(sent[1:]) == [("A", 5), ("B", 5)]
+    stats = limiter.stats()
+    assert stats["submitted"] == 11
+    assert stats["sent"] == 3
+    assert stats["coalesced"] == 8
+    assert stats["pending"] == 0
+
+
+def test_close_drops_pending_and_rejects_new_commands() -> None:
+    waiting = threading.Event()
+
+    def slow_sleep(seconds: float) -> None:
+        waiting.set()
+        threading.Event().wait(0.2)
+
+    limiter = RestWriteLimiter(rate=1, burst=1, sleep=slow_sleep)
+    limiter.bucket.reserve()  # drain the only token so the dispatcher waits
+    sent: list[str] = []
+    limiter.submit("A", lambda: sent.append("A"))
+    limiter.submit("B", lambda: sent.append("B"))
+    assert waiting.wait(1.0)
+    limiter.close()
+    limiter.submit("C", lambda: sent.append("C"))
+    assert sent == []
+    stats = limiter.stats()
+    assert stats["dropped"] == 3
+    assert stats["sent"] == 0
+
+
+def test_discard_counts_dropped() -> None:
+    limiter = RestWriteLimiter(rate=1000, burst=1000)
+    limiter._pending["A"] = lambda: None
+    limiter._pending["B"] = lambda: None
+    assert limiter.discard(["A", "C"]) == 1
+    assert limiter.stats()["dropped"] == 1
+    assert list(limiter._pending) == ["B"]
+
+
+def test_dispatched_command_does_not_pay_twice() -> None:
+    clock = _FakeClock()
+    limiter = RestWriteLimiter(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+    transport = KeepAliveTransport("127.0.0.1")
+    transport.limiter = limiter
+    calls: list[str] = []
+
+    def fake_request() -> None:
+        # Same check as KeepAliveTransport.request for a PUT
+        transport.limiter.acquire()
+        calls.append("put")
+
+    limiter.submit("A", fake_request)
+    assert limiter.flush(timeout=2.0)
+    limiter.close()
+    assert calls == ["put"]
+    assert limiter.stats()["throttled"] == 0
+
+
+def test_build_rest_limiter_disabled_at_zero() -> None:
+    assert build_rest_limiter(0, 10) is None
+    limiter = build_rest_limiter(10, 5, max_in_flight=2)
+    assert limiter is not None
+    assert limiter.stats()["burst"] == 5
+    assert limiter.max_in_flight == 2
+
+
+def test_rest_adapter_routes_frames_through_limiter() -> None:
+    hue = MagicMock()
+    hue.rest_limiter = RestWriteLimiter(rate=1000, burst=1000)
+    adapter = RestPhueAdapter(hue, max_in_flight=4)
+    adapter.apply_frame(
+        [LightFrameColor("A", 255, 0, 0, 200), LightFrameColor("B", 0, 255, 0, 200)]
+    )
+    assert hue.rest_limiter.flush(timeout=2.0)
+    hue.rest_limiter.close()
+    names = sorted(call.args[0] for call in hue.set_light_state.call_args_list)
+    assert names == ["A", "B"]
+    assert hue.rest_limiter.stats()["sent"] == 2
+
+
+def test_health_exposes_rest_counters(fastapi_test_client) -> None:
+    from marvin_hue.api import dependencies
+
+    hue = dependencies.get_hue_controller()
+    original = getattr(hue, "rest_limiter", None)
+    limiter = RestWriteLimiter(rate=10, burst=10)
+    limiter.coalesced = 7
+    limiter.dropped = 2
+    hue.rest_limiter = limiter
+    try:
+        rest = fastapi_test_client.get("/api/health").json()["rest"]
+    finally:
+        hue.rest_limiter = original
+    assert rest["enabled"] is True
+    assert rest["coalesced"] == 7
+    assert rest["dropped"] == 2
+    assert rest["rate"] == 10.0
+
+
+def test_health_rest_block_disabled_without_limiter(fastapi_test_client) -> None:
+    rest = fastapi_test_client.get("/api/health").json()["rest"]
+    assert rest == {"enabled": False}
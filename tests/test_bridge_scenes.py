@@ -0,0 +1,163 @@
+"""Presets materialized as bridge scenes: content hash, sync, one-call recall."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from marvin_hue import eye_safety as es
+from marvin_hue.basics import LightConfig, LightSetting
+from marvin_hue.bridge_scenes import BridgeSceneStore, scene_content_hash, scene_name
+from marvin_hue.colors import Color
+from marvin_hue.controllers import HueController
+
+OfflineHue = Callable[..., HueController]
+
+
+class _FakeBridge:
+    """Enough of the REST v1 scenes/groups API for the scene store."""
+
+    username = "user"
+
+    def __init__(self) -> None:
+        self.scenes: dict[str, dict] = {}
+        self.calls: list[tuple[str, str]] = []
+
+    def request(self, mode: str, address: str, data: dict | None = None):
+        self.calls.append((mode, address))
+        path = address.removeprefix("/api/user")
+        if mode == "GET" and path == "/scenes":
+            return dict(self.scenes)
+        if mode == "POST" and path == "/scenes":
+            scene_id = f"s{len(self.scenes) + 1}"
+            self.scenes[scene_id] = dict(data)
+            return [{"success": {"id": scene_id}}]
+        if mode == "DELETE" and path.startswith("/scenes/"):
+            del self.scenes[path.rsplit("/", 1)[1]]
+            return [{"success": path}]
+        if mode == "PUT" and path == "/groups/0/action":
+            return [{"success": {f"/groups/0/action/{k}": v}} for k, v in data.items()]
+        raise AssertionError(f"unexpected request {mode} {address}")
+
+    def writes(self) -> list[tuple[str, str]]:
+        return [c for c in self.calls if c[0] != "GET"]
+
+
+NAMES = ["Lâmpada 1", "Lâmpada 2", "Fita Led"]
+
+
+RELAX = LightConfig(
+    "relax",
+    [
+        LightSetting("Lâmpada 1", Color(255, 140, 60, 150)),
+        LightSetting("Lâmpada 2", Color(255, 120, 40, 120)),
+        LightSetting("Fita Led", Color(255, 80, 20, 254)),
+    ],
+    "d",
+)
+
+
+def setup_function() -> None:
+    es.clear_runtime_policy()
+
+
+def teardown_function() -> None:
+    es.clear_runtime_policy()
+
+
+def test_sync_uploads_once_then_skips_unchanged(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(NAMES, _scenes=BridgeSceneStore(bridge))
+    first = c.sync_scenes([RELAX])
+    assert first["uploaded"] == ["relax"]
+    scene = bridge.scenes["s1"]
+    assert scene["name"] == "marvin:relax"
+    assert scene["lights"] == ["1", "2", "3"]
+    # Eye-safety clamp is baked into the materialized state
+    assert scene["lightstates"]["3"]["bri"] == 63
+    assert scene["appdata"]["data"] == scene_content_hash(scene["lightstates"])
+
+    writes = len(bridge.writes())
+    second = c.sync_scenes([RELAX])
+    assert second["unchanged"] == ["relax"]
+    assert second["uploaded"] == [] and second["deleted"] == 0
+    assert len(bridge.writes()) == writes
+
+
+def test_apply_recalls_scene_in_one_call(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(NAMES, _scenes=BridgeSceneStore(bridge))
+    c.sync_scenes([RELAX])
+    bridge.calls.clear()
+    c.apply_light_config(RELAX, transition_time_secs=2)
+    assert bridge.writes() == [("PUT", "/api/user/groups/0/action")]
+    for light in c.lights:
+        light.bridge.set_light.assert_not_called()
+
+
+def test_changed_preset_is_reuploaded_and_old_scene_deleted(
+    offline_hue: OfflineHue,
+) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(NAMES, _scenes=BridgeSceneStore(bridge))
+    c.sync_scenes([RELAX])
+    edited = LightConfig(
+        "relax", [LightSetting("Lâmpada 1", Color(10, 20, 30, 40))], "d"
+    )
+    # Before re-sync the stale scene must not be recalled
+    c.apply_light_config(edited)
+    c._light_cache["Lâmpada 1"].bridge.set_light.assert_called_once()
+
+    summary = c.sync_scenes([edited])
+    assert summary["uploaded"] == ["relax"]
+    assert summary["deleted"] == 1
+    assert list(bridge.scenes) == ["s2"]
+
+
+def test_policy_change_falls_back_to_per_light(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(NAMES, _scenes=BridgeSceneStore(bridge))
+    c.sync_scenes([RELAX])
+    es.set_runtime_policy(limits_pct={}, disabled_names={"Lâmpada 2"})
+    bridge.calls.clear()
+    c.apply_light_config(RELAX)
+    assert ("PUT", "/api/user/groups/0/action") not in bridge.calls
+    c._light_cache["Lâmpada 2"].bridge.set_light.assert_not_called()
+    c._light_cache["Lâmpada 1"].bridge.set_light.assert_called_once()
+
+
+def test_preset_with_unknown_light_is_skipped(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    c = offline_hue(NAMES, _scenes=BridgeSceneStore(bridge))
+    ghost = LightConfig("ghost", [LightSetting("Nope", Color(1, 2, 3, 4))], "d")
+    summary = c.sync_scenes([ghost])
+    assert summary["skipped"] == ["ghost"]
+    assert bridge.scenes == {}
+
+
+def test_foreign_scenes_are_left_alone(offline_hue: OfflineHue) -> None:
+    bridge = _FakeBridge()
+    bridge.scenes["app1"] = {"name": "Savanna sunset", "appdata": {"data": "x"}}
+    c = offline_hue(NAMES, _scenes=BridgeSceneStore(bridge))
+    c.sync_scenes([RELAX])
+    assert "app1" in bridge.scenes
+
+
+def test_sync_requires_scene_recall(offline_hue: OfflineHue) -> None:
+    c = offline_hue()
+    with pytest.raises(RuntimeError, match="SCENE_SYNC"):
+        c.sync_scenes([RELAX])
+
+
+def test_scene_name_fits_bridge_limit() -> None:
+    assert len(scene_name("x" * 80)) == 32
+
+
+def test_api_sync_disabled_returns_409(
+    fastapi_test_client,
+    mock_hue_controller,
+) -> None:
+    mock_hue_controller._scenes = None
+    response = fastapi_test_client.post("/configurations/scenes/sync")
+    assert response.status_code == 409
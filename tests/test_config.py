@@ -37,6 +37,15 @@ def isolate_env_vars(monkeypatch):
         "ENTERTAINMENT_AREA_ID",
         "ENTERTAINMENT_CREDS_FILE",
         "ENTERTAINMENT_FPS",
+        "ENTERTAINMENT_INTERPOLATION",
+        "ENTERTAINMENT_ANALYSIS_FPS",
+        "REST_MAX_IN_FLIGHT",
+        "REST_RATE_LIMIT",
+        "REST_BURST",
+        "REST_GROUP_ACTIONS",
+        "SCENE_SYNC",
+        "LIGHT_STATE_TTL",
+        "LIGHT_EVENTS",
     ]
     # Salva valores originais
     original_values = {var: os.environ.get(var) for var in env_vars}
@@ -361,6 +370,8 @@ class TestAppDbPathSettings:
         assert settings.entertainment_area_id is None
         assert settings.entertainment_creds_file == ".res/hue_entertainment_creds.json"
         assert settings.entertainment_fps == 40
+        assert settings.entertainment_interpolation == "linear"
+        assert settings.entertainment_analysis_fps is None
 
     def test_entertainment_settings_fields(self):
         settings = create_test_settings(
@@ -371,6 +382,8 @@ class TestAppDbPathSettings:
             entertainment_area_id="area-uuid",
             entertainment_creds_file=".res/hue_entertainment_creds.json",
             entertainment_fps=50,
+            entertainment_interpolation="spring",
+            entertainment_analysis_fps=20,
         )
         assert settings.entertainment_enabled is True
         assert settings.hue_app_key == "appkey123"
@@ -378,4 +391,6 @@ class TestAppDbPathSettings:
         assert settings.entertainment_area_id == "area-uuid"
         assert settings.entertainment_creds_file == ".res/hue_entertainment_creds.json"
         assert settings.entertainment_fps == 50
+        assert settings.entertainment_interpolation == "spring"
+        assert settings.entertainment_analysis_fps == 20
 
@@ -4,39 +4,40 @@ from marvin_hue.basics import LightConfig, LightSetting
 from marvin_hue.colors import Color
 
 
-def _make_controller():
-    from marvin_hue.controllers import HueController
-    c = HueController.__new__(HueController)  # sem conectar à bridge
-    fita = MagicMock(); fita.name = "Fita Led"
-    teto = MagicMock(); teto.name = "Lâmpada 1"
-    c.lights = [fita, teto]
-    c._light_cache = {fita.name: fita, teto.name: teto}
+def _make_controller(offline_hue):
+    c = offline_hue(["Fita Led", "Lâmpada 1"])  # sem conectar à bridge
+    fita, teto = c.lights
     return c, fita, teto
 
 
+def _bri(light):
+    """``bri`` do último PUT combinado de estado enviado à lâmpada."""
+    return light.bridge.set_light.call_args[0][1]["bri"]
+
+
 # 25% de 254 = 63.5 -> floor 63 (24.8%). Asserções EXATAS em 63: um regression
 # que produzisse 64 (25.2%, o valor que o floor evita de propósito) deve FALHAR.
 _FITA_LED_HUE_LIMIT = 63
 
 
-def test_set_light_color_clamps_fita_led():
-    c, fita, _ = _make_controller()
+def test_set_light_color_clamps_fita_led(offline_hue):
+    c, fita, _ = _make_controller(offline_hue)
     c.set_light_color("Fita Led", Color(255, 0, 0, 254))  # pediu 254 (100%)
-    assert fita.brightness == _FITA_LED_HUE_LIMIT
+    assert _bri(fita) == _FITA_LED_HUE_LIMIT
 
 
-def test_set_light_color_clamps_led_cima_direct():
+def test_set_light_color_clamps_led_cima_direct(offline_hue):
     """Led cima também é clampada pela entrada DIRETA set_light_color."""
-    c, _, _ = _make_controller()
+    c, _, _ = _make_controller(offline_hue)
     led = MagicMock(); led.name = "Led cima"
     c.lights.append(led); c._light_cache["Led cima"] = led
     c.set_light_color("Led cima", Color(255, 255, 255, 254))
-    assert led.brightness == _FITA_LED_HUE_LIMIT
+    assert _bri(led) == _FITA_LED_HUE_LIMIT
 
 
-def test_apply_config_preset_is_clamped_through_chokepoint():
+def test_apply_config_preset_is_clamped_through_chokepoint(offline_hue):
     """Preset que liga Led cima a 254 escapa do middleware, mas NÃO do controller."""
-    c, _, _ = _make_controller()
+    c, _, _ = _make_controller(offline_hue)
     led = MagicMock(); led.name = "Led cima"
     c.lights.append(led); c._light_cache["Led cima"] = led
     cfg = LightConfig(
@@ -45,25 +46,25 @@ def test_apply_config_preset_is_clamped_through_chokepoint():
         description="cena que pede brilho máximo",
     )
     c.apply_light_config(cfg)
-    assert led.brightness == _FITA_LED_HUE_LIMIT  # clampado na origem
+    assert _bri(led) == _FITA_LED_HUE_LIMIT  # clampado na origem
 
 
-def test_set_light_color_no_clamp_for_ceiling():
-    c, _, teto = _make_controller()
+def test_set_light_color_no_clamp_for_ceiling(offline_hue):
+    c, _, teto = _make_controller(offline_hue)
     c.set_light_color("Lâmpada 1", Color(255, 255, 255, 254))
-    assert teto.brightness == 254  # teto não tem restrição
+    assert _bri(teto) == 254  # teto não tem restrição
 
 
-def test_set_brightness_public_clamps_restricted_lamp():
+def test_set_brightness_public_clamps_restricted_lamp(offline_hue):
     """O setter público set_brightness aplica o clamp por conta própria."""
-    c, fita, _ = _make_controller()
+    c, fita, _ = _make_controller(offline_hue)
     c.set_brightness("Fita Led", 254)
     assert fita.brightness == _FITA_LED_HUE_LIMIT
 
 
-def test_set_all_brightness_clamps_per_lamp():
+def test_set_all_brightness_clamps_per_lamp(offline_hue):
     """Fecha o furo do caminho "all": clamp aplicado POR LÂMPADA."""
-    c, fita, teto = _make_controller()
+    c, fita, teto = _make_controller(offline_hue)
     c.set_all_brightness(254)
     assert fita.brightness == _FITA_LED_HUE_LIMIT   # 25% de 254 (floor)
     assert teto.brightness == 254                   # sem restrição
@@ -52,7 +52,10 @@ class TestHueControllerSetLightColor:
         light = mock_hue_controller.set_light_color("Lâmpada 1", color)
 
         assert light is not None
-        assert light.brightness == 200
+        light.bridge.set_light.assert_called_once()
+        body = light.bridge.set_light.call_args[0][1]
+        assert body["bri"] == 200
+        assert set(body) == {"xy", "bri"}
 
     def test_set_light_color_returns_light(self, mock_hue_controller):
         """Test that set_light_color returns the light object."""
@@ -76,7 +79,7 @@ class TestHueControllerSetLightColor:
         for color in test_colors:
             light = mock_hue_controller.set_light_color("Lâmpada 1", color)
             assert light is not None
-            assert light.brightness == color.brightness
+            assert light.bridge.set_light.call_args[0][1]["bri"] == color.brightness
 
     def test_set_light_color_updates_xy(self, mock_hue_controller):
         """Test that XY coordinates are updated."""
@@ -114,6 +117,12 @@ class TestHueControllerApplyLightConfig:
         )
 
         assert result == mock_hue_controller
+        light = mock_hue_controller.get_light_by_name(
+            sample_light_config.settings[0].light_name
+        )
+        body = light.bridge.set_light.call_args[0][1]
+        assert body["transitiontime"] == 20
+        assert body["on"] is True
 
     def test_apply_light_config_processes_all_settings(self, mock_hue_controller):
         """Test that all settings in config are processed."""
@@ -125,8 +134,14 @@ class TestHueControllerApplyLightConfig:
 
         mock_hue_controller.apply_light_config(config)
 
-        # All settings should have been processed
-        # (In real scenario, each light would be updated)
+        # All settings processed, each as a single combined state PUT
+        for name in ("Lâmpada 1", "Lâmpada 2"):
+            light = mock_hue_controller.get_light_by_name(name)
+            light.bridge.set_light.assert_called_once()
+            body = light.bridge.set_light.call_args[0][1]
+            assert body["on"] is True
+            assert body["bri"] == 254
+            assert "transitiontime" not in body
 
     def test_apply_empty_config(self, mock_hue_controller):
         """Test applying configuration with no settings."""
@@ -143,14 +158,14 @@ class TestHueControllerLightLookup:
 
     def test_get_light_by_name(self, mock_hue_controller):
         """Test getting light by name."""
-        light = mock_hue_controller._get_light_by_name("Lâmpada 1")
+        light = mock_hue_controller.get_light_by_name("Lâmpada 1")
 
         assert light is not None
         assert light.name == "Lâmpada 1"
 
     def test_get_nonexistent_light(self, mock_hue_controller):
         """Test getting light that doesn't exist."""
-        light = mock_hue_controller._get_light_by_name("Nonexistent")
+        light = mock_hue_controller.get_light_by_name("Nonexistent")
 
         assert light is None
 
@@ -175,7 +190,7 @@ class TestHueControllerLightLookup:
         light_name = "Lâmpada 1"
 
         # Get light using cached lookup
-        light = mock_hue_controller._get_light_by_name(light_name)
+        light = mock_hue_controller.get_light_by_name(light_name)
 
         # Should return cached light
         assert light is mock_hue_controller._light_cache[light_name]
@@ -0,0 +1,128 @@
+"""Pipelined ScreenMirror: latest-wins slots, stage timers, threaded loop."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from marvin_hue.frame_pipeline import LatestSlot, StageTimer
+from marvin_hue.output.port import LightFrameColor
+from marvin_hue.screen_mirror import ScreenMirror
+
+
+def test_latest_slot_drops_stale_items() -> None:
+    slot: LatestSlot[int] = LatestSlot()
+    slot.put(1)
+    slot.put(2)
+    assert slot.get(timeout=0.1) == 2
+    assert slot.dropped == 1
+    assert slot.get(timeout=0.01) is None
+
+
+def test_latest_slot_merges_and_closes() -> None:
+    slot: LatestSlot[list[int]] = LatestSlot(merge=lambda old, new: old + new)
+    slot.put([1])
+    slot.put([2])
+    assert slot.get(timeout=0.1) == [1, 2]
+
+    waiter = threading.Thread(target=lambda: slot.get(timeout=5.0))
+    waiter.start()
+    slot.close()
+    waiter.join(timeout=1.0)
+    assert not waiter.is_alive()
+
+
+def test_stage_timer_tracks_last_avg_max() -> None:
+    timer = StageTimer()
+    timer.record(0.010)
+    timer.record(0.020)
+    stats = timer.as_dict()
+    assert stats["count"] == 2
+    assert stats["last_ms"] == 20.0
+    assert stats["max_ms"] == 20.0
+    assert 10.0 < stats["avg_ms"] < 20.0
+
+
+def test_merge_frame_colors_keeps_latest_per_light() -> None:
+    older = [LightFrameColor("A", 1, 1, 1, 100), LightFrameColor("B", 2, 2, 2, 100)]
+    newer = [LightFrameColor("A", 9, 9, 9, 100)]
+    merged = ScreenMirror._merge_frame_colors(older, newer)
+    assert {c.light_name: c.r for c in merged} == {"A": 9, "B": 2}
+
+
+class _FakeSct:
+    monitors = [{}, {"left": 0, "top": 0, "width": 200, "height": 100}]
+
+    def __init__(self) -> None:
+        self.grabs = 0
+
+    def __enter__(self) -> "_FakeSct":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def grab(self, box: dict[str, int]) -> SimpleNamespace:
+        self.grabs += 1
+        pixels = np.full((box["height"], box["width"], 4), 200, dtype=np.uint8)
+        pixels[..., 0] = (self.grabs * 40) % 256  # blue changes every frame
+        return SimpleNamespace(
+            raw=bytearray(pixels.tobytes()), width=box["width"], height=box["height"]
+        )
+
+
+def test_pipelined_capture_is_not_blocked_by_slow_output(tmp_path: Path) -> None:
+    positions = tmp_path / "pos.json"
+    positions.write_text(
+        json.dumps({"lights": [{"name": "A", "position": "left", "enabled": True}]}),
+        encoding="utf-8",
+    )
+    output = MagicMock(transport="entertainment")
+    output.apply_frame.side_effect = lambda frame: time.sleep(0.2)
+    mirror = ScreenMirror(MagicMock(), str(positions), output_port=output)
+    mirror.pipelined = True
+    sct = _FakeSct()
+
+    with patch("marvin_hue.screen_mirror.mss.mss", return_value=sct):
+        mirror.start(fps=50)
+        time.sleep(0.5)
+        status = mirror.get_status()
+        mirror.stop()
+
+    pipeline = status["pipeline"]
+    assert pipeline["enabled"] is True
+    # Capture keeps its own pace while each send takes 200 ms
+    assert sct.grabs > 3 * output.apply_frame.call_count
+    assert pipeline["stages"]["capture"]["count"] > pipeline["stages"]["send"]["count"]
+    assert pipeline["dropped"]["send"] + pipeline["dropped"]["analyze"] > 0
+    assert pipeline["stages"]["send"]["max_ms"] >= 150
+
+
+def test_sequential_mode_reports_stage_timings() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    status = mirror.get_status()["pipeline"]
+    assert status["enabled"] is False
+    assert set(status["stages"]) == {"capture", "analyze", "send"}
+
+
+def test_api_settings_pipelined(fastapi_test_client) -> None:
+    from marvin_hue.api import dependencies
+
+    mock = MagicMock(spec=ScreenMirror)
+    mock.get_status.return_value = {"running": False, "colors": {}}
+    original = dependencies._screen_mirror
+    dependencies.set_screen_mirror(mock)
+    try:
+        response = fastapi_test_client.post(
+            "/mirror/settings", json={"mode": "screen", "pipelined": True}
+        )
+        assert response.status_code == 200
+        assert mock.pipelined is True
+    finally:
+        dependencies.set_screen_mirror(original)
@@ -0,0 +1,99 @@
+"""Deadline-based FrameScheduler shared by the screen and audio mirrors."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from marvin_hue.frame_pipeline import FrameScheduler
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def work(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _scheduler(fps: float) -> tuple[FrameScheduler, _FakeClock]:
+    clock = _FakeClock()
+    return FrameScheduler(fps, clock=clock, sleep=clock.sleep), clock
+
+
+def test_deadlines_do_not_drift_with_work_time() -> None:
+    scheduler, clock = _scheduler(10)
+    start = clock.now
+    for work in (0.01, 0.05, 0.02, 0.09):
+        clock.work(work)
+        scheduler.wait()
+    # Four frames at 10 fps end exactly on the 4th deadline
+    assert clock.now == pytest.approx(start + 0.4)
+    assert scheduler.missed_deadlines == 0
+    stats = scheduler.stats()
+    assert stats["achieved_fps"] == pytest.approx(10.0)
+    assert stats["frame_ms_p50"] == pytest.approx(100.0)
+    assert 85.0 < stats["work_ms_p99"] <= 90.0
+
+
+def test_overrun_skips_ahead_without_burst() -> None:
+    scheduler, clock = _scheduler(10)
+    start = clock.now
+    clock.work(0.35)  # misses deadlines at +0.1, +0.2, +0.3
+    scheduler.wait()
+    assert scheduler.missed_deadlines == 3
+    assert clock.sleeps == []
+    clock.work(0.01)
+    scheduler.wait()
+    # Next frame lands on the +0.4 grid point, not +0.45 or a catch-up burst
+    assert clock.now == pytest.approx(start + 0.4)
+    assert scheduler.stats()["missed_deadlines"] == 3
+
+
+def test_set_fps_rebases_deadline() -> None:
+    scheduler, clock = _scheduler(10)
+    scheduler.wait()
+    tick = clock.now
+    scheduler.set_fps(50)
+    scheduler.wait()
+    assert clock.now == pytest.approx(tick + 0.02)
+    assert scheduler.stats()["target_fps"] == 50.0
+
+
+def test_stats_before_first_frame() -> None:
+    scheduler, _ = _scheduler(30)
+    stats = scheduler.stats()
+    assert stats["frames"] == 0
+    assert stats["achieved_fps"] == 0.0
+    assert stats["jitter_ms_p99"] == 0.0
+
+
+def test_mirror_status_exposes_timing(fastapi_test_client) -> None:
+    from marvin_hue.api import dependencies
+    from marvin_hue.screen_mirror import ScreenMirror
+
+    scheduler, clock = _scheduler(25)
+    clock.work(0.01)
+    scheduler.wait()
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    assert mirror.get_status()["timing"] is None
+    mirror._scheduler = scheduler
+
+    original = dependencies._screen_mirror
+    dependencies.set_screen_mirror(mirror)
+    try:
+        data = fastapi_test_client.get("/mirror/status").json()
+    finally:
+        dependencies.set_screen_mirror(original)
+    assert data["timing"]["target_fps"] == 25.0
+    assert data["timing"]["achieved_fps"] == pytest.approx(25.0)
+    assert data["timing"]["missed_deadlines"] == 0
@@ -0,0 +1,124 @@
+"""Per-light gamut registry and vectorized closest-point clamping."""
+
+from __future__ import annotations
+
+from typing import Callable
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from marvin_hue.colors import Color
+from marvin_hue.controllers import HueController
+from marvin_hue.eye_safety import clear_runtime_policy
+from marvin_hue.gamut import GAMUTS, GamutRegistry, clamp_to_triangles
+from marvin_hue.output.port import LightFrameColor
+from marvin_hue.output.rest_adapter import RestPhueAdapter
+from marvin_hue.utils import ColorConverter
+
+LIGHTS = {
+    "1": {
+        "name": "Play",
+        "capabilities": {"control": {"colorgamuttype": "C", "colorgamut": GAMUTS["C"]}},
+    },
+    "2": {"name": "Bloom", "capabilities": {"control": {"colorgamuttype": "A"}}},
+    "3": {"name": "Old bulb", "capabilities": {"control": {"colorgamuttype": "B"}}},
+    "4": {"name": "White", "capabilities": {"control": {"ct": {"min": 153, "max": 454}}}},
+}
+
+
+def _cross(u: np.ndarray, v: np.ndarray) -> float:
+    return float(u[0] * v[1] - u[1] * v[0])
+
+
+def _inside(point: np.ndarray, tri: np.ndarray) -> bool:
+    a, b, c = tri
+    cross = [
+        _cross(b - a, point - a),
+        _cross(c - b, point - b),
+        _cross(a - c, point - c),
+    ]
+    return all(v >= -1e-9 for v in cross) or all(v <= 1e-9 for v in cross)
+
+
+def _brute_force_closest(point: np.ndarray, tri: np.ndarray) -> np.ndarray:
+    t = np.linspace(0.0, 1.0, 20001)[:, None]
+    samples = np.concatenate(
+        [tri[i] + t * (tri[(i + 1) % 3] - tri[i]) for i in range(3)]
+    )
+    return samples[((samples - point) ** 2).sum(axis=1).argmin()]
+
+
+def test_registry_reads_capabilities() -> None:
+    registry = GamutRegistry.from_lights(LIGHTS)
+    assert len(registry) == 3
+    assert registry.gamut_of("Play") == "C"
+    assert registry.gamut_of("Bloom") == "A"
+    assert registry.gamut_of("Old bulb") == "B"
+    assert "White" not in registry
+
+
+def test_registry_from_unusable_bridge_is_empty() -> None:
+    bridge = MagicMock()
+    assert len(GamutRegistry.from_bridge(bridge)) == 0
+    bridge.get_light.side_effect = OSError("down")
+    assert len(GamutRegistry.from_bridge(bridge)) == 0
+
+
+def test_points_inside_are_unchanged() -> None:
+    registry = GamutRegistry.from_lights(LIGHTS)
+    xy = np.array([[0.3127, 0.3290], [0.4, 0.4]])
+    np.testing.assert_array_equal(registry.clamp(["Play", "Old bulb"], xy), xy)
+
+
+def test_outside_points_snap_to_closest_edge_point() -> None:
+    rng = np.random.default_rng(11)
+    points = rng.uniform(0.0, 0.8, size=(60, 2))
+    tri = np.asarray(GAMUTS["B"])
+    clamped = clamp_to_triangles(points, np.broadcast_to(tri, (60, 3, 2)))
+    for point, got in zip(points, clamped):
+        assert _inside(got, tri)
+        if _inside(point, tri):
+            np.testing.assert_array_equal(got, point)
+        else:
+            want = _brute_force_closest(point, tri)
+            assert np.linalg.norm(got - want) < 1e-4
+
+
+def test_each_row_uses_its_own_lights_gamut() -> None:
+    registry = GamutRegistry.from_lights(LIGHTS)
+    green = ColorConverter.rgb_to_xy_array([[0, 255, 0]])[0]
+    out = registry.clamp(["Play", "Bloom", "Old bulb", "White"], np.tile(green, (4, 1)))
+    # Gamut B's green corner is far narrower than A/C
+    assert out[2, 1] < out[0, 1]
+    assert not np.allclose(out[0], out[1])
+    # No gamut known: generic clamp keeps valid xy untouched
+    np.testing.assert_allclose(out[3], green)
+
+
+def test_controller_clamps_to_light_gamut(
+    offline_hue: Callable[..., HueController],
+) -> None:
+    c = offline_hue(gamuts=GamutRegistry.from_lights(LIGHTS))
+    body = c.light_state_body("Old bulb", Color(0, 255, 0, 200))
+    assert _inside(np.asarray(body["xy"]), np.asarray(GAMUTS["B"]))
+    assert body["xy"] == pytest.approx(
+        c.gamuts.clamp_one("Old bulb", ColorConverter.rgb_to_xy(0, 255, 0))
+    )
+
+
+def test_rest_adapter_skips_colors_equal_after_gamut_clamp() -> None:
+    clear_runtime_policy()
+    hue = MagicMock()
+    hue.gamuts = GamutRegistry.from_lights(LIGHTS)
+    adapter = RestPhueAdapter(hue, max_in_flight=1)
+    adapter.begin_session()
+    # Two greens the Gamut B bulb renders as the same corner color
+    adapter.apply_frame([LightFrameColor("Old bulb", 0, 255, 0, 200)])
+    adapter.apply_frame([LightFrameColor("Old bulb", 10, 255, 0, 200)])
+    adapter.apply_frame([LightFrameColor("Old bulb", 10, 255, 0, 120)])
+    assert hue.set_light_state.call_count == 2
+    assert adapter.skipped_unchanged == 1
+    xy = hue.set_light_state.call_args.kwargs["xy"]
+    assert _inside(np.asarray(xy), np.asarray(GAMUTS["B"]))
+    adapter.end_session()
@@ -0,0 +1,70 @@
+"""FrameInterpolator: output-rate frames between analysis keyframes."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from marvin_hue.output.interpolation import (
+    INTERPOLATION_MODES,
+    SPRING_STIFFNESS,
+    FrameInterpolator,
+)
+
+RED = np.array([[255.0, 0.0, 0.0]])
+BLUE = np.array([[0.0, 0.0, 255.0]])
+
+
+def _after_two_keyframes(mode: str) -> FrameInterpolator:
+    interp = FrameInterpolator((1, 3), mode, min_interval=0.02)
+    interp.push(RED, now=0.0)
+    interp.push(BLUE, now=0.1)  # analysis at 10 Hz
+    return interp
+
+
+def test_unknown_mode_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown interpolation mode"):
+        FrameInterpolator((1, 3), "sinc")
+
+
+@pytest.mark.parametrize("mode", INTERPOLATION_MODES)
+def test_starts_at_shown_color_and_reaches_target(mode: str) -> None:
+    interp = _after_two_keyframes(mode)
+    assert interp.sample(0.0)[0] == pytest.approx(RED[0])  # first keyframe: no fade
+    assert interp.sample(0.1)[0] == pytest.approx(RED[0])
+    mid = interp.sample(0.15)[0].copy()
+    assert 0 < mid[2] < 255 and mid[0] + mid[2] == pytest.approx(255, abs=1e-6)
+    assert interp.sample(2.0)[0] == pytest.approx(BLUE[0], abs=1e-3)
+
+
+def test_linear_and_cubic_midpoints() -> None:
+    assert _after_two_keyframes("linear").sample(0.125)[0][2] == pytest.approx(255 * 0.25)
+    # Hermite from rest: smoothstep 3s² - 2s³ at s = 0.25
+    assert _after_two_keyframes("cubic").sample(0.125)[0][2] == pytest.approx(
+        255 * (3 * 0.25**2 - 2 * 0.25**3)
+    )
+
+
+def test_spring_closed_form_after_one_interval() -> None:
+    k = SPRING_STIFFNESS
+    remaining = (1 + k) * np.exp(-k)
+    assert _after_two_keyframes("spring").sample(0.2)[0][0] == pytest.approx(255 * remaining)
+
+
+@pytest.mark.parametrize("mode", ["cubic", "spring"])
+def test_retarget_mid_motion_is_continuous(mode: str) -> None:
+    interp = _after_two_keyframes(mode)
+    before = interp.sample(0.149).copy()
+    at = interp.sample(0.15).copy()
+    interp.push(RED, now=0.15)  # target flips back halfway
+    after = interp.sample(0.151).copy()
+    # No jump at the keyframe: position carries over, velocity reverses smoothly
+    assert np.abs(after - at).max() < np.abs(at - before).max() * 2 + 1e-6
+
+
+def test_snap_rows_jump_to_target() -> None:
+    interp = FrameInterpolator((2, 3), "linear", min_interval=0.02)
+    interp.push(np.vstack([RED, RED]), now=0.0)
+    interp.push(np.vstack([BLUE, BLUE]), now=0.1, snap=np.array([False, True]))
+    shown = interp.sample(0.1)
+    assert shown[0] == pytest.approx(RED[0]) and shown[1] == pytest.approx(BLUE[0])
@@ -0,0 +1,124 @@
+"""Hue v2 event stream (SSE) keeping the light-state cache live."""
+
+from __future__ import annotations
+
+import io
+import time
+
+import pytest
+
+from marvin_hue.light_events import LightEventStream, iter_sse_data, v1_light_changes
+from marvin_hue.light_state import LightStateCache
+from tests.fake_hue_sse import FakeHueEventServer
+
+
+def _lights_json() -> dict:
+    return {
+        "1": {"name": "Lâmpada 1", "state": {"on": False, "bri": 100, "xy": [0.3, 0.3], "reachable": True}},
+        "2": {"name": "Fita Led", "state": {"on": True, "bri": 254, "xy": [0.5, 0.4], "reachable": True}},
+    }
+
+
+class _CountingFetch:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> dict:
+        self.calls += 1
+        return _lights_json()
+
+
+def _wait(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_sse_parser_joins_data_lines_and_skips_comments() -> None:
+    stream = io.BytesIO(b": hi\n\nid: 1:0\ndata: [1,\ndata: 2]\n\nevent: x\ndata:[3]\r\n\r\n")
+    assert list(iter_sse_data(stream.readline)) == ["[1,\n2]", "[3]"]
+
+
+def test_v2_light_update_maps_to_v1_state() -> None:
+    light_id, changes = v1_light_changes(
+        {
+            "id": "uuid",
+            "id_v1": "/lights/7",
+            "type": "light",
+            "on": {"on": True},
+            "dimming": {"brightness": 50.0},
+            "color": {"xy": {"x": 0.2, "y": 0.3}},
+        }
+    )
+    assert light_id == "7"
+    assert changes == {"on": True, "bri": 127, "xy": [0.2, 0.3], "colormode": "xy"}
+    assert v1_light_changes(
+        {"id_v1": "/lights/7", "type": "zigbee_connectivity", "status": "connectivity_issue"}
+    ) == ("7", {"reachable": False})
+    assert v1_light_changes({"id_v1": "/groups/1", "type": "grouped_light", "on": {"on": True}}) is None
+    assert v1_light_changes({"id_v1": "/lights/7", "type": "light", "owner": {}}) is None
+
+
+@pytest.fixture
+def server():
+    with FakeHueEventServer() as fake:
+        yield fake
+
+
+def test_stream_keeps_cache_live_without_polling(server: FakeHueEventServer) -> None:
+    fetch = _CountingFetch()
+    cache = LightStateCache(fetch, ttl=0.01)
+    stream = LightEventStream("127.0.0.1", "test-key", cache, port=server.port, tls=False)
+    stream.start()
+    try:
+        assert server.wait_for_clients(1)
+        assert _wait(lambda: cache.live and fetch.calls == 1)
+
+        server.push(
+            {"id_v1": "/lights/1", "type": "light", "on": {"on": True}, "dimming": {"brightness": 100.0}},
+            {"id_v1": "/lights/2", "type": "zigbee_connectivity", "status": "connectivity_issue"},
+        )
+        assert _wait(lambda: stream.updates == 2)
+        time.sleep(0.05)  # well past the TTL: live mode must not refetch
+        states = cache.snapshot()
+        assert fetch.calls == 1
+        assert states["1"]["state"]["on"] is True and states["1"]["state"]["bri"] == 254
+        assert states["2"]["state"]["reachable"] is False
+        assert stream.stats()["connected"] is True
+    finally:
+        stream.stop()
+    assert cache.live is False
+
+
+def test_stream_reconnects_and_rebaselines(server: FakeHueEventServer) -> None:
+    fetch = _CountingFetch()
+    cache = LightStateCache(fetch, ttl=60)
+    stream = LightEventStream(
+        "127.0.0.1", "test-key", cache, port=server.port, tls=False, reconnect_delay=0.01
+    )
+    stream.start()
+    try:
+        assert server.wait_for_clients(1)
+        server.drop_clients()
+        assert server.wait_for_clients(2)
+        assert _wait(lambda: stream.connects == 2 and cache.live)
+        # Events missed while disconnected are covered by a fresh GET /lights
+        assert _wait(lambda: fetch.calls == 2)
+    finally:
+        stream.stop()
+
+
+def test_wrong_key_never_goes_live(server: FakeHueEventServer) -> None:
+    cache = LightStateCache(_CountingFetch())
+    stream = LightEventStream(
+        "127.0.0.1", "wrong", cache, port=server.port, tls=False, reconnect_delay=0.01
+    )
+    stream.start()
+    try:
+        assert _wait(lambda: stream.errors >= 1)
+        assert cache.live is False and stream.connects == 0
+    finally:
+        stream.stop()
@@ -9,12 +9,15 @@ import pytest
 from marvin_hue.entertainment.channel_map import MappedChannel
 from marvin_hue.entertainment.client import EntertainmentClient
 from marvin_hue.entertainment.credentials import EntertainmentCredentials
+from marvin_hue.entertainment.frame_buffer import ChannelFrameBuffer
 from marvin_hue.entertainment.models import ChannelColor
 from marvin_hue.eye_safety import clear_runtime_policy, set_runtime_policy
 from marvin_hue.output.entertainment_adapter import EntertainmentStreamAdapter
 from marvin_hue.output.fallback import FallbackOutputPort
 from marvin_hue.output.port import LightFrameColor, LightOutputPort
 from marvin_hue.output.rest_adapter import RestPhueAdapter
+from marvin_hue.output.stream_clock import StreamClock
+from marvin_hue.utils import ColorConverter
 
 
 class FakePort:
@@ -56,9 +59,13 @@ def test_rest_adapter_skips_disabled():
             LightFrameColor("On Light", 0, 255, 0, 100),
         ]
     )
-    hue.set_light_color.assert_called_once()
-    args = hue.set_light_color.call_args[0]
+    hue.set_light_state.assert_called_once()
+    args = hue.set_light_state.call_args[0]
     assert args[0] == "On Light"
+    kwargs = hue.set_light_state.call_args.kwargs
+    assert kwargs["transition_time"] == 2
+    # Frame converted to xy in one vectorized call, matching the scalar path
+    assert kwargs["xy"] == pytest.approx(ColorConverter.rgb_to_xy(0, 255, 0))
     adapter.end_session()
     clear_runtime_policy()
 
@@ -79,7 +86,7 @@ def test_entertainment_adapter_maps_and_sends():
         return None
 
     client.run_coro = MagicMock(side_effect=run_coro)
-    client.send_frame = MagicMock()
+    client.send_buffer = MagicMock()
 
     adapter = EntertainmentStreamAdapter(
         client=client,
@@ -98,18 +105,143 @@ def test_entertainment_adapter_maps_and_sends():
             LightFrameColor("Unknown", 1, 1, 1, 100),
         ]
     )
-    client.send_frame.assert_called_once()
-    cmds: list[ChannelColor] = client.send_frame.call_args[0][0]
+    client.send_buffer.assert_called_once()
+    cmds = client.send_buffer.call_args[0][0].frame
     assert len(cmds) == 2
     assert cmds[0].channel_id == 0
     assert cmds[1].channel_id == 1
-    # bri 127 scales blue channel: 255 * 127 // 254
-    assert cmds[1].b == 255 * 127 // 254
+    assert cmds[0].red == 0xFFFF
+    # bri 127 scales blue channel: 255 * 127 // 254, sent as 16-bit
+    assert cmds[1].blue == (255 * 127 // 254) * 257
     adapter.end_session()
     assert client.run_coro.call_count >= 2  # begin + end
     clear_runtime_policy()
 
 
+def test_entertainment_adapter_reuses_channel_buffer_and_tracks_policy():
+    clear_runtime_policy()
+    client = MagicMock()
+    sent: list[list[tuple[int, int, int, int]]] = []
+    client.send_buffer = MagicMock(
+        side_effect=lambda buf: sent.append(
+            [(c.channel_id, c.red, c.green, c.blue) for c in buf.frame]
+        )
+    )
+    adapter = EntertainmentStreamAdapter(
+        client=client,
+        area_id="area-1",
+        channels=[MappedChannel("A", 3), MappedChannel("B", 7)],
+    )
+    frame = [LightFrameColor("A", 255, 0, 0, 254), LightFrameColor("B", 0, 255, 0, 254)]
+    adapter.apply_frame(frame)
+    first = list(client.send_buffer.call_args[0][0].frame)
+    adapter.apply_frame([LightFrameColor("A", 0, 0, 255, 254), frame[1]])
+    second = client.send_buffer.call_args[0][0].frame
+    # Same command objects, updated in place
+    assert all(a is b for a, b in zip(first, second))
+    assert sent[1][0] == (3, 0, 0, 0xFFFF)
+
+    # Policy change is picked up without rebuilding the adapter
+    set_runtime_policy(limits_pct={"A": 50}, disabled_names={"B"})
+    adapter.apply_frame(frame)
+    assert sent[2] == [(3, (255 * 127 // 254) * 257, 0, 0)]
+    clear_runtime_policy()
+
+
+def _streaming_client() -> MagicMock:
+    client = MagicMock()
+    client.is_streaming = True
+    client.active_area = "area-1"
+    return client
+
+
+def test_stream_clock_ticks_at_rate_and_stops_on_error():
+    import threading
+    import time
+
+    ticks: list[float] = []
+    clock = StreamClock(200, ticks.append, name="test-clock")
+    clock.start()
+    deadline = time.monotonic() + 2
+    while len(ticks) < 5 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    clock.stop()
+    assert len(ticks) >= 5 and not clock.running
+    assert all(b >= a for a, b in zip(ticks, ticks[1:]))
+
+    done = threading.Event()
+
+    def boom(now: float) -> None:
+        done.set()
+        raise RuntimeError("dtls gone")
+
+    failing = StreamClock(200, boom)
+    failing.start()
+    assert done.wait(2)
+    failing.stop()
+    assert isinstance(failing.error, RuntimeError) and failing.ticks == 0
+
+
+def test_entertainment_clock_interpolates_between_analysis_frames():
+    clear_runtime_policy()
+    t = [0.0]
+    client = _streaming_client()
+    sent: list[tuple[int, int, int]] = []
+    client.send_buffer = MagicMock(
+        side_effect=lambda buf: sent.extend((c.red, c.green, c.blue) for c in buf.frame)
+    )
+    adapter = EntertainmentStreamAdapter(
+        client=client,
+        area_id="area-1",
+        channels=[MappedChannel("A", 0)],
+        stream_fps=50,
+        clock=lambda: t[0],
+    )
+    adapter.begin_session()
+    adapter.stream_clock.stop()  # drive ticks by hand below
+    sent.clear()
+
+    adapter.apply_frame([LightFrameColor("A", 255, 0, 0, 254)])
+    client.send_buffer.reset_mock()
+    adapter._tick(0.0)
+    assert sent[-1] == (0xFFFF, 0, 0)  # first frame: no fade from black
+
+    t[0] = 0.25  # slow analysis (4 Hz), stream at 50 Hz
+    adapter.apply_frame([LightFrameColor("A", 0, 0, 255, 254)])
+    adapter._tick(0.375)
+    assert sent[-1] == (128 * 257, 0, 128 * 257)  # halfway through one interval
+    adapter._tick(0.5)
+    adapter._tick(0.52)  # no new frame: latest state is resent
+    assert sent[-2:] == [(0, 0, 0xFFFF)] * 2
+
+    adapter.stream_clock.error = RuntimeError("dtls gone")
+    with pytest.raises(RuntimeError, match="clock failed"):
+        adapter.apply_frame([LightFrameColor("A", 1, 1, 1, 254)])
+    adapter.end_session()
+    assert adapter.stream_clock is None
+
+
+def test_entertainment_clock_streams_at_fixed_rate():
+    import time
+
+    clear_runtime_policy()
+    client = _streaming_client()
+    adapter = EntertainmentStreamAdapter(
+        client=client,
+        area_id="area-1",
+        channels=[MappedChannel("A", 0)],
+        stream_fps=100,
+    )
+    adapter.begin_session()
+    adapter.apply_frame([LightFrameColor("A", 10, 20, 30, 254)])
+    deadline = time.monotonic() + 2
+    while client.send_buffer.call_count < 5 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    adapter.end_session()
+    # One analysis frame, several stream frames
+    assert client.send_buffer.call_count >= 5
+
+
 def test_fallback_degrades_on_begin_failure():
     primary = FakePort("entertainment")
     secondary = FakePort("rest")
@@ -206,11 +338,82 @@ async def test_entertainment_client_start_send_stop():
         await client.start_stream("area-1")
         assert client.is_streaming is True
         client.send_frame([ChannelColor(0, 255, 0, 0)])
+        buffer = ChannelFrameBuffer([0])
+        buffer.begin()
+        buffer.put(0, 0, 255, 0)
+        client.send_buffer(buffer)
         await client.stop_stream()
 
     assert calls["start"] == ["area-1"]
-    assert len(calls["send"]) == 1
+    assert len(calls["send"]) == 2
+    assert calls["send"][0][0].red == calls["send"][1][0].green == 0xFFFF
     assert calls["stop"] == [True]
     assert calls["aclose"] == [True]
     assert client.is_streaming is False
     assert client._session is None
+
+
+def test_rest_adapter_fans_out_with_bounded_in_flight():
+    import threading
+    import time
+
+    clear_runtime_policy()
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def slow_set(name, color, **kwargs):  # noqa: ARG001
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return MagicMock()
+
+    hue = MagicMock()
+    hue.set_light_state.side_effect = slow_set
+    adapter = RestPhueAdapter(hue, max_in_flight=3)
+    frame = [LightFrameColor(f"L{i}", i, 0, 0, 100) for i in range(9)]
+    started = time.perf_counter()
+    adapter.apply_frame(frame)
+    elapsed = time.perf_counter() - started
+    adapter.end_session()
+
+    assert hue.set_light_state.call_count == 9
+    assert state["peak"] == 3
+    assert state["active"] == 0  # apply_frame waited for every light
+    assert elapsed < 9 * 0.05
+
+
+def test_rest_adapter_serial_when_max_in_flight_is_one():
+    clear_runtime_policy()
+    hue = MagicMock()
+    adapter = RestPhueAdapter(hue, max_in_flight=1)
+    adapter.apply_frame([LightFrameColor(f"L{i}", 0, 0, 0, 1) for i in range(3)])
+    assert [c.args[0] for c in hue.set_light_state.call_args_list] == ["L0", "L1", "L2"]
+    assert adapter._pool is None
+
+
+def test_rest_adapter_end_session_discards_limiter_queue():
+    import threading
+
+    from marvin_hue.bridge_limiter import RestWriteLimiter
+
+    clear_runtime_policy()
+    release = threading.Event()
+    limiter = RestWriteLimiter(rate=2, burst=1, max_in_flight=1)
+    hue = MagicMock()
+    hue.rest_limiter = limiter
+    hue.gamuts = None
+    hue.set_light_state.side_effect = lambda *a, **k: release.wait(2.0)
+    adapter = RestPhueAdapter(hue)
+    adapter.begin_session()
+    adapter.apply_frame([LightFrameColor(f"L{i}", 200, 0, 0, 100) for i in range(5)])
+    release.set()
+    adapter.end_session()
+    sent = hue.set_light_state.call_count
+    assert limiter.stats()["pending"] == 0
+    assert sent <= 1  # only the write already in flight
+    assert limiter.flush(timeout=1.0)
+    limiter.close()
+    assert hue.set_light_state.call_count == sent
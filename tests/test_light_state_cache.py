@@ -0,0 +1,146 @@
+"""Bulk light-state cache: one GET /lights per TTL, write-through from our commands."""
+
+from __future__ import annotations
+
+from typing import Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from marvin_hue.colors import Color
+from marvin_hue.controllers import HueController
+from marvin_hue.eye_safety import clear_runtime_policy
+from marvin_hue.light_state import LightStateCache
+
+OfflineHue = Callable[..., HueController]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _lights_json() -> dict:
+    return {
+        "1": {"name": "Lâmpada 1", "state": {"on": True, "bri": 200, "xy": [0.3, 0.3], "reachable": True}},
+        "2": {"name": "Lâmpada 2", "state": {"on": False, "bri": 10, "xy": [0.5, 0.4], "reachable": True}},
+        "3": {"name": "Fita Led", "state": {"on": True, "bri": 120, "reachable": False}},
+    }
+
+
+class _CountingFetch:
+    def __init__(self, payload=None) -> None:
+        self.payload = payload if payload is not None else _lights_json()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        return self.payload
+
+
+NAMES = ["Lâmpada 1", "Lâmpada 2", "Fita Led"]
+
+
+def setup_function() -> None:
+    clear_runtime_policy()
+
+
+def test_snapshot_is_reused_within_ttl() -> None:
+    clock = _Clock()
+    fetch = _CountingFetch()
+    cache = LightStateCache(fetch, ttl=2.0, clock=clock)
+    assert cache.snapshot()["1"]["name"] == "Lâmpada 1"
+    clock.now = 1.9
+    cache.snapshot()
+    assert fetch.calls == 1
+    clock.now = 2.0
+    cache.snapshot()
+    assert fetch.calls == 2
+    assert cache.stats() == {"ttl": 2.0, "live": False, "hits": 1, "fetches": 2, "events": 0}
+
+
+def test_failed_or_unusable_fetch_returns_none() -> None:
+    assert LightStateCache(_CountingFetch(OSError("down"))).snapshot() is None
+    assert LightStateCache(_CountingFetch(MagicMock())).snapshot() is None
+
+
+def test_write_through_does_not_touch_handed_out_snapshots() -> None:
+    cache = LightStateCache(_CountingFetch(), clock=_Clock())
+    before = cache.snapshot()
+    cache.apply_write([2], {"on": True, "xy": [0.2, 0.2], "transitiontime": 4})
+    after = cache.snapshot()
+    assert before["2"]["state"]["on"] is False
+    assert after["2"]["state"] == {
+        "on": True, "bri": 10, "xy": [0.2, 0.2], "reachable": True, "colormode": "xy"
+    }
+    # Unknown ids and non-state keys are ignored
+    cache.apply_write(["99"], {"on": True})
+    cache.apply_write(["1"], {"transitiontime": 0})
+    assert cache.snapshot()["1"] == _lights_json()["1"]
+
+
+def test_status_for_all_lights_is_one_request(offline_hue: OfflineHue) -> None:
+    fetch = _CountingFetch()
+    c = offline_hue(NAMES, state_cache=LightStateCache(fetch, ttl=2.0, clock=_Clock()))
+    status = c.get_lights_status()
+    assert fetch.calls == 1
+    assert [s["name"] for s in status] == ["Lâmpada 1", "Lâmpada 2", "Fita Led"]
+    assert status[0]["on"] is True and status[0]["brightness"] == 200
+    assert status[0]["color"] != {"r": 50, "g": 50, "b": 50}
+    # Off -> brightness 0 and gray; white/no-xy light -> gray too
+    assert status[1]["brightness"] == 0 and status[1]["color"] == {"r": 50, "g": 50, "b": 50}
+    assert status[2]["reachable"] is False and status[2]["color"] == {"r": 50, "g": 50, "b": 50}
+
+    c.get_lights_status()
+    assert fetch.calls == 1
+
+
+def test_own_writes_show_up_without_refetch(offline_hue: OfflineHue) -> None:
+    fetch = _CountingFetch()
+    c = offline_hue(NAMES, state_cache=LightStateCache(fetch, ttl=2.0, clock=_Clock()))
+    c.get_lights_status()
+    c.set_light_state("Lâmpada 2", Color(255, 0, 0, 180), on=True)
+    c.turn_off("Lâmpada 1")
+    status = {s["name"]: s for s in c.get_lights_status()}
+    assert fetch.calls == 1
+    assert status["Lâmpada 2"]["on"] is True
+    assert status["Lâmpada 2"]["brightness"] == 180
+    assert status["Lâmpada 2"]["color"]["r"] > status["Lâmpada 2"]["color"]["g"]
+    assert status["Lâmpada 1"]["on"] is False
+
+
+def test_rejected_write_is_not_cached(offline_hue: OfflineHue) -> None:
+    fetch = _CountingFetch()
+    c = offline_hue(NAMES, state_cache=LightStateCache(fetch, ttl=2.0, clock=_Clock()))
+    c.get_lights_status()
+    c.lights[1].bridge.set_light.return_value = [
+        [{"error": {"type": 201, "address": "/lights/2/state/bri", "description": "Device is set to off."}}]
+    ]
+    with pytest.raises(RuntimeError, match="Device is set to off"):
+        c.set_light_state("Lâmpada 2", Color(255, 0, 0, 200))
+    status = {s["name"]: s for s in c.get_lights_status()}
+    assert fetch.calls == 1
+    assert status["Lâmpada 2"]["on"] is False
+    assert c.state_cache.snapshot()["2"]["state"]["bri"] == 10
+
+
+def test_falls_back_to_per_light_reads(offline_hue: OfflineHue) -> None:
+    c = offline_hue(
+        NAMES, state_cache=LightStateCache(_CountingFetch(OSError("down")), ttl=2.0, clock=_Clock())
+    )
+    light = c.lights[0]
+    light.on = False
+    light.reachable = True
+    status = c.get_lights_status()
+    assert status[0] == {
+        "name": "Lâmpada 1",
+        "on": False,
+        "brightness": 0,
+        "reachable": True,
+        "color": {"r": 50, "g": 50, "b": 50},
+    }
@@ -0,0 +1,96 @@
+"""Shared mtime-driven light positions cache (screen + audio mirrors)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from marvin_hue import positions_cache as pc
+from marvin_hue.audio_mirror import AudioMirror
+from marvin_hue.screen_mirror import ScreenMirror
+
+
+def _write(path: Path, lights: list[dict], mtime_ns: int | None = None) -> None:
+    path.write_text(json.dumps({"lights": lights}), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_cache_reloads_only_when_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "pos.json"
+    _write(path, [{"name": "A", "position": "left", "enabled": True}], 10**18)
+    cache = pc.PositionsCache(path)
+    first = cache.lights()
+    with patch("builtins.open", wraps=open) as mock_open:
+        assert cache.lights() is first
+        assert mock_open.call_count == 0
+    version = cache.version
+
+    _write(path, [{"name": "B", "position": "right", "enabled": True}], 2 * 10**18)
+    assert cache.lights()[0]["name"] == "B"
+    assert cache.version == version + 1
+
+
+def test_invalidate_forces_reload(tmp_path: Path) -> None:
+    path = tmp_path / "pos.json"
+    _write(path, [{"name": "A", "position": "left", "enabled": True}], 10**18)
+    cache = pc.get_positions_cache(path)
+    assert pc.get_positions_cache(str(path)) is cache
+    cache.lights()
+    # Same mtime/size: only explicit invalidation sees the new content
+    _write(path, [{"name": "C", "position": "left", "enabled": True}], 10**18)
+    assert cache.lights()[0]["name"] == "A"
+    pc.invalidate_positions(path)
+    assert cache.lights()[0]["name"] == "C"
+
+
+def test_missing_and_invalid_files(tmp_path: Path) -> None:
+    cache = pc.PositionsCache(tmp_path / "missing.json")
+    assert cache.lights() == []
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json", encoding="utf-8")
+    assert pc.PositionsCache(bad).lights() == []
+
+
+def test_mirrors_share_cache_without_per_frame_io(tmp_path: Path) -> None:
+    path = tmp_path / "pos.json"
+    _write(
+        path,
+        [
+            {"name": "A", "position": "left", "enabled": True},
+            {"name": "B", "position": "none", "enabled": True},
+        ],
+        10**18,
+    )
+    screen = ScreenMirror(MagicMock(), str(path))
+    audio = AudioMirror(MagicMock(), str(path))
+    assert [x["name"] for x in screen.load_light_positions()] == ["A"]
+    assert [x["position"] for x in audio.load_light_positions()] == ["left", "ambient"]
+    with patch("builtins.open", wraps=open) as mock_open:
+        for _ in range(30):
+            screen.load_light_positions()
+            audio.load_light_positions()
+        assert mock_open.call_count == 0
+
+    _write(path, [{"name": "A", "position": "top", "enabled": True}], 2 * 10**18)
+    assert screen.load_light_positions()[0]["position"] == "top"
+    assert audio.load_light_positions()[0]["position"] == "top"
+
+
+def test_post_positions_invalidates_cache(
+    fastapi_test_client, tmp_path: Path, monkeypatch
+) -> None:
+    from marvin_hue.api.routes import positions as route
+
+    path = tmp_path / "pos.json"
+    _write(path, [{"name": "A", "position": "left", "enabled": True}], 10**18)
+    monkeypatch.setattr(route, "POSITIONS_FILE", path)
+    with patch.object(route, "invalidate_positions") as invalidate:
+        response = fastapi_test_client.post(
+            "/positions",
+            json={"lights": [{"name": "A", "position": "right", "enabled": True}]},
+        )
+    assert response.status_code == 200
+    invalidate.assert_called_once_with(path)
@@ -55,9 +55,16 @@ async def test_restore_last(history_svc):
     await history_svc.snapshot(hue, source="apply")
     result = await history_svc.restore_last(hue)
     assert result["restored_count"] == 2
-    hue.turn_on.assert_any_call("Lâmpada 1")
-    hue.turn_off.assert_any_call("Hue Iris")
-    hue.set_light_color.assert_called()
+    # One coalesced state write per light (on + xy + bri)
+    hue.set_light_state.assert_any_call("Hue Iris", on=False)
+    on_call = hue.set_light_state.call_args_list[0]
+    assert on_call.args[0] == "Lâmpada 1"
+    assert on_call.kwargs == {"on": True}
+    color = on_call.args[1]
+    assert (color.red, color.green, color.blue, color.brightness) == (10, 20, 30, 200)
+    assert hue.set_light_state.call_count == 2
+    hue.turn_on.assert_not_called()
+    hue.set_light_color.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -74,3 +81,41 @@ async def test_prune_keep_latest(history_svc):
         await history_svc.snapshot(hue, source="manual", label=f"s{i}")
     recent = await history_svc.list_recent(20)
     assert len(recent) == 3
+
+
+_STATUS_TWO_ON = [
+    {"name": "A", "on": True, "brightness": 100, "color": {"r": 1, "g": 2, "b": 3}},
+    {"name": "B", "on": False, "brightness": 0, "color": {}},
+]
+
+
+@pytest.mark.asyncio
+async def test_restore_counts_only_written_lights(history_svc):
+    from marvin_hue import eye_safety as es
+
+    hue = _hue_with_status(_STATUS_TWO_ON + [{"name": "Gone", "on": False}])
+
+    def _set_state(name, *args, **kwargs):
+        if name == "Gone":
+            raise ValueError("Lâmpada 'Gone' não encontrada")
+
+    hue.set_light_state.side_effect = _set_state
+    await history_svc.snapshot(hue, source="apply")
+    es.set_runtime_enabled({"B": False})
+    try:
+        result = await history_svc.restore_last(hue)
+    finally:
+        es.clear_runtime_policy()
+    assert result["restored_lights"] == ["A"]
+    assert result["restored_count"] == 1
+    # Disabled light is skipped before reaching the controller
+    assert [c.args[0] for c in hue.set_light_state.call_args_list] == ["A", "Gone"]
+
+
+@pytest.mark.asyncio
+async def test_restore_propagates_bridge_errors(history_svc):
+    hue = _hue_with_status(_STATUS_TWO_ON)
+    hue.set_light_state.side_effect = RuntimeError("Erro ao aplicar cor: timeout")
+    await history_svc.snapshot(hue, source="apply")
+    with pytest.raises(RuntimeError, match="timeout"):
+        await history_svc.restore_last(hue)
@@ -0,0 +1,232 @@
+"""Unit tests for the NumPy screen color engine (no capture hardware)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from marvin_hue import screen_engine as se
+from marvin_hue.screen_mirror import ScreenMirror, ScreenRegion
+
+
+def _bgra(width: int, height: int, rgb: tuple[int, int, int]) -> np.ndarray:
+    frame = np.zeros((height, width, 4), dtype=np.uint8)
+    frame[..., 0] = rgb[2]
+    frame[..., 1] = rgb[1]
+    frame[..., 2] = rgb[0]
+    frame[..., 3] = 255
+    return frame
+
+
+def test_bgra_frame_wraps_buffer_without_copy() -> None:
+    raw = bytearray(_bgra(8, 4, (10, 20, 30)).tobytes())
+    frame = se.bgra_frame(raw, 8, 4)
+    assert frame.shape == (4, 8, 4)
+    raw[2] = 99  # first pixel red channel (BGRA)
+    assert frame[0, 0, 2] == 99
+
+
+def test_screenshot_frame_views_raw_bytearray() -> None:
+    raw = bytearray(_bgra(6, 3, (1, 2, 3)).tobytes())
+    shot = SimpleNamespace(raw=raw, width=6, height=3)
+    frame = se.screenshot_frame(shot)
+    assert frame.shape == (3, 6, 4)
+    assert np.shares_memory(frame, np.frombuffer(raw, dtype=np.uint8))
+
+
+def test_region_image_copies_only_region() -> None:
+    frame = _bgra(200, 100, (10, 20, 30))
+    frame[:50, :80, :3] = (90, 60, 30)  # BGR → RGB (30, 60, 90)
+    image = se.region_image(frame, (0, 0, 80, 50))
+    assert image.size == (80, 50)
+    assert image.mode == "RGB"
+    assert image.getpixel((0, 0)) == (30, 60, 90)
+    assert se.region_image(frame, (500, 500, 10, 10)).size == (1, 1)
+
+
+def test_pil_engine_uses_region_images() -> None:
+    frame = _bgra(400, 200, (40, 160, 220))
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    mirror.set_color_engine("pil")
+    plan = mirror.plan_capture(["left"], 400, 200)
+    frames = [se.crop_region(frame, g) for g in plan.grabs]
+    (color,) = mirror._extract_region_colors(frames, plan)
+    mirror.set_color_engine("numpy")
+    (ref,) = mirror._extract_region_colors(frames, plan)
+    assert all(abs(a - b) <= 2 for a, b in zip(color, ref))
+
+
+def test_sample_region_returns_rgb_grid() -> None:
+    frame = _bgra(640, 360, (200, 100, 50))
+    samples = se.sample_region(frame, (0, 0, 320, 180))
+    assert samples.shape == (se.SAMPLE_GRID * se.SAMPLE_GRID, 3)
+    assert np.allclose(samples, [200, 100, 50])
+
+
+def test_sample_region_small_and_out_of_bounds() -> None:
+    frame = _bgra(10, 10, (40, 80, 120))
+    tiny = se.sample_region(frame, (2, 2, 3, 3))
+    assert tiny.shape == (se.SAMPLE_GRID * se.SAMPLE_GRID, 3)
+    assert np.allclose(tiny, [40, 80, 120])
+    empty = se.sample_region(frame, (50, 50, 10, 10))
+    assert not empty.any()
+
+
+def test_dominant_colors_filters_dark_and_bright() -> None:
+    samples = np.zeros((1, 4, 3), dtype=np.float32)
+    samples[0, 0] = (0, 0, 0)  # dark — dropped
+    samples[0, 1] = (255, 255, 255)  # near white — dropped
+    samples[0, 2] = (200, 0, 0)
+    samples[0, 3] = (200, 0, 0)
+    assert se.dominant_colors(samples).tolist() == [[200, 0, 0]]
+
+
+def test_dominant_colors_falls_back_to_plain_mean() -> None:
+    samples = np.zeros((2, 2, 3), dtype=np.float32)
+    samples[1] = (100, 50, 25)
+    out = se.dominant_colors(samples)
+    assert out.tolist() == [[0, 0, 0], [100, 50, 25]]
+
+
+@pytest.mark.parametrize("factor", [1.0, 1.2, 1.4, 2.5])
+def test_boost_saturation_matches_scalar_path(factor: float) -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    mirror.saturation_boost = factor
+    rng = np.random.default_rng(7)
+    colors = rng.integers(0, 256, size=(64, 3))
+    colors[0] = (90, 90, 90)
+    vec = se.boost_saturation(colors, factor)
+    for row, got in zip(colors, vec):
+        assert tuple(got) == mirror._boost_saturation(*(int(v) for v in row))
+
+
+def test_numpy_engine_matches_pil_on_flat_regions() -> None:
+    width, height = 400, 200
+    frame = _bgra(width, height, (30, 120, 220))
+    frame[:, width // 2 :, 0] = 20  # right half: (200, 60, 20)
+    frame[:, width // 2 :, 1] = 60
+    frame[:, width // 2 :, 2] = 200
+    image = Image.frombytes("RGB", (width, height), frame.tobytes(), "raw", "BGRX")
+
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    regions = [
+        mirror.get_screen_region("left", width, height),
+        mirror.get_screen_region("right", width, height),
+    ]
+    batched = mirror.get_dominant_colors(frame, regions)
+    scalar = [mirror.get_dominant_color(image, r) for r in regions]
+    # LANCZOS ringing shifts flat colors by ±1; the box average does not
+    for got, ref in zip(batched, scalar):
+        assert all(abs(a - b) <= 2 for a, b in zip(got, ref))
+
+
+def test_merge_rects_joins_overlapping_only() -> None:
+    merged = se.merge_rects(
+        [(0, 0, 10, 10), (5, 5, 10, 10), (100, 100, 5, 5), (3, 3, 0, 4)]
+    )
+    assert sorted(merged) == [(0, 0, 15, 15), (100, 100, 5, 5)]
+
+
+def test_plan_capture_grabs_edges_only() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    plan = mirror.plan_capture(["left", "right"], 1920, 1080)
+    assert not plan.full_frame
+    assert plan.grabs == [(0, 216, 288, 648), (1632, 216, 288, 648)]
+    assert plan.region_grab == [0, 1]
+    assert plan.local_rects == [(0, 0, 288, 648), (0, 0, 288, 648)]
+
+
+def test_plan_capture_merges_overlapping_positions() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    plan = mirror.plan_capture(["left", "top-left"], 1920, 1080)
+    assert len(plan.grabs) == 1
+    assert plan.region_grab == [0, 0]
+    grab = plan.grabs[0]
+    top_left = mirror.get_screen_region("top-left", 1920, 1080)
+    assert plan.local_rects[1] == (
+        top_left.x - grab[0], top_left.y - grab[1], top_left.width, top_left.height
+    )
+
+
+@pytest.mark.parametrize("position", ["ambient", "center", "unknown"])
+def test_plan_capture_falls_back_to_full_frame(position: str) -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    plan = mirror.plan_capture(["left", position], 1920, 1080)
+    assert plan.full_frame
+    assert plan.grabs == [(0, 0, 1920, 1080)]
+
+
+def test_planned_colors_match_full_frame() -> None:
+    frame = _bgra(400, 200, (30, 120, 220))
+    frame[:, 200:, :3] = (20, 60, 200)
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    positions = ["left", "right", "top-left"]
+    plan = mirror.plan_capture(positions, 400, 200)
+    frames = [np.ascontiguousarray(se.crop_region(frame, g)) for g in plan.grabs]
+    regions = [mirror.get_screen_region(p, 400, 200) for p in positions]
+    assert mirror._extract_region_colors(frames, plan) == (
+        mirror.get_dominant_colors(frame, regions)
+    )
+
+
+def test_grab_frames_offsets_by_monitor() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    plan = mirror.plan_capture(["left"], 400, 200)
+    raw = bytearray(_bgra(*plan.grabs[0][2:], (1, 2, 3)).tobytes())
+    sct = MagicMock()
+    sct.grab.return_value = SimpleNamespace(
+        raw=raw, width=plan.grabs[0][2], height=plan.grabs[0][3]
+    )
+    (frame,) = mirror._grab_frames(sct, {"left": 100, "top": 50}, plan)
+    x, y, w, h = plan.grabs[0]
+    sct.grab.assert_called_once_with(
+        {"left": 100 + x, "top": 50 + y, "width": w, "height": h}
+    )
+    assert frame.shape == (h, w, 4)
+
+
+def test_extract_colors_empty_rects() -> None:
+    frame = _bgra(4, 4, (1, 2, 3))
+    assert se.extract_colors(frame, []) == []
+
+
+def test_set_color_engine_validates() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    assert mirror.color_engine == "numpy"
+    mirror.set_color_engine("pil")
+    assert mirror.get_status()["color_engine"] == "pil"
+    with pytest.raises(ValueError, match="Unknown color engine"):
+        mirror.set_color_engine("cuda")
+
+
+def test_get_dominant_colors_accepts_screen_regions() -> None:
+    frame = _bgra(100, 100, (10, 200, 10))
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    mirror.saturation_boost = 1.0
+    out = mirror.get_dominant_colors(frame, [ScreenRegion(0, 0, 50, 50)])
+    assert out == [(10, 200, 10)]
+
+
+def test_api_settings_color_engine(fastapi_test_client) -> None:
+    from marvin_hue.api import dependencies
+
+    mock = MagicMock(spec=ScreenMirror)
+    mock.get_status.return_value = {"running": False, "colors": {}}
+    original = dependencies._screen_mirror
+    dependencies.set_screen_mirror(mock)
+    try:
+        response = fastapi_test_client.post(
+            "/mirror/settings", json={"mode": "screen", "color_engine": "pil"}
+        )
+        assert response.status_code == 200
+        mock.set_color_engine.assert_called_once_with("pil")
+        bad = fastapi_test_client.post(
+            "/mirror/settings", json={"color_engine": "opencl"}
+        )
+        assert bad.status_code == 422
+    finally:
+        dependencies.set_screen_mirror(original)
@@ -0,0 +1,113 @@
+"""ScreenMirror FramePlan: precompiled regions, light groups and render step."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from marvin_hue import eye_safety as es
+from marvin_hue.screen_mirror import ScreenMirror
+
+LIGHTS = [
+    {"name": "Play 1", "position": "left", "enabled": True},
+    {"name": "Play 2", "position": "right", "enabled": True},
+    {"name": "Bar", "position": "left", "enabled": True},
+]
+
+
+def setup_function() -> None:
+    es.clear_runtime_policy()
+
+
+def teardown_function() -> None:
+    es.clear_runtime_policy()
+
+
+def test_build_frame_plan_groups_lights_by_position() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    plan = mirror.build_frame_plan(LIGHTS, 1920, 1080)
+    assert plan.positions == ("left", "right")
+    assert plan.light_names == ("Play 1", "Bar", "Play 2")
+    assert plan.light_region.tolist() == [0, 0, 1]
+    assert plan.lights_for_region(0) == ["Play 1", "Bar"]
+    assert plan.regions[1] == mirror.get_screen_region("right", 1920, 1080)
+    assert plan.enabled.all()
+    assert len(plan.capture.grabs) == 2
+
+
+def test_frame_plan_reused_until_inputs_change() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    plan = mirror._frame_plan_for(list(LIGHTS), 1920, 1080)
+    assert mirror._frame_plan_for(list(LIGHTS), 1920, 1080) is plan
+
+    resized = mirror._frame_plan_for(list(LIGHTS), 2560, 1440)
+    assert resized is not plan
+    assert resized.screen_size == (2560, 1440)
+
+    moved = [dict(LIGHTS[0], position="top"), *LIGHTS[1:]]
+    assert mirror._frame_plan_for(moved, 2560, 1440).positions[0] == "top"
+
+    es.set_runtime_enabled({"Play 2": False})
+    plan = mirror._frame_plan_for(moved, 2560, 1440)
+    assert plan.light_names == ("Play 1", "Play 2", "Bar")
+    assert plan.enabled.tolist() == [True, False, True]
+
+    mirror.invalidate_frame_plan()
+    assert mirror._frame_plan_for(moved, 2560, 1440) is not plan
+
+
+def test_render_frame_matches_scalar_smoothing() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    mirror.smoothing_factor = 0.5
+    plan = mirror.build_frame_plan(LIGHTS, 400, 200)
+
+    first = mirror._render_frame(plan, [(200, 40, 10), (10, 20, 250)])
+    assert [(c.light_name, c.r, c.g, c.b) for c in first] == [
+        ("Play 1", 200, 40, 10),
+        ("Bar", 200, 40, 10),
+        ("Play 2", 10, 20, 250),
+    ]
+
+    # Left changes a lot, right only a little (below the change threshold)
+    second = mirror._render_frame(plan, [(100, 140, 10), (14, 24, 250)])
+    expected = mirror._interpolate_color((200, 40, 10), (100, 140, 10))
+    assert [c.light_name for c in second] == ["Play 1", "Bar"]
+    assert (second[0].r, second[0].g, second[0].b) == expected
+    assert mirror._smoothed_colors["Play 2"] == (10, 20, 250)
+    assert mirror._target_colors["Play 2"] == (14, 24, 250)
+    assert mirror._current_colors["Bar"] == expected
+
+
+def test_render_frame_skips_disabled_and_batches_all() -> None:
+    es.set_runtime_enabled({"Bar": False})
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    plan = mirror.build_frame_plan(LIGHTS, 400, 200)
+    mirror._render_frame(plan, [(50, 60, 70), (80, 90, 100)])
+
+    out = mirror._render_frame(plan, [(50, 60, 70), (80, 90, 100)], batch_all=True)
+    assert [c.light_name for c in out] == ["Play 1", "Play 2"]
+    assert "Bar" not in mirror._current_colors
+    assert mirror._target_colors["Bar"] == (50, 60, 70)
+
+
+def test_build_frame_plan_keeps_known_smoothed_colors() -> None:
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    mirror._smoothed_colors["Play 2"] = (1, 2, 3)
+    plan = mirror.build_frame_plan(LIGHTS, 400, 200)
+    assert plan.has_smoothed.tolist() == [False, False, True]
+    assert plan.smoothed[2].tolist() == [1, 2, 3]
+
+
+def test_render_frame_reseeds_plan_built_before_older_frames() -> None:
+    """Pipelined: plan compiled on capture while the old one is still rendering."""
+    mirror = ScreenMirror(MagicMock(), "unused.json")
+    mirror.smoothing_factor = 0.5
+    old = mirror.build_frame_plan(LIGHTS, 400, 200)
+    mirror._render_frame(old, [(200, 40, 10), (10, 20, 250)])
+    new = mirror.build_frame_plan(LIGHTS, 800, 400)  # capture thread
+    mirror._render_frame(old, [(100, 140, 10), (10, 20, 250)])  # frame in flight
+    out = mirror._render_frame(new, [(0, 240, 10), (10, 20, 250)])
+    in_flight = mirror._interpolate_color((200, 40, 10), (100, 140, 10))
+    assert (out[0].r, out[0].g, out[0].b) == mirror._interpolate_color(
+        in_flight, (0, 240, 10)
+    )
+    assert new.smoothed[0].tolist() == list(mirror._smoothed_colors["Play 1"])
@@ -5,6 +5,7 @@ Tests the ColorConverter and RGBtoXYAdapter classes for color space conversion,
 including edge cases and division by zero handling.
 """
 
+import numpy as np
 import pytest
 
 from marvin_hue.utils import RGBtoXYAdapter, ColorConverter
@@ -372,3 +373,44 @@ class TestRGBtoXYAdapterDeprecation:
         converter_result = ColorConverter.rgb_to_xy(*test_rgb)
 
         assert adapter_result == converter_result
+
+
+class TestRGBtoXYArray:
+    """Tests for the vectorized (batched) RGB to XY conversion."""
+
+    def test_matches_scalar_path(self):
+        """Every color of a random frame matches ColorConverter.rgb_to_xy."""
+        rgb = np.random.default_rng(7).integers(0, 256, size=(500, 3))
+        batched = ColorConverter.rgb_to_xy_array(rgb)
+        scalar = np.array([ColorConverter.rgb_to_xy(*map(int, c)) for c in rgb])
+
+        assert batched.shape == (500, 2)
+        np.testing.assert_allclose(batched, scalar, rtol=0, atol=1e-12)
+
+    def test_lut_and_formula_agree(self):
+        """Gamma LUT and the direct pow formula give the same result."""
+        rgb = np.arange(256)[:, None].repeat(3, axis=1)
+        np.testing.assert_allclose(
+            ColorConverter.rgb_to_xy_array(rgb, use_lut=True),
+            ColorConverter.rgb_to_xy_array(rgb, use_lut=False),
+            rtol=0,
+            atol=1e-12,
+        )
+
+    def test_black_maps_to_d65_white(self):
+        """Black rows return the same fallback as the scalar path."""
+        xy = ColorConverter.rgb_to_xy_array([[0, 0, 0], [255, 0, 0]])
+
+        assert tuple(xy[0]) == pytest.approx(ColorConverter.rgb_to_xy(0, 0, 0))
+        assert xy[1, 0] > xy[1, 1]
+
+    def test_preserves_leading_shape(self):
+        """(H, W, 3) in, (H, W, 2) out; empty batches are fine."""
+        assert ColorConverter.rgb_to_xy_array(np.zeros((4, 5, 3), np.uint8)).shape == (4, 5, 2)
+        assert ColorConverter.rgb_to_xy_array(np.zeros((0, 3), int)).shape == (0, 2)
+
+    @pytest.mark.parametrize("bad", [[[256, 0, 0]], [[-1, 0, 0]], [[1, 2]], 5])
+    def test_invalid_input_raises(self, bad):
+        """Out-of-range values and wrong shapes raise ValueError."""
+        with pytest.raises(ValueError):
+            ColorConverter.rgb_to_xy_array(bad)